@@ -0,0 +1,208 @@
+# benchmarks/run_benchmarks.py
+#
+# Run from the repository root:
+#     python -m benchmarks.run_benchmarks --platform xing --limit 10
+
+import importlib
+import json
+import os
+import re
+import statistics
+import tempfile
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+import click
+import yaml
+from loguru import logger
+from selenium.webdriver.common.by import By
+from utils.applied_store import AppliedJobsStore
+from utils.history import ApplicationHistory
+from utils.form_filler import AnswerCache, FormFiller, StubBackend
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# Request path -> fixture file, so every listing URL gets its own job ID.
+ROUTES = [
+    (re.compile(r"^/xing/search"), "xing/search.html"),
+    (re.compile(r"^/xing/jobs/[\w.-]+$"), "xing/job.html"),
+    (re.compile(r"^/stepstone/search"), "stepstone/search.html"),
+    (re.compile(r"^/stepstone/stellenangebote--[\w.-]+\.html$"), "stepstone/job.html"),
+    (re.compile(r"^/stepstone/application/\d+$"), "stepstone/application.html"),
+    (re.compile(r"^/linkedin/search"), "linkedin/search.html"),
+    (re.compile(r"^/linkedin/jobs/view/\d+/?$"), "linkedin/job.html"),
+]
+
+PLATFORMS = {
+    "xing": ("platforms.xing", "XingPlatform"),
+    "stepstone": ("platforms.stepstone", "StepStonePlatform"),
+    "linkedin": ("platforms.linkedin", "LinkedInPlatform"),
+}
+
+
+class FixtureHandler(SimpleHTTPRequestHandler):
+    """Serve recorded fixture pages, optionally with artificial latency."""
+
+    latency = 0.0
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        for pattern, fixture in ROUTES:
+            if pattern.match(path):
+                self.path = "/" + fixture
+                break
+        if self.latency:
+            time.sleep(self.latency)
+        super().do_GET()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_fixture_server(latency_ms=0):
+    """Start the fixture server on a free local port and return it."""
+    handler = type("Handler", (FixtureHandler,), {"latency": latency_ms / 1000})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(handler, directory=FIXTURES_DIR))
+    threading.Thread(target=server.serve_forever, name="fixture-server", daemon=True).start()
+    return server
+
+
+def make_bench_platform(platform_cls, server_url):
+    """Subclass a platform so it talks to the fixture server instead of the real site."""
+
+    class BenchPlatform(platform_cls):
+        base_url = f"{server_url}/{platform_cls.platform_name}/"
+        site_domain = "127.0.0.1"
+
+        def construct_search_url(self, query=None):
+            return f"{server_url}/{self.platform_name}/search"
+
+    BenchPlatform.__name__ = f"Bench{platform_cls.__name__}"
+    return BenchPlatform
+
+
+def timed(timings, stage, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    timings[stage] = time.perf_counter() - start
+    return result
+
+
+def apply_once(platform, listing, field_mapping):
+    if platform.platform_name == "xing":
+        platform.apply_to_job_in_new_tab(listing)
+    else:
+        platform.apply_to_job(listing, field_mapping)
+
+
+def bench_platform(name, server_url, config, limit):
+    """Run one platform through every stage and return its timings in seconds."""
+    module_name, class_name = PLATFORMS[name]
+    platform_cls = getattr(importlib.import_module(module_name), class_name)
+    platform = make_bench_platform(platform_cls, server_url)(config)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # A throwaway store so previous runs never cause listings to be skipped.
+        platform.applied_store = AppliedJobsStore(os.path.join(tmp, "applied_jobs.jsonl"))
+        platform.history = ApplicationHistory(os.path.join(tmp, "applications.db"))
+        if name == "linkedin":
+            # No model calls in benchmarks: a stub backend answers the fixture's questions.
+            platform.form_filler = FormFiller(
+                platform.settings.resume, StubBackend(default="3"), AnswerCache(os.path.join(tmp, "answers.json"))
+            )
+        timings = {}
+        latencies = []
+        try:
+            timed(timings, "browser_start_cold", platform.start_browser, True)
+            platform.quit_browser()
+            timed(timings, "browser_start_warm", platform.start_browser, True)
+
+            def load_search():
+                platform.browser.get(platform.construct_search_url())
+                platform.wait_for_element(By.CSS_SELECTOR, platform.listing_spec["container"])
+
+            timed(timings, "search_load", load_search)
+            listings = timed(timings, "listing_extraction", platform.extract_listings)
+            if platform.http_discovery:
+                timed(
+                    timings, "http_discovery",
+                    platform.discovery.listings, platform.construct_search_url(), platform.listing_spec,
+                )
+            if name != "xing":
+                listings = [listing for listing in listings if listing["easy_apply"]]
+            listings = listings[:limit]
+
+            field_mapping = platform.create_field_mapping(platform.settings.resume) if name != "xing" else None
+            for listing in listings:
+                start = time.perf_counter()
+                apply_once(platform, listing, field_mapping)
+                latencies.append(time.perf_counter() - start)
+        finally:
+            platform.quit_browser()
+            platform.history.close()
+
+    timings["applications"] = len(latencies)
+    timings["applied"] = len(platform.applications)
+    if latencies:
+        timings["application_p50"] = statistics.median(latencies)
+        timings["application_max"] = max(latencies)
+        timings["jobs_per_minute"] = len(latencies) / sum(latencies) * 60
+    return timings
+
+
+def print_report(results):
+    stages = [
+        "browser_start_cold", "browser_start_warm", "search_load", "listing_extraction", "http_discovery",
+        "application_p50", "application_max", "applications", "applied", "jobs_per_minute",
+    ]
+    names = list(results)
+    click.echo(f"{'stage':<22}" + "".join(f"{name:>14}" for name in names))
+    for stage in stages:
+        row = f"{stage:<22}"
+        for name in names:
+            value = results[name].get(stage)
+            if value is None:
+                row += f"{'-':>14}"
+            elif isinstance(value, int):
+                row += f"{value:>14d}"
+            elif stage == "jobs_per_minute":
+                row += f"{value:>14.1f}"
+            else:
+                row += f"{value * 1000:>12.0f}ms"
+        click.echo(row)
+
+
+@click.command()
+@click.option("--platform", "platform_names", multiple=True, type=click.Choice(list(PLATFORMS)),
+              help="Platforms to benchmark (default: all).")
+@click.option("--limit", default=10, show_default=True, help="Maximum applications per platform.")
+@click.option("--latency-ms", default=0, show_default=True, help="Artificial latency per fixture response.")
+@click.option("--json-output", type=click.Path(dir_okay=False), help="Also write the results as JSON.")
+def main(platform_names, limit, latency_ms, json_output):
+    """Benchmark the platform pipelines against local, offline fixture sites."""
+    with open("user_data/config.yaml", "r") as file:
+        config = yaml.safe_load(file)
+
+    server = start_fixture_server(latency_ms)
+    server_url = f"http://127.0.0.1:{server.server_address[1]}"
+    logger.info(f"Serving fixtures on {server_url}")
+
+    results = {}
+    try:
+        for name in platform_names or PLATFORMS:
+            try:
+                results[name] = bench_platform(name, server_url, config, limit)
+            except ImportError as e:
+                logger.error(f"Skipping {name}: {e}")
+    finally:
+        server.shutdown()
+
+    print_report(results)
+    if json_output:
+        with open(json_output, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,13 +7,19 @@ import yaml
 from pathlib import Path
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import WebDriverException
 from loguru import logger
+from utils.driver_resolver import resolve_chromedriver
+from utils.readiness import wait_for_dom_quiescence, wait_for_element, wait_for_url_change
+from utils.form_snapshot import fill_form
+from utils.label_index import LabelIndex
+from utils.filters import BlacklistFilter
+
+CHROME_BINARY = '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'  # Path for macOS
 
 
 def init_browser() -> webdriver.Chrome:
@@ -27,9 +33,9 @@ def init_browser() -> webdriver.Chrome:
         options.add_argument("--window-size=1920,1080")  # Set a window size for better compatibility
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option("useAutomationExtension", False)
-        options.binary_location = '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'  # Path for macOS
+        options.binary_location = CHROME_BINARY
 
-        service = ChromeService(ChromeDriverManager().install())
+        service = ChromeService(resolve_chromedriver({"chrome_binary": CHROME_BINARY}))
         return webdriver.Chrome(service=service, options=options)
     except Exception as e:
         raise RuntimeError(f"Failed to initialize browser: {str(e)}")
@@ -77,7 +83,7 @@ def login(browser, retries=3):
                 EC.element_to_be_clickable((By.CSS_SELECTOR, "[data-testid='menu-item-sign-in-menu']"))
             )
             browser.execute_script("arguments[0].click();", login_menu_button)
-            time.sleep(1)  # Small delay to ensure dropdown appears
+            wait_for_dom_quiescence(browser, quiet_ms=200, timeout=1)  # Let the dropdown render
 
             # Attempt to close any overlay that might appear
             close_overlay_if_exists(browser)
@@ -172,6 +178,8 @@ def apply_to_job(browser, listing, field_mapping):
             EC.element_to_be_clickable((By.CSS_SELECTOR, "[data-testid='harmonised-apply-button']"))
         )
 
+        listing_page_url = browser.current_url
+
         # Check if the button text indicates the job was already applied
         button_text = apply_button.text.strip()
         if button_text.lower() == "already applied":
@@ -182,7 +190,7 @@ def apply_to_job(browser, listing, field_mapping):
             apply_button.click()
             logger.info("Clicked the apply button.")
 
-        if check_redirect_to_external(browser):
+        if check_redirect_to_external(browser, listing_page_url):
             return  # Skip to the next job if redirected
 
         try:
@@ -191,7 +199,7 @@ def apply_to_job(browser, listing, field_mapping):
             )
             send_application_button.click()
             logger.info("Clicked the send application button.")
-            time.sleep(2)
+            wait_for_dom_quiescence(browser, timeout=2)
             fill_form_with_yaml_data(browser, field_mapping)
 
         except WebDriverException:
@@ -215,9 +223,10 @@ def apply_to_job(browser, listing, field_mapping):
         browser.switch_to.window(browser.window_handles[0])
 
 
-def check_redirect_to_external(browser) -> bool:
+def check_redirect_to_external(browser, previous_url=None) -> bool:
     """Check if the current tab redirected to an external site, close it if true."""
-    time.sleep(2)
+    if previous_url:
+        wait_for_url_change(browser, previous_url, timeout=2)
     if "stepstone.de" not in browser.current_url:
         logger.warning(f"Redirected to external site: {browser.current_url}. Closing tab and skipping.")
         browser.close()
@@ -252,7 +261,8 @@ def create_field_mapping(resume_data):
     salary_expectations = resume_data.get('salary_expectations', {})
     availability = resume_data.get('availability', {})
 
-    return {
+    # Labels are matched through a normalized synonym index, see utils/label_index.py
+    return LabelIndex({
         "Verfügbar ab": "01.01.2025",
         "Gehaltsvorstellung": salary_expectations.get("salary_range_usd", "50000 - 60000"),
         "Ort": personal_info.get("city", "Aschaffenburg"),
@@ -269,7 +279,7 @@ def create_field_mapping(resume_data):
         "Gehaltsrange pro Jahr (brutto) bis": salary_expectations.get("salary_range_usd", "").split("-")[-1].strip(),
         "linkedin": personal_info.get("linkedin", ""),
         "github": personal_info.get("github", ""),
-    }
+    })
 
 
 from selenium.common.exceptions import WebDriverException
@@ -285,38 +295,12 @@ def fill_form_with_yaml_data(browser, field_mapping):
         "Besitzt du mehr als 3 Jahre Berufserfahrung im Frontend Engineering?": "Ja",
     }
 
-    # Fill dropdown questions based on predefined mapping
-    for question, answer in dropdown_questions.items():
-        try:
-            # Locate dropdown by question text
-            dropdown = WebDriverWait(browser, 10).until(
-                EC.presence_of_element_located(
-                    (By.XPATH, f"//label[contains(text(), '{question}')]/following::select[1]")
-                )
-            )
-            # Select the option within the dropdown based on answer text
-            option = dropdown.find_element(By.XPATH, f".//option[contains(text(), '{answer}')]")
-            option.click()
-            logger.info(f"Selected '{answer}' for question '{question}'")
-        except WebDriverException:
-            logger.warning(f"Could not select answer for '{question}'")
-
-    # Fill required text input fields based on field_mapping
-    required_fields = browser.find_elements(By.XPATH, "//label[contains(@class, 'required')]")
-
-    for label in required_fields:
-        label_text = label.text.strip()
-        input_value = field_mapping.get(label_text, None)
-
-        # Only proceed with text inputs, as dropdowns are handled in dropdown_questions
-        if input_value:
-            try:
-                input_field = label.find_element(By.XPATH, "following::input[1]")
-                input_field.clear()
-                input_field.send_keys(input_value)
-                logger.info(f"Filled required field '{label_text}' with '{input_value}'")
-            except WebDriverException:
-                logger.warning(f"Could not find input for '{label_text}'")
+    # One bounded wait for the form, then read, match and fill it in two script calls
+    wait_for_element(browser, By.CSS_SELECTOR, "form label", timeout=5)
+    try:
+        fill_form(browser, field_mapping, dropdown_questions)
+    except WebDriverException as e:
+        logger.warning(f"Could not fill the application form: {e}")
 
     # Check for form errors before submitting
     if check_for_errors(browser):
@@ -374,13 +358,10 @@ def is_title_blacklisted(job_title: str, config: dict) -> bool:
     Returns:
     - True if the title is blacklisted, False otherwise.
     """
-    title_blacklist = config.get("title_blacklist", [])
-    job_title_lower = job_title.lower()
-
-    for blacklisted_word in title_blacklist:
-        if blacklisted_word.lower() in job_title_lower:
-            logger.info(f"Skipping job '{job_title}' due to blacklisted term '{blacklisted_word}'.")
-            return True
+    blacklisted_word = BlacklistFilter.from_config(config).match_title(job_title)
+    if blacklisted_word:
+        logger.info(f"Skipping job '{job_title}' due to blacklisted term '{blacklisted_word}'.")
+        return True
     return False
 
 @click.command()
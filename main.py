@@ -1,8 +1,17 @@
 import os
 import yaml
-from flask import Flask, render_template, redirect, url_for, request, flash
+from flask import Flask, Response, render_template, redirect, url_for, request, flash, jsonify
 from platforms.stepstone import StepStonePlatform
 from platforms.xing import XingPlatform
+from utils.driver_pool import driver_pool
+from utils.automation import AutomationEngine
+from utils.history import get_history
+from utils.cookie_store import get_cookie_store
+from utils.search_planner import plan_searches
+from utils.settings import SettingsError, get_settings
+from utils.jobs import JobRunner
+from utils import events
+from utils import metrics
 from loguru import logger
 
 app = Flask(__name__)
@@ -16,28 +25,59 @@ def load_config():
 
 config = load_config()
 logger.add(config["logging"]["log_file"], rotation="1 MB")
+driver_pool.configure(**config.get("driver_pool", {}))
+
+PLATFORM_CLASSES = {
+    'xing': XingPlatform,
+    'stepstone': StepStonePlatform,
+}
+# Old pickled cookie files are converted on first read; the store needs each platform's login cookies for that
+for platform_name, platform_class in PLATFORM_CLASSES.items():
+    get_cookie_store().set_session_cookies(platform_name, platform_class.session_settings(config)[0])
 
 # Global variables
-applications = []
-automation_running = False  # Track if automation is running
+APPLICATIONS_PER_PAGE = 25
+automation_settings = config.get("automation", {})
+automation_engine = AutomationEngine(
+    config,
+    PLATFORM_CLASSES,
+    max_workers=automation_settings.get("max_parallel_platforms"),
+    cycle_interval=automation_settings.get("cycle_interval"),
+)
+# Logins and automation starts run here so request handlers return immediately
+job_runner = JobRunner(max_workers=automation_settings.get("background_jobs", 4))
+
+def wants_json():
+    """Whether the client asked for a JSON response instead of a redirect."""
+    return request.accept_mimetypes.best == "application/json"
 
 @app.route("/")
 def home():
     """Home page: Show login status, preferences, and automation options."""
     platforms = ['xing', 'stepstone']
-    logged_in = {}
-    for platform in platforms:
-        cookies_file = f"cookies/{platform}.pkl"
-        logged_in[platform] = os.path.exists(cookies_file)
+    # Expiry check on the saved cookies only: no browser, no network request
+    cookie_store = get_cookie_store()
+    logged_in = {platform: cookie_store.status(platform) for platform in platforms}
+
+    # Only the requested page of the run history is loaded from the database
+    page = max(request.args.get("page", 1, type=int), 1)
+    platform_filter = request.args.get("platform") or None
+    applications, total = get_history().page(page, APPLICATIONS_PER_PAGE, platform=platform_filter)
+    page_count = max((total + APPLICATIONS_PER_PAGE - 1) // APPLICATIONS_PER_PAGE, 1)
 
     preferences = config.get("job_preferences", {})
     return render_template(
         "index.html",
         applications=applications,
+        total_applications=total,
+        page=page,
+        page_count=page_count,
+        platform_filter=platform_filter,
         logged_in=logged_in,
         preferences=preferences,
         platforms=platforms,
-        automation_running=automation_running
+        automation_running=automation_engine.is_running(),
+        jobs=job_runner.jobs(limit=10)
     )
 
 @app.route("/preferences", methods=["GET", "POST"])
@@ -61,9 +101,14 @@ def preferences():
         flash("Preferences saved successfully!", "success")
         return redirect(url_for("home"))
 
-    # Render preferences form
+    # Render preferences form, with the searches these preferences and data_folder/config.yaml add up to
     preferences = config.get("job_preferences", {})
-    return render_template("preferences.html", preferences=preferences)
+    try:
+        planned_searches = plan_searches(get_settings(), preferences)
+    except (OSError, yaml.YAMLError, SettingsError) as e:
+        logger.warning(f"Could not plan the searches: {e}")
+        planned_searches = []
+    return render_template("preferences.html", preferences=preferences, planned_searches=planned_searches)
 
 @app.route("/login_platform")
 def login_platform():
@@ -71,68 +116,105 @@ def login_platform():
     platforms = ['xing', 'stepstone']
     return render_template("login_platform.html", platforms=platforms)
 
-@app.route("/login/<platform>")
-def login(platform):
-    """Login route for the specified platform."""
-    if platform == 'xing':
-        platform_instance = XingPlatform(config)
-    elif platform == 'stepstone':
-        platform_instance = StepStonePlatform(config)
-    else:
-        return "Platform not supported.", 400
-
+def run_login(platform):
+    """Let the user log in to ``platform`` in a visible browser (runs as a background job)."""
+    platform_instance = PLATFORM_CLASSES[platform](config)
     try:
         # Start the browser before performing any actions
         platform_instance.start_browser(headless=False)
-        success = platform_instance.login()
-        if success:
-            flash(f"Logged in successfully to {platform.capitalize()}!", "success")
-            return redirect(url_for("home"))
-        else:
-            flash(f"Login failed for {platform.capitalize()}. Please try again.", "error")
-            return redirect(url_for("login_platform"))
-    except Exception as e:
-        logger.error(f"Error during login: {e}")
-        flash("An error occurred during login. Please try again.", "error")
-        return redirect(url_for("login_platform"))
+        if not platform_instance.login():
+            raise RuntimeError(f"Login failed for {platform.capitalize()}. Please try again.")
+        return {"platform": platform}
     finally:
         platform_instance.quit_browser()  # Ensure the browser is closed
 
-@app.route("/start_automation")
-def start_automation():
-    """Start the automation process."""
-    global automation_running
+@app.route("/login/<platform>")
+def login(platform):
+    """Start the login for the specified platform in the background."""
+    if platform not in PLATFORM_CLASSES:
+        return "Platform not supported.", 400
+
+    job = job_runner.submit("login", run_login, platform, target=platform)
+    if wants_json():
+        return jsonify(job.to_dict()), 202
+    flash(f"Log in to {platform.capitalize()} in the browser window that opens.", "success")
+    return redirect(url_for("home"))
 
-    # Check if the user is logged in to any platform
+def run_start_automation():
+    """Check the saved sessions and start the automation for the logged-in platforms (background job)."""
+    # Only run platforms the user is logged in to
     platforms = ['xing', 'stepstone']
-    logged_in = any(os.path.exists(f"cookies/{platform}.pkl") for platform in platforms)
+    logged_in = [
+        platform for platform in platforms if PLATFORM_CLASSES[platform](config).session_status(probe=True)
+    ]
 
     if not logged_in:
-        flash("Please log in to a platform to start automation.", "warning")
-        return redirect(url_for("home"))
+        raise RuntimeError("Please log in to a platform to start automation.")
+    if not automation_engine.start(logged_in):
+        raise RuntimeError("Automation is already running!")
+    return {"platforms": logged_in}
 
-    if not automation_running:
-        automation_running = True
-        flash("Automation started!", "success")
-    else:
-        flash("Automation is already running!", "warning")
+@app.route("/start_automation")
+def start_automation():
+    """Start the automation process in the background."""
+    job = job_runner.submit("start_automation", run_start_automation)
+    if wants_json():
+        return jsonify(job.to_dict()), 202
+    flash("Starting automation...", "success")
     return redirect(url_for("home"))
 
+@app.route("/jobs")
+def list_jobs():
+    """Recent background jobs as JSON, newest first."""
+    return jsonify([job.to_dict() for job in job_runner.jobs()])
+
+@app.route("/jobs/<job_id>")
+def job_status(job_id):
+    """State of one background job as JSON."""
+    job = job_runner.get(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown job."}), 404
+    return jsonify(job.to_dict())
+
 @app.route("/stop_automation")
 def stop_automation():
     """Stop the automation process."""
-    global automation_running
-    if automation_running:
-        automation_running = False
-        flash("Automation stopped!", "success")
+    if automation_engine.stop():
+        flash("Automation stopping after the current application.", "success")
     else:
         flash("No automation process is running!", "warning")
     return redirect(url_for("home"))
 
+@app.route("/events")
+def event_stream():
+    """Server-sent events for each application as it happens: queued, skipped, applied, failed and timing."""
+    # A reconnecting EventSource resumes after the last event it received
+    subscription = events.bus.subscribe(request.headers.get("Last-Event-ID", type=int))
+
+    def stream():
+        try:
+            yield "retry: 3000\n\n"
+            while True:
+                event = subscription.get(timeout=15)
+                # Comments keep the connection open and notice clients that went away
+                yield events.format_sse(event) if event is not None else ": keep-alive\n\n"
+        finally:
+            events.bus.unsubscribe(subscription)
+
+    return Response(stream(), mimetype="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+@app.route("/metrics")
+def metrics_endpoint():
+    """Expose pipeline timings and outcome counters in Prometheus text format."""
+    pool = driver_pool.stats()
+    metrics.DRIVER_POOL_BROWSERS.set(pool["in_use"], state="in_use")
+    metrics.DRIVER_POOL_BROWSERS.set(pool["idle"], state="idle")
+    return Response(metrics.registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
 if __name__ == "__main__":
     # Ensure required directories exist
     os.makedirs("cookies", exist_ok=True)
     os.makedirs("user_data", exist_ok=True)
 
     # Run the app
-    app.run(debug=True, host="0.0.0.0", port=5001)
\ No newline at end of file
+    app.run(debug=True, host="0.0.0.0", port=5001, threaded=True)
\ No newline at end of file
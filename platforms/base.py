@@ -1,59 +1,722 @@
 # platforms/base.py
 
-import os
-import pickle
+import itertools
+import threading
+import time
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from loguru import logger
+from requests import RequestException
 from selenium import webdriver
 from abc import ABC, abstractmethod
 from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from utils.driver_pool import driver_pool
+from utils.driver_resolver import resolve_chromedriver
+from utils import readiness
+from utils.listing_extractor import extract_listings, job_id_from_url
+from utils.http_discovery import get_http_discovery
+from utils.listing_parser import validate_spec
+from utils.cookie_store import get_cookie_store, to_cdp_cookies
+from utils.applied_store import APPLIED, get_applied_store
+from utils.history import get_history
+from utils.watermarks import get_watermarks
+from utils.streaming import ListingStream, Prefetcher
+from utils.search_planner import plan_searches
+from utils.settings import get_settings
+from utils import metrics
+from utils import lean_mode
+from utils import events
+
+# Event published for each outcome counted by count_outcome(); anything else is "skipped".
+OUTCOME_EVENTS = {
+    "applied": events.APPLIED,
+    "error": events.FAILED,
+    "incomplete": events.FAILED,
+}
+
+
+class SearchCompleted:
+    """Marker that follows the last listing of one search in a listing stream.
+
+    It travels through the same queues as the listings, so it only reaches the
+    consumer once every listing of the search has been handed out.
+    """
+
+    __slots__ = ("search_url", "head_ids")
+
+    def __init__(self, search_url, head_ids):
+        self.search_url = search_url
+        self.head_ids = head_ids
+
 
 class JobPlatform(ABC):
     platform_name = "undefined"  # Default value
+    site_domain = None  # Pages outside this domain count as external redirects
+    max_drivers = None  # Optional cap on pooled Chrome processes for this platform
+    listing_spec = None  # Selectors used by extract_listings(), see utils/listing_extractor.py
+    infinite_scroll = False  # Result pages load more listings when scrolled to the bottom
+    http_discovery = False  # Result pages are server-rendered and can be crawled without a browser
+    session_cookies = ()  # Names of the cookies that carry the login; they decide when a saved session expires
+    session_probe_url = None  # A page that redirects to the login when the session is no longer valid
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.http_discovery:
+            # Result pages are parsed by utils/listing_parser.py, which supports a subset of CSS.
+            try:
+                validate_spec(cls.listing_spec)
+            except ValueError as e:
+                raise ValueError(f"{cls.__name__}.listing_spec cannot be used for HTTP discovery: {e}") from None
 
     def __init__(self, config, headless=True):
         self.config = config
-        self.cookies_file = f"cookies/{self.platform_name}.pkl"
+        self.headless = headless
+        self.cookie_store = get_cookie_store()
+        self.session_cookies, self.session_probe_url = self.session_settings(config)
+        self.cookie_store.set_session_cookies(self.platform_name, self.session_cookies)
         self.applications = []
-        self.browser = self.start_browser(headless)
+        self.applied_store = get_applied_store()
+        self.history = get_history()
+        self.watermarks = get_watermarks()
+        self._browser = None
+        self._browser_headless = headless
+        self.stop_event = threading.Event()  # Replaced by the automation engine's shared event
+
+    @property
+    def browser(self):
+        """The WebDriver checked out for this instance, acquired from the pool on first use."""
+        if self._browser is None:
+            self.start_browser(self.headless)
+        return self._browser
+
+    @browser.setter
+    def browser(self, driver):
+        self._browser = driver
 
     def start_browser(self, headless=True):
-        """Initialize the Chrome WebDriver with options."""
+        """Check out a warm Chrome session from the process-wide driver pool."""
+        if self._browser is not None:
+            if self._browser_headless == headless:
+                return self._browser
+            self.quit_browser()
+
+        self._browser = driver_pool.acquire(
+            (self.platform_name, headless),
+            lambda: self.create_driver(headless),
+            group=self.platform_name,
+            limit=self.max_drivers,
+        )
+        self._browser_headless = headless
+        return self._browser
+
+    def quit_browser(self):
+        """Return the browser to the pool. Visible (login) windows are closed instead."""
+        if self._browser is None:
+            return
+        driver_pool.release(self._browser, discard=not self._browser_headless)
+        self._browser = None
+
+    def create_driver(self, headless=True):
+        """Launch a new Chrome WebDriver with this platform's options."""
+        options = self.chrome_options(headless)
+        service = ChromeService(resolve_chromedriver(self.browser_config))
+        driver = metrics.instrument_driver(webdriver.Chrome(service=service, options=options))
+        driver.set_page_load_timeout(self.navigation_budget())
+        if headless and lean_mode.is_enabled(self.browser_config):
+            lean_mode.apply_network_rules(driver, self.browser_config)
+        return driver
+
+    @property
+    def browser_config(self) -> dict:
+        """The ``browser`` section of the config (driver path, lean mode, ...)."""
+        return self.config.get("browser") or {}
+
+    def browser_setting(self, key, default=None):
+        """Look up a browser setting, preferring ``browser.platform_overrides.<platform>``."""
+        overrides = (self.browser_config.get("platform_overrides") or {}).get(self.platform_name) or {}
+        if key in overrides:
+            return overrides[key]
+        return self.browser_config.get(key, default)
+
+    def navigation_budget(self) -> float:
+        """Seconds a single navigation may take before it is cut short."""
+        return float(self.browser_setting("navigation_budget", 30))
+
+    def chrome_options(self, headless=True):
+        """Build the Chrome options used for new browser sessions."""
         options = webdriver.ChromeOptions()
         if headless:
-            options.headless = True
+            options.add_argument("--headless=new")
         options.add_argument("--window-size=1920,1080")
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option("useAutomationExtension", False)
+        # "eager" returns at DOMContentLoaded, "none" right after the response starts.
+        options.page_load_strategy = self.browser_setting("page_load_strategy", "normal")
+        if headless and lean_mode.is_enabled(self.browser_config):
+            lean_mode.add_lean_options(options, self.browser_config)
+        return options
+
+    def navigate(self, url, ready_selector=None, budget=None):
+        """Load ``url`` and return as soon as ``ready_selector`` is present, within a time budget.
+
+        With the ``eager``/``none`` page-load strategies ``get()`` returns before slow
+        third-party scripts finish; the selector wait then covers what we actually
+        need. If the budget runs out the page load is stopped and work continues.
+        Returns a ``WaitResult`` with the total navigation time.
+        """
+        budget = budget or self.navigation_budget()
+        start = time.monotonic()
+        with metrics.span(self.platform_name, "navigation"):
+            try:
+                self.browser.get(url)
+            except TimeoutException:
+                logger.warning(f"Navigation to {url} exceeded {budget:.0f}s. Stopping the page load.")
+                self.browser.execute_script("window.stop();")
+
+            if not ready_selector:
+                return readiness.WaitResult(True, time.monotonic() - start)
+
+            remaining = max(budget - (time.monotonic() - start), 0.5)
+            result = readiness.wait_for_element(self.browser, By.CSS_SELECTOR, ready_selector, timeout=remaining)
+            if not result:
+                logger.warning(f"'{ready_selector}' not present on {url} within {budget:.0f}s.")
+                self.browser.execute_script("window.stop();")
+            return readiness.WaitResult(result.ok, time.monotonic() - start, result.value)
+
+    def open_in_new_tab(self, url, ready_selector=None):
+        """Open ``url`` in a new tab and switch to it, applying lean-mode rules before it loads."""
+        self.browser.switch_to.new_window("tab")
+        if self._browser_headless and lean_mode.is_enabled(self.browser_config):
+            lean_mode.apply_network_rules(self.browser, self.browser_config)
+        return self.navigate(url, ready_selector)
+
+    @classmethod
+    def session_settings(cls, config):
+        """The login cookie names and probe URL, unless config.yaml overrides them under ``sessions``.
+
+        Sites rename their login cookie or pages now and then; the override avoids a code change.
+        """
+        session = (config.get("sessions") or {}).get(cls.platform_name) or {}
+        return tuple(session.get("cookies", cls.session_cookies)), session.get("probe_url", cls.session_probe_url)
+
+    def fork(self):
+        """Create a sibling instance that shares config, results and cancellation but has its own browser."""
+        worker = type(self)(self.config, headless=self.headless)
+        worker.stop_event = self.stop_event
+        worker.applications = self.applications
+        worker.applied_store = self.applied_store
+        worker.history = self.history
+        worker.watermarks = self.watermarks
+        worker.cookie_store = self.cookie_store
+        return worker
+
+    def concurrency_limit(self) -> int:
+        """Number of listings processed in parallel, from the ``concurrency`` config section."""
+        limit = int(self.config.get("concurrency", {}).get(self.platform_name, 1))
+        if self.max_drivers is not None:
+            limit = min(limit, self.max_drivers)
+        return max(limit, 1)
+
+    def prepare_worker(self) -> bool:
+        """Prepare a forked worker's browser before it processes items. Override per platform."""
+        return True
+
+    def process_concurrently(self, items, handler, concurrency):
+        """Run ``handler(worker, item)`` over ``items`` with up to ``concurrency`` pooled browsers.
+
+        Each worker is a fork of this instance holding its own pooled driver, so the
+        existing single-browser code paths run unchanged inside each worker. ``items``
+        may be a lazy iterator; workers pull the next item only when they are free.
+        """
+        items = iter(items)
+        first = next(items, None)
+        if first is None:
+            return
+        items = itertools.chain([first], items)
+        items_lock = threading.Lock()
+
+        def next_item():
+            with items_lock:
+                return next(items, None)
+
+        def run_worker():
+            worker = self.fork()
+            try:
+                if not worker.prepare_worker():
+                    return
+                while not worker.should_stop():
+                    item = next_item()
+                    if item is None:
+                        return
+                    try:
+                        handler(worker, item)
+                    except Exception as e:
+                        logger.error(f"Worker failed while processing {item}: {e}")
+            except Exception as e:
+                logger.error(f"{self.platform_name} worker could not start: {e}")
+            finally:
+                worker.quit_browser()
+
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=f"{self.platform_name}-worker") as executor:
+            for future in [executor.submit(run_worker) for _ in range(concurrency)]:
+                future.result()
+
+    def wait_until(self, condition, timeout=10, description="condition"):
+        """Poll ``condition`` with adaptive back-off. Returns a ``WaitResult`` with the elapsed time."""
+        return readiness.wait_until(condition, timeout=timeout, description=description)
+
+    def wait_for_dom_quiescence(self, quiet_ms=300, timeout=5):
+        """Wait until the page's DOM has stopped changing."""
+        return readiness.wait_for_dom_quiescence(self.browser, quiet_ms=quiet_ms, timeout=timeout)
+
+    def wait_for_network_idle(self, idle_ms=500, timeout=10):
+        """Wait until the page has no fetch/XHR traffic in flight."""
+        return readiness.wait_for_network_idle(self.browser, idle_ms=idle_ms, timeout=timeout)
+
+    def track_network(self, idle_ms=500, timeout=10):
+        """Context manager: track fetch/XHR from before the block and wait for it to go idle after."""
+        return readiness.track_network(self.browser, idle_ms=idle_ms, timeout=timeout)
+
+    def wait_for_url_change(self, previous_url, timeout=10):
+        """Wait until the browser has navigated away from ``previous_url``."""
+        return readiness.wait_for_url_change(self.browser, previous_url, timeout=timeout)
+
+    def wait_for_element(self, by, selector, timeout=10):
+        """Wait for an element to be present; the element is in ``result.value``."""
+        return readiness.wait_for_element(self.browser, by, selector, timeout=timeout)
+
+    @metrics.timed_stage("listing_extraction")
+    def extract_listings(self) -> list:
+        """Read all listings on the current results page as dicts in one script call."""
+        return extract_listings(self.browser, self.listing_spec)
+
+    @property
+    def crawl_config(self) -> dict:
+        return self.config.get("crawl", {})
+
+    def search_page_url(self, search_url, page):
+        """URL of result page ``page`` (1-based) for ``search_url``, or None if the platform cannot paginate."""
+        return None
+
+    def paginates(self, search_url) -> bool:
+        """Whether a crawl of ``search_url`` may go past the first results page."""
+        return int(self.crawl_config.get("max_pages", 1)) > 1 and self.search_page_url(search_url, 2) is not None
+
+    def prefetch_enabled(self) -> bool:
+        """Whether result pages are crawled ahead of the applications, by a separate browser or over HTTP."""
+        if not self.crawl_config.get("prefetch", False):
+            return False
+        return self.uses_http_discovery() or self.max_drivers != 1
+
+    def uses_http_discovery(self) -> bool:
+        """Whether search results are fetched over HTTP (``crawl.discovery: http``) instead of in Chrome."""
+        return self.http_discovery and self.crawl_config.get("discovery", "http") == "http"
 
-        service = ChromeService(ChromeDriverManager().install())
-        return webdriver.Chrome(service=service, options=options)
+    @property
+    def discovery(self):
+        """The platform's shared keep-alive HTTP session for result pages, see utils/http_discovery.py."""
+        return get_http_discovery(
+            self.platform_name,
+            self.cookie_store,
+            pool_size=max(int(self.crawl_config.get("parallel_searches", 1)) * 2, 2),
+            timeout=self.navigation_budget(),
+        )
+
+    def http_result_batches(self, search_url):
+        """Yield listings fetched over HTTP one batch per result page, without touching the browser.
+
+        Stops at a page with nothing new since the previous one: past the last page
+        some sites serve the last page (or the first) again.
+        """
+        max_pages = int(self.crawl_config.get("max_pages", 1))
+        previous = set()
+        for page in range(1, max_pages + 1):
+            page_url = search_url if page == 1 else self.search_page_url(search_url, page)
+            if page_url is None or self.should_stop():
+                return
+            try:
+                with metrics.span(self.platform_name, "http_discovery"):
+                    batch = self.discovery.listings(page_url, self.listing_spec)
+            except RequestException as e:
+                logger.error(f"Could not fetch {self.platform_name} results page {page}: {e}")
+                return
+            if not batch:
+                if page == 1:
+                    logger.info(f"No {self.platform_name} results for {search_url}.")
+                return
+            batch = [listing for listing in batch if listing["id"] not in previous]
+            if not batch:
+                logger.debug(f"{self.platform_name} results page {page} repeats page {page - 1}; stopping.")
+                return
+            previous = {listing["id"] for listing in batch}
+            yield batch
+
+    def load_more_results(self, timeout=2) -> bool:
+        """Scroll to the bottom of the results and wait for more to load. Returns False once none appear."""
+        try:
+            last_height = self.browser.execute_script("return document.body.scrollHeight")
+            self.browser.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            return bool(self.wait_until(
+                lambda: self.browser.execute_script("return document.body.scrollHeight") > last_height,
+                timeout=timeout,
+                description="more results",
+            ))
+        except WebDriverException as e:
+            logger.error(f"Error while scrolling to load more results: {e}")
+            return False
+
+    def result_batches(self, search_url, first_page=1):
+        """Yield listings from this browser one batch per result page or scroll step.
+
+        Page ``first_page`` of ``search_url`` must already be loaded. Only the IDs
+        of the current and previous page are kept, so long searches run at constant
+        memory; a page with nothing new since the previous one ends the crawl.
+        """
+        max_pages = int(self.crawl_config.get("max_pages", 1))
+        previous = set()
+        for page in range(first_page, max_pages + 1):
+            if page > first_page:
+                page_url = self.search_page_url(search_url, page)
+                if page_url is None or self.should_stop():
+                    return
+                try:
+                    # Applications run in their own tabs; results always live in the first one.
+                    self.browser.switch_to.window(self.browser.window_handles[0])
+                    if not self.navigate(page_url, self.listing_spec["container"]):
+                        return
+                except WebDriverException as e:
+                    logger.error(f"Could not load {self.platform_name} results page {page}: {e}")
+                    return
+
+            seen = set()
+            while not self.should_stop():
+                try:
+                    batch = [
+                        listing for listing in self.extract_listings()
+                        if listing["id"] not in seen and listing["id"] not in previous
+                    ]
+                except WebDriverException as e:
+                    logger.error(f"Could not read {self.platform_name} results on page {page}: {e}")
+                    return
+                seen.update(listing["id"] for listing in batch)
+                if batch:
+                    yield batch
+                if not self.infinite_scroll:
+                    break
+                self.browser.switch_to.window(self.browser.window_handles[0])
+                if not self.load_more_results():
+                    break
+            if not seen:
+                return
+            previous = seen
+
+    def _crawler_batches(self, search_url, first_page):
+        """Crawl from ``first_page`` on in a forked browser (run inside a Prefetcher thread)."""
+        page_url = self.search_page_url(search_url, first_page)
+        if page_url is None:
+            return
+        crawler = self.fork()
+        try:
+            if not crawler.prepare_worker() or not crawler.navigate(page_url, self.listing_spec["container"]):
+                return
+            yield from crawler.result_batches(search_url, first_page)
+        finally:
+            crawler.quit_browser()
+
+    def _batches(self, search_url, prefetch):
+        """Return an iterator over listing batches, prefetching later pages if enabled."""
+        if self.uses_http_discovery():
+            batches = self.http_result_batches(search_url)
+            if not prefetch:
+                return batches
+            return Prefetcher(
+                batches, depth=int(self.crawl_config.get("prefetch_depth", 1)), name=f"{self.platform_name}-http"
+            )
+        if not prefetch or not self.paginates(search_url):
+            # Without a second page there is nothing to load ahead; don't check out a browser for it.
+            return self.result_batches(search_url)
+
+        # Read page 1 now, so the caller may hand this browser to a worker right away;
+        # the following pages load in another browser while page 1 is being applied to.
+        first_batch = self.extract_listings()
+        prefetcher = Prefetcher(
+            self._crawler_batches(search_url, first_page=2),
+            depth=int(self.crawl_config.get("prefetch_depth", 1)),
+            name=f"{self.platform_name}-crawler",
+        )
+        return self._with_first_batch(first_batch, prefetcher)
+
+    @staticmethod
+    def _with_first_batch(first_batch, prefetcher):
+        try:
+            if first_batch:
+                yield first_batch
+            yield from prefetcher
+        finally:
+            prefetcher.close()
+
+    def _new_listings(self, batches, watermark):
+        stop_after = int(self.crawl_config.get("stop_after_known", 3))
+        known_in_a_row = 0
+        for batch in batches:
+            for listing in batch:
+                if listing["id"] not in watermark:
+                    known_in_a_row = 0
+                    yield listing
+                    continue
+                known_in_a_row += 1
+                if known_in_a_row >= stop_after:
+                    logger.info(f"Reached the {self.platform_name} watermark; older listings are not crawled.")
+                    return
+
+    def crawl_listings(self, search_url, prefetch=None) -> ListingStream:
+        """Lazily yield listings newest first across result pages and scroll batches.
+
+        Unless results are fetched over HTTP, the current page must already show the
+        first page of ``search_url``. Listings
+        in the previous run's watermark are skipped; once ``stop_after_known`` of them
+        appear in a row the rest of the (older) results is not crawled. With
+        ``crawl.prefetch`` the next page is loaded in a forked browser (or fetched
+        in a background thread) while the current batch is being applied to.
+        """
+        if prefetch is None:
+            prefetch = self.prefetch_enabled()
+        incremental = self.crawl_config.get("incremental", True)
+        watermark = self.watermarks.get(self.platform_name, search_url) if incremental else frozenset()
+        batches = self._batches(search_url, prefetch)
+        return ListingStream(
+            self._new_listings(batches, watermark), keep=self.watermarks.size, on_close=batches.close
+        )
+
+    def search_urls(self) -> list:
+        """One search URL per query in the configured positions × locations matrix."""
+        queries = plan_searches(self.settings, self.config.get("job_preferences", {}))
+        return [self.construct_search_url(query) for query in queries]
+
+    def search_parallelism(self, search_urls) -> int:
+        """Number of searches crawled at once, from ``crawl.parallel_searches``.
+
+        Searches crawled in browsers are capped by max_drivers; over HTTP they are not.
+        """
+        limit = int(self.crawl_config.get("parallel_searches", 1))
+        if self.max_drivers is not None and not self.uses_http_discovery():
+            limit = min(limit, self.max_drivers)
+        return max(min(limit, len(search_urls)), 1)
+
+    def _crawl_search(self, search_url, prefetch=None):
+        """Yield one search's new listings, then a ``SearchCompleted`` with its newest IDs.
+
+        In the browser the search is always loaded here: whatever ran before (a login
+        check, consent banners...) may have left the results page.
+        """
+        if not self.uses_http_discovery():
+            try:
+                self.browser.switch_to.window(self.browser.window_handles[0])
+                with metrics.span(self.platform_name, "search_load"):
+                    loaded = self.navigate(search_url, self.listing_spec["container"])
+                if not loaded:
+                    logger.info(f"No {self.platform_name} results for {search_url}.")
+                    return
+            except WebDriverException as e:
+                logger.error(f"Could not load {self.platform_name} search {search_url}: {e}")
+                return
+        with self.crawl_listings(search_url, prefetch) as crawled:
+            yield from crawled
+        yield SearchCompleted(search_url, crawled.head_ids)
+
+    def _sequential_searches(self, search_urls):
+        for search_url in search_urls:
+            if self.should_stop():
+                return
+            yield from self._crawl_search(search_url)
+
+    def _search_crawler(self, next_search_url):
+        """Crawl searches in a forked browser, or over HTTP, until none are left (run inside a Prefetcher thread)."""
+        # Over HTTP there is no browser to set up; crawl with the shared session instead.
+        crawler = self if self.uses_http_discovery() else self.fork()
+        try:
+            if crawler is not self and not crawler.prepare_worker():
+                return
+            while not crawler.should_stop():
+                search_url = next_search_url()
+                if search_url is None:
+                    return
+                yield from crawler._crawl_search(search_url, prefetch=False)
+        finally:
+            if crawler is not self:
+                crawler.quit_browser()
+
+    def _unique_listings(self, listings, heads):
+        seen = set()
+        for listing in listings:
+            if isinstance(listing, SearchCompleted):
+                # The consumer has pulled every listing of this search; only now may its watermark move.
+                heads[listing.search_url] = listing.head_ids
+                continue
+            if listing["id"] in seen:
+                self.count_outcome("duplicate", job_id=listing["id"])
+                continue
+            seen.add(listing["id"])
+            yield listing
+
+    def search_listings(self, search_urls, heads) -> ListingStream:
+        """Lazily yield the new listings of all ``search_urls``, each job only once.
+
+        With ``crawl.parallel_searches`` above 1 the searches run concurrently in
+        forked browsers, or in threads when results are fetched over HTTP. Otherwise
+        they run one after another in this browser. ``heads`` collects the newest IDs of each search whose
+        listings the consumer has all pulled, for ``advance_watermarks()``; a search
+        crawled ahead but never consumed keeps its old watermark.
+        """
+        workers = self.search_parallelism(search_urls)
+        if workers > 1:
+            pending = iter(search_urls)
+            pending_lock = threading.Lock()
+
+            def next_search_url():
+                with pending_lock:
+                    return next(pending, None)
+
+            via = "HTTP workers" if self.uses_http_discovery() else "browsers"
+            logger.info(f"Crawling {len(search_urls)} {self.platform_name} searches with {workers} {via}.")
+            source = Prefetcher(
+                *[self._search_crawler(next_search_url) for _ in range(workers)],
+                depth=int(self.crawl_config.get("search_buffer", 50)),
+                name=f"{self.platform_name}-search",
+            )
+        else:
+            source = self._sequential_searches(search_urls)
+        return ListingStream(self._unique_listings(source, heads), keep=0, on_close=source.close)
+
+    def advance_watermarks(self, heads):
+        """Remember each consumed search's newest listing IDs so the next run stops there, unless cancelled."""
+        if self.should_stop() or not self.crawl_config.get("incremental", True):
+            return
+        for search_url, job_ids in heads.items():
+            self.watermarks.update(self.platform_name, search_url, job_ids)
+
+    def filter_known_listings(self, listings):
+        """Lazily drop listings that were applied to or ruled out on an earlier run, before opening them."""
+        for listing in listings:
+            if self.applied_store.is_known(self.platform_name, listing["id"]):
+                self.count_outcome("known", job_id=listing["id"])
+                logger.debug(f"Skipping already known {self.platform_name} job {listing['id']}.")
+                continue
+            self.publish_event(
+                events.QUEUED,
+                job_id=listing["id"],
+                job_url=listing["url"],
+                title=listing.get("title"),
+                company=listing.get("company"),
+            )
+            yield listing
+
+    @property
+    def settings(self):
+        """The shared, immutable snapshot of data_folder config, resume and secrets."""
+        return get_settings()
+
+    def is_blacklisted(self, listing) -> bool:
+        """Check a listing's title and company against the settings snapshot's compiled blacklists."""
+        match = self.settings.blacklist.check(listing.get("title"), listing.get("company"))
+        if match:
+            self.count_outcome(
+                "blacklisted", job_id=listing.get("id"), title=listing.get("title"), company=listing.get("company")
+            )
+            logger.info(f"Skipping job '{listing.get('title')}' due to blacklisted {match.field} term '{match.term}'.")
+            return True
+        return False
+
+    def mark_job(self, job_url, status, job_id=None):
+        """Persist the outcome for a job so later runs skip it without loading the page."""
+        job_id = job_id or job_id_from_url(job_url)
+        self.count_outcome("already_applied" if status == APPLIED else status, job_id=job_id, job_url=job_url)
+        self.applied_store.mark(self.platform_name, job_id, status, job_url)
+
+    def record_application(self, job_url, job_id=None, title=None, company=None):
+        """Remember a successful application for this run, the run history and future runs."""
+        job_id = job_id or job_id_from_url(job_url)
+        applied_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.applications.append({
+            "platform": self.platform_name,
+            "job_url": job_url,
+            "applied_at": applied_at
+        })
+        self.history.add(
+            self.platform_name, job_url, job_id, title=title, company=company, applied_at=applied_at
+        )
+        self.applied_store.mark(self.platform_name, job_id, APPLIED, job_url)
+        self.count_outcome("applied", job_id=job_id, job_url=job_url, title=title, company=company)
+
+    def count_outcome(self, outcome, amount=1, **details):
+        """Increment the per-platform outcome counter exposed on /metrics and publish it on the event bus.
+
+        ``applied`` is published as an applied event, ``error`` and ``incomplete``
+        as failed, every other outcome as skipped. ``details`` (job_id, title...)
+        are added to the event.
+        """
+        metrics.count_outcome(self.platform_name, outcome, amount)
+        event_type = OUTCOME_EVENTS.get(outcome, events.SKIPPED)
+        self.publish_event(event_type, outcome=outcome, **details)
+
+    def publish_event(self, event_type, **details):
+        """Publish a pipeline event for this platform, see utils/events.py."""
+        events.bus.publish(event_type, platform=self.platform_name, **details)
+
+    def should_stop(self) -> bool:
+        """Return True once cancellation has been requested (e.g. via /stop_automation)."""
+        return self.stop_event.is_set()
 
     @abstractmethod
     def login(self):
         pass
 
     @abstractmethod
-    def construct_search_url(self):
+    def construct_search_url(self, query=None):
         pass
 
     @abstractmethod
     def apply_jobs(self):
         pass
 
+    def session_status(self, probe=False):
+        """Check the saved login without a browser.
+
+        Looks at the cookies' expiry only, unless ``probe`` is set and the platform
+        has a ``session_probe_url``; then one HTTP request confirms the site still
+        accepts them. Returns a ``SessionStatus`` that is falsy when the login is unusable.
+        """
+        status = self.cookie_store.status(self.platform_name)
+        if status and probe and self.session_probe_url:
+            status = self.discovery.probe(self.session_probe_url)
+        return status
+
     def load_cookies(self):
-        """Load cookies from a saved file."""
-        if os.path.exists(self.cookies_file):
-            self.browser.get(self.base_url)
-            with open(self.cookies_file, "rb") as file:
-                cookies = pickle.load(file)
-                for cookie in cookies:
-                    if "domain" in cookie:
-                        del cookie["domain"]
-                    self.browser.add_cookie(cookie)
-            return True
-        return False
+        """Load the saved session's cookies into the browser with one CDP call, before any navigation.
+
+        ``Network.setCookies`` keeps each cookie's domain and needs no page to be
+        open, so a new or pooled browser is ready for the site in one round-trip.
+        """
+        cookies = self.cookie_store.load(self.platform_name)
+        if not cookies:
+            return False
+        try:
+            self.browser.execute_cdp_cmd("Network.setCookies", {"cookies": to_cdp_cookies(cookies, self.base_url)})
+        except WebDriverException as e:
+            logger.warning(f"Could not restore {self.platform_name} cookies over CDP ({e}); adding them one by one.")
+            self.add_cookies_on_page(cookies)
+        return True
+
+    def add_cookies_on_page(self, cookies):
+        """Fallback for browsers without CDP: open the site and add each cookie for its host."""
+        self.navigate(self.base_url)
+        for cookie in cookies:
+            cookie = dict(cookie)
+            cookie.pop("domain", None)
+            self.browser.add_cookie(cookie)
 
     def save_cookies(self):
-        """Save cookies to a file for future sessions."""
-        with open(self.cookies_file, "wb") as file:
-            pickle.dump(self.browser.get_cookies(), file)
+        """Save the browser's cookies, with their expiry, for future sessions."""
+        self.cookie_store.save(self.platform_name, self.browser.get_cookies(), self.session_cookies)
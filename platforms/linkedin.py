@@ -1,8 +1,5 @@
-from utils.form_filler import FormFiller
+from utils.form_filler import AnswerCache, FormFiller, create_backend
 from .base import JobPlatform
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import WebDriverWait
@@ -13,17 +10,33 @@ from selenium.common.exceptions import (
     StaleElementReferenceException,
     ElementClickInterceptedException,
 )
-import time
-from datetime import datetime
-import yaml
 from loguru import logger
+from utils.metrics import timed_stage
 
 
 class LinkedInPlatform(JobPlatform):
 
     platform_name = "linkedin"  # Define as class variable
     base_url = "https://www.linkedin.com/"
-
+    site_domain = "linkedin.com"
+    max_drivers = 1  # The session only exists in the browser the user logged in with
+    infinite_scroll = True
+    session_cookies = ("li_at",)
+    session_probe_url = "https://www.linkedin.com/feed/"
+    listing_spec = {
+        "container": "li[data-occludable-job-id]",
+        "id_attribute": "data-occludable-job-id",
+        "title": ".job-card-list__title, a.job-card-container__link",
+        "company": ".artdeco-entity-lockup__subtitle, .job-card-container__primary-description",
+        "link": "a[href*='/jobs/view/']",
+        "easy_apply_text": "Easy Apply",
+    }
+
+    def __init__(self, config, headless=True):
+        super().__init__(config, headless)
+        self.form_filler = None  # Built once per run by create_form_filler()
+
+    @timed_stage("login")
     def login(self):
         """Perform the login process using credentials from the config file."""
         try:
@@ -79,158 +92,142 @@ class LinkedInPlatform(JobPlatform):
                     )
                     logger.debug("Password field detected, waiting for login completion.")
 
-                time.sleep(check_interval)
+                self.wait_until(lambda: 'feed' in self.browser.current_url, timeout=check_interval,
+                                description="LinkedIn feed")
                 elapsed_time += check_interval
 
         except TimeoutException:
             logger.error("Login form not found. Aborting login.")
 
-    def construct_search_url(self):
-        """Construct LinkedIn job search URL based on user preferences."""
+    def construct_search_url(self, query=None):
+        """Construct LinkedIn job search URL for ``query``, or for the title/location in the preferences."""
         preferences = self.config["job_preferences"]
         base_url = f"{self.base_url}jobs/search/"
 
-        keywords = preferences.get("job_title", "").replace(" ", "%20")
-        location = preferences.get("location", "").replace(" ", "%20")
+        keywords = (query.position if query else preferences.get("job_title", "")).replace(" ", "%20")
+        location = (query.location if query else preferences.get("location", "")).replace(" ", "%20")
         remote = "&f_WT=2" if preferences.get("linkedin_remote", "0") == "1" else ""
 
         # Construct the search URL based on preferences
-        url = f"{base_url}?keywords={keywords}&location={location}{remote}"
+        url = f"{base_url}?keywords={keywords}&location={location}{remote}&sortBy=DD"
         logger.info(f"Constructed LinkedIn job search URL: {url}")
         return url
 
+    def search_page_url(self, search_url, page):
+        """LinkedIn pages through results 25 at a time with a ``start`` offset."""
+        return f"{search_url}&start={(page - 1) * 25}"
+
+    @timed_stage("apply_jobs")
     def apply_jobs(self):
         """Start the job application process on LinkedIn."""
-        self.browser = self.start_browser(headless=False)  # Initialize browser
+        self.start_browser(headless=False)  # Check out a visible browser
         self.browser.get(self.base_url)
         if not self.login():
             logger.error("Login failed. Stopping automation.")
             return
 
-        time.sleep(2)
-        self.browser.get(self.construct_search_url())
-        time.sleep(1)
         self.accept_cookies()
 
         try:
-            self.apply_for_jobs_on_linkedin()
+            self.apply_for_jobs_on_linkedin(self.search_urls())
         except Exception as e:
             logger.error(f"Unexpected error during job application process: {e}")
         finally:
-            self.browser.quit()
+            self.quit_browser()
             logger.info("Browser closed after completing job applications.")
 
-    def apply_for_jobs_on_linkedin(self):
-        """Search and apply for jobs on LinkedIn."""
-        resume_data = self.load_resume_data("./data_folder/plain_text_resume.yaml")
-        field_mapping = self.create_field_mapping(resume_data)
-        config = self.load_config("./data_folder/config.yaml")
+    def apply_for_jobs_on_linkedin(self, search_urls):
+        """Search and apply for jobs on LinkedIn posted since the last run."""
+        field_mapping = self.create_field_mapping(self.settings.resume)
+        if self.form_filler is None:
+            self.form_filler = self.create_form_filler(field_mapping)
+
+        heads = {}
+        with self.search_listings(search_urls, heads) as crawled:
+            for listing in self.filter_known_listings(self.with_easy_apply(crawled)):
+                if self.should_stop():
+                    logger.info("Stop requested. Halting LinkedIn applications.")
+                    break
+                try:
+                    if self.is_blacklisted(listing):
+                        continue  # Skip applying for blacklisted job titles or companies
 
-        job_listings = self.find_job_listings()
-        for listing in job_listings:
-            try:
-                # Get the job title to check if it should be skipped
-                job_title = listing.find_element(By.CSS_SELECTOR, "h3.job-result-card__title").text
-                if self.is_title_blacklisted(job_title, config):
-                    continue  # Skip applying for blacklisted job titles
-
-                self.apply_to_job(listing, field_mapping)
-            except WebDriverException as e:
-                logger.error(f"Error while processing job listing: {e}")
-                continue
-
-    def find_job_listings(self):
-        """Locate job listings with 'Easy Apply' badge on LinkedIn."""
-        try:
-            # Wait for job listings to load
-            # Find all <li> elements with the 'data-occludable-job-id' attribute
-            job_elements = self.browser.find_elements(By.CSS_SELECTOR, 'li[data-occludable-job-id]')
-
-            # Filter "Easy Apply" jobs
-            easy_apply_jobs = []
-
-            for job in job_elements:
-                # Find all <span> elements within the job element
-                spans = job.find_elements(By.CSS_SELECTOR, 'span')
-                
-                # Check if any <span> contains the text "Easy Apply"
-                has_easy_apply = any(span.text == "Easy Apply" for span in spans)
-                
-                if has_easy_apply:
-                    easy_apply_jobs.append(job)
-                
-            print(f"Found {len(easy_apply_jobs)} 'Easy Apply' jobs.")
-            return easy_apply_jobs
-        
-        except Exception as e:
-            print(f"Error extracting job details: {e}")
+                    self.apply_to_job(listing, field_mapping)
+                except WebDriverException as e:
+                    logger.error(f"Error while processing job listing: {e}")
+                    continue
 
-    def scroll_to_load_more_jobs(self):
-        """Scroll to load more job listings if pagination exists."""
-        try:
-            scroll_pause_time = 2  # Time to wait between scrolls
-            last_height = self.browser.execute_script("return document.body.scrollHeight")
+        self.advance_watermarks(heads)
 
-            while True:
-                # Scroll down to the bottom of the page
-                self.browser.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(scroll_pause_time)
+    def extract_listings(self) -> list:
+        """Read the job cards loaded so far, deriving the job URL from the ID where the card has no link."""
+        job_listings = super().extract_listings()
+        for listing in job_listings:
+            if not listing["url"]:
+                listing["url"] = f"{self.base_url}jobs/view/{listing['id']}/"
+        return job_listings
 
-                # Calculate new scroll height and compare with last scroll height
-                new_height = self.browser.execute_script("return document.body.scrollHeight")
-                if new_height == last_height:
-                    break
-                last_height = new_height
-        except WebDriverException as e:
-            logger.error(f"Error while scrolling to load more jobs: {e}")
+    @staticmethod
+    def with_easy_apply(job_listings):
+        """Keep the "Easy Apply" jobs."""
+        for listing in job_listings:
+            if listing["easy_apply"]:
+                yield listing
 
+    @timed_stage("apply_to_job")
     def apply_to_job(self, listing, field_mapping):
         """Apply to a job listing and handle form filling if necessary."""
         try:
-            # Click on the job listing
-            listing.click()
-            time.sleep(2)  # Wait for the job details to load
+            # Open the job listing in its own tab
+            self.open_in_new_tab(listing["url"], "button.jobs-apply-button")
 
             # Click the "Easy Apply" button
             easy_apply_button = WebDriverWait(self.browser, 10).until(
                 EC.element_to_be_clickable((By.CSS_SELECTOR, "button.jobs-apply-button"))
             )
             easy_apply_button.click()
-            time.sleep(2)  # Wait for the application form to load
+            self.wait_for_element(By.CSS_SELECTOR, "div.jobs-easy-apply-modal", timeout=5)
 
             # Use FormFiller to fill and submit the form
             self.fill_form_using_llm()
 
             if self.check_submission_success():
                 logger.info("Application submitted successfully.")
-                self.applications.append({
-                    "platform": self.platform_name,
-                    "job_url": self.browser.current_url,
-                    "applied_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                })
+                self.record_application(listing["url"], listing["id"], listing.get("title"), listing.get("company"))
             else:
                 logger.info("Application submission failed or incomplete.")
+                self.count_outcome("incomplete", job_id=listing["id"])
 
         except Exception as e:
+            self.count_outcome("error", job_id=listing["id"], error=str(e))
             logger.error(f"Error while processing job listing: {e}")
         finally:
             # Close the current tab and continue with the next job
-            time.sleep(1)  # Allow time for error handling or user intervention
             self.browser.close()
             self.browser.switch_to.window(self.browser.window_handles[0])
 
+    def create_form_filler(self, field_mapping=None):
+        """Build the form filler once per run, with the answer backend from the ``form_answers`` config."""
+        settings = self.settings
+        answer_config = self.config.get("form_answers", {})
+        backend = create_backend(answer_config, settings.secrets, field_mapping)
+        cache = AnswerCache(
+            answer_config.get("cache_file", "user_data/form_answers.json"),
+            max_entries=int(answer_config.get("cache_size", 2000)),
+        )
+        return FormFiller(settings.resume, backend, cache)
+
+    @timed_stage("fill_form")
     def fill_form_using_llm(self):
-        """Use OpenAI to fill out the form."""
+        """Fill out and submit the Easy Apply form, using cached answers before asking the model."""
         try:
-            secrets = self.load_config('./data_folder/secrets.yaml')
-            resume_data = self.load_config('./data_folder/plain_text_resume.yaml')
-            openai_key = secrets.get("llm_api_key")
-
-            form_filler = FormFiller(resume_data, openai_api_key=openai_key, driver=self.browser)
-            form_filler.fill_and_submit_form()
+            if self.form_filler is None:
+                self.form_filler = self.create_form_filler()
+            self.form_filler.fill_and_submit_form(self.browser)
         except Exception as e:
-            logger.error(f"Error while filling form using OpenAI: {e}")
+            logger.error(f"Error while filling the Easy Apply form: {e}")
 
+    @timed_stage("submission_check")
     def check_submission_success(self) -> bool:
         """Check if the submission was successful by looking for a success message."""
         try:
@@ -256,25 +253,4 @@ class LinkedInPlatform(JobPlatform):
             "City": personal_info.get("city", ""),
             "Postal Code": personal_info.get("zip_code", ""),
             "Country": personal_info.get("country", ""),
-        }
-
-    def is_title_blacklisted(self, job_title: str, config: dict) -> bool:
-        """Check if the job title is blacklisted."""
-        title_blacklist = config.get("title_blacklist", [])
-        job_title_lower = job_title.lower()
-
-        for blacklisted_word in title_blacklist:
-            if blacklisted_word.lower() in job_title_lower:
-                logger.info(f"Skipping job '{job_title}' due to blacklisted term '{blacklisted_word}'.")
-                return True
-        return False
-
-    def load_resume_data(self, yaml_path: str) -> dict:
-        """Load resume data from a YAML file."""
-        with open(yaml_path, 'r', encoding='utf-8') as file:
-            return yaml.safe_load(file)
-
-    def load_config(self, config_path: str) -> dict:
-        """Load configuration data from a YAML file."""
-        with open(config_path, 'r', encoding='utf-8') as file:
-            return yaml.safe_load(file)
\ No newline at end of file
+        }
\ No newline at end of file
@@ -1,11 +1,7 @@
 # platforms/stepstone.py
 
 from .base import JobPlatform
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
-from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
@@ -14,33 +10,43 @@ from selenium.common.exceptions import (
     StaleElementReferenceException,
     ElementClickInterceptedException,
 )
-import time
-from datetime import datetime
-import yaml
 from loguru import logger
+from utils.applied_store import APPLIED, EXTERNAL
+from utils.cookie_store import EXPIRED
+from utils.form_snapshot import fill_form
+from utils.label_index import LabelIndex
+from utils.metrics import timed_stage
 
 
 class StepStonePlatform(JobPlatform):
     platform_name = "stepstone"  # Define as class variable
     base_url = "https://www.stepstone.de/"
-
-    def start_browser(self, headless=True):
-        """Initialize and return the Chrome WebDriver with required options."""
-        options = webdriver.ChromeOptions()
-        if headless:
-            options.headless = True
+    site_domain = "stepstone.de"
+
+    # The persistent profile directory can only be opened by one Chrome at a time.
+    max_drivers = 1
+    http_discovery = True
+    session_cookies = ("SsoSessionId",)
+    session_probe_url = "https://www.stepstone.de/candidate/profile"
+    listing_spec = {
+        "container": ".res-1p8f8en",
+        "title": ".res-nehv70",
+        "company": "[data-at='job-item-company-name']",
+        "link": "a[data-at='job-item-title'], a[href]",
+        "easy_apply_text": "Easy Apply",
+    }
+
+    def chrome_options(self, headless=True):
+        """Return the Chrome options with StepStone's persistent profile."""
+        options = super().chrome_options(headless)
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument("--user-data-dir=./chrome_user_data_stepstone")
-        options.add_argument("--window-size=1920,1080")
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option("useAutomationExtension", False)
         # Adjust binary location if necessary
         # options.binary_location = '/path/to/chrome'
+        return options
 
-        service = ChromeService(ChromeDriverManager().install())
-        return webdriver.Chrome(service=service, options=options)
-
+    @timed_stage("login")
     def login(self):
         """Login to StepStone using stored credentials."""
         if self.is_logged_in():
@@ -55,6 +61,10 @@ class StepStonePlatform(JobPlatform):
 
     def is_logged_in(self) -> bool:
         """Check if the user is already logged in."""
+        if self.session_status().reason == EXPIRED:
+            # Known stale from the saved cookies' expiry; no need to load a page and wait.
+            logger.info("Saved StepStone session has expired.")
+            return False
         try:
             self.browser.get(self.base_url)
             WebDriverWait(self.browser, 5).until(
@@ -80,7 +90,7 @@ class StepStonePlatform(JobPlatform):
                 EC.element_to_be_clickable((By.CSS_SELECTOR, "[data-testid='menu-item-sign-in-menu']"))
             )
             self.browser.execute_script("arguments[0].click();", login_menu_button)
-            time.sleep(1)  # Small delay to ensure dropdown appears
+            self.wait_for_dom_quiescence(quiet_ms=200, timeout=1)  # Let the dropdown render
 
             # Close any overlay that might appear
             self.close_overlay_if_exists()
@@ -113,7 +123,7 @@ class StepStonePlatform(JobPlatform):
 
     def fill_login_credentials(self):
         """Fill in login credentials and submit."""
-        secrets = self.load_config('./data_folder/secrets.yaml')
+        secrets = self.settings.secrets
         email = secrets.get("stepstone_username")
         password = secrets.get("stepstone_password")
 
@@ -137,13 +147,13 @@ class StepStonePlatform(JobPlatform):
         logger.info("Login successful.")
         return True
 
-    def construct_search_url(self):
-        """Construct StepStone job search URL based on user preferences."""
+    def construct_search_url(self, query=None):
+        """Construct StepStone job search URL for ``query``, or for the title/location in the preferences."""
         preferences = self.config["job_preferences"]
         base_url = "https://www.stepstone.de/jobs"
 
-        keywords = preferences.get("job_title", "").replace(" ", "-")
-        location = preferences.get("location", "").replace(" ", "-")
+        keywords = (query.position if query else preferences.get("job_title", "")).replace(" ", "-")
+        location = (query.location if query else preferences.get("location", "")).replace(" ", "-")
         radius = preferences.get("radius", 30)  # Default radius if not specified
         wfh = preferences.get("stepstone_wfh", "0")
 
@@ -153,21 +163,36 @@ class StepStonePlatform(JobPlatform):
         if wfh == "1":
             url += "&wfh=1"
 
+        # Newest first, so incremental crawls can stop at the last run's watermark
+        if self.crawl_config.get("incremental", True):
+            url += "&sort=2&action=sort_publish"
+
+        max_age = preferences.get("stepstone_max_age")  # e.g. "age_1" for the last 24 hours
+        if max_age:
+            url += f"&ag={max_age}"
+
         # Additional parameters can be added as needed
 
         logger.info(f"Constructed StepStone job search URL: {url}")
         return url
 
+    def search_page_url(self, search_url, page):
+        """StepStone paginates with a ``page`` query parameter."""
+        return f"{search_url}&page={page}"
+
+    @timed_stage("apply_jobs")
     def apply_jobs(self):
         """Start the job application process on StepStone."""
-        self.browser.get(self.construct_search_url())
+        # Consent and login first: the login check leaves whatever page is open, and
+        # each search is loaded when it is crawled.
+        self.navigate(self.base_url)
         self.accept_cookies()
 
         if not self.is_logged_in():
             if not self.login():
                 return
 
-        self.apply_for_jobs_on_stepstone()
+        self.apply_for_jobs_on_stepstone(self.search_urls())
 
     def accept_cookies(self):
         """Accept cookies on the StepStone page if the prompt appears."""
@@ -180,59 +205,51 @@ class StepStonePlatform(JobPlatform):
         except WebDriverException:
             logger.warning("Cookie consent not found or already accepted.")
 
-    def apply_for_jobs_on_stepstone(self):
-        """Search and apply for jobs on StepStone."""
-        resume_data = self.load_resume_data("./data_folder/plain_text_resume.yaml")
-        field_mapping = self.create_field_mapping(resume_data)
-        config = self.load_config("./data_folder/config.yaml")
+    def apply_for_jobs_on_stepstone(self, search_urls):
+        """Search and apply for jobs on StepStone posted since the last run."""
+        field_mapping = self.create_field_mapping(self.settings.resume)
 
-        job_listings = self.find_job_listings_with_easy_apply()
-        for listing in job_listings:
-            try:
-                # Get the job title to check if it should be skipped
-                job_title = listing.find_element(By.CLASS_NAME, "res-nehv70").text
-                if self.is_title_blacklisted(job_title, config):
-                    continue  # Skip applying for blacklisted job titles
-
-                self.apply_to_job(listing, field_mapping)
-            except WebDriverException as e:
-                logger.error(f"Error while processing job listing: {e}")
-                continue
-
-    def find_job_listings_with_easy_apply(self):
-        """Locate job listings with 'Easy Apply' badge on the StepStone page."""
-        try:
-            # Find all job listings
-            job_listings = WebDriverWait(self.browser, 20).until(
-                EC.presence_of_all_elements_located((By.CLASS_NAME, "res-1p8f8en"))
-            )
+        heads = {}
+        with self.search_listings(search_urls, heads) as crawled:
+            for listing in self.filter_known_listings(self.with_easy_apply(crawled)):
+                if self.should_stop():
+                    logger.info("Stop requested. Halting StepStone applications.")
+                    break
+                try:
+                    if self.is_blacklisted(listing):
+                        continue  # Skip applying for blacklisted job titles or companies
 
-            # Filter listings with "Easy Apply" badge
-            easy_apply_listings = [
-                listing for listing in job_listings
-                if listing.find_elements(By.XPATH, ".//span[contains(text(), 'Easy Apply')]")
-            ]
+                    self.apply_to_job(listing, field_mapping)
+                except WebDriverException as e:
+                    logger.error(f"Error while processing job listing: {e}")
+                    continue
 
-            logger.info(f"Found {len(easy_apply_listings)} 'Easy Apply' job listings to apply to.")
-            return easy_apply_listings
-        except WebDriverException:
-            logger.error("No job listings with 'Easy Apply' found or took too long to load.")
-            return []
+        self.advance_watermarks(heads)
 
+    @staticmethod
+    def with_easy_apply(job_listings):
+        """Keep the listings with an 'Easy Apply' badge."""
+        for listing in job_listings:
+            if listing["easy_apply"] and listing["url"]:
+                yield listing
+
+    @timed_stage("apply_to_job")
     def apply_to_job(self, listing, field_mapping):
         """Apply to a job listing and handle form filling if necessary."""
         try:
-            ActionChains(self.browser).move_to_element(listing).click(listing).perform()
-            self.browser.switch_to.window(self.browser.window_handles[-1])
+            self.open_in_new_tab(listing["url"], "[data-testid='harmonised-apply-button']")
 
             apply_button = WebDriverWait(self.browser, 10).until(
                 EC.element_to_be_clickable((By.CSS_SELECTOR, "[data-testid='harmonised-apply-button']"))
             )
 
+            listing_page_url = self.browser.current_url
+
             # Check if the button text indicates the job was already applied
             button_text = apply_button.text.strip()
             if button_text.lower() == "already applied":
                 logger.info("Job already applied to, skipping.")
+                self.mark_job(listing["url"], APPLIED, listing["id"])
                 self.browser.close()
                 self.browser.switch_to.window(self.browser.window_handles[0])
                 return
@@ -240,7 +257,8 @@ class StepStonePlatform(JobPlatform):
                 apply_button.click()
                 logger.info("Clicked the apply button.")
 
-            if self.check_redirect_to_external():
+            if self.check_redirect_to_external(listing_page_url):
+                self.mark_job(listing["url"], EXTERNAL, listing["id"])
                 return  # Skip to the next job if redirected
 
             try:
@@ -249,7 +267,7 @@ class StepStonePlatform(JobPlatform):
                 )
                 send_application_button.click()
                 logger.info("Clicked the send application button.")
-                time.sleep(2)
+                self.wait_for_dom_quiescence(timeout=2)
                 self.fill_form_with_yaml_data(field_mapping)
             except WebDriverException:
                 logger.info("'sendApplication' button not found. Proceeding with form filling if available.")
@@ -259,27 +277,26 @@ class StepStonePlatform(JobPlatform):
                 logger.warning("Form has errors. Pausing submission for this application.")
             elif self.check_submission_success():
                 logger.info("Application submitted successfully.")
-                self.applications.append({
-                    "platform": self.platform_name,
-                    "job_url": self.browser.current_url,
-                    "applied_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                })
+                self.record_application(listing["url"], listing["id"], listing.get("title"), listing.get("company"))
                 self.browser.close()
                 self.browser.switch_to.window(self.browser.window_handles[0])
             else:
                 logger.info("Application submission failed or incomplete.")
+                self.count_outcome("incomplete", job_id=listing["id"])
                 self.browser.close()
                 self.browser.switch_to.window(self.browser.window_handles[0])
 
         except WebDriverException as e:
+            self.count_outcome("error", job_id=listing["id"], error=str(e))
             logger.error(f"Error while processing job listing: {e}")
             self.browser.close()
             self.browser.switch_to.window(self.browser.window_handles[0])
 
-    def check_redirect_to_external(self) -> bool:
+    def check_redirect_to_external(self, previous_url=None) -> bool:
         """Check if the current tab redirected to an external site, close it if true."""
-        time.sleep(2)
-        if "stepstone.de" not in self.browser.current_url:
+        if previous_url:
+            self.wait_for_url_change(previous_url, timeout=2)
+        if self.site_domain not in self.browser.current_url:
             logger.warning(f"Redirected to external site: {self.browser.current_url}. Closing tab and skipping.")
             self.browser.close()
             self.browser.switch_to.window(self.browser.window_handles[0])
@@ -294,6 +311,7 @@ class StepStonePlatform(JobPlatform):
             return True
         return False
 
+    @timed_stage("submission_check")
     def check_submission_success(self) -> bool:
         """Check if the submission was successful by looking for a success message."""
         try:
@@ -304,6 +322,7 @@ class StepStonePlatform(JobPlatform):
         except WebDriverException:
             return False
 
+    @timed_stage("fill_form")
     def fill_form_with_yaml_data(self, field_mapping):
         """Fill out required fields in the form based on provided field mapping and dropdown questions."""
         # Predefined dropdown selections for specific questions
@@ -314,38 +333,12 @@ class StepStonePlatform(JobPlatform):
             "Besitzt du mehr als 3 Jahre Berufserfahrung im Frontend Engineering?": "Ja",
         }
 
-        # Fill dropdown questions based on predefined mapping
-        for question, answer in dropdown_questions.items():
-            try:
-                # Locate dropdown by question text
-                dropdown = WebDriverWait(self.browser, 10).until(
-                    EC.presence_of_element_located(
-                        (By.XPATH, f"//label[contains(text(), '{question}')]/following::select[1]")
-                    )
-                )
-                # Select the option within the dropdown based on answer text
-                option = dropdown.find_element(By.XPATH, f".//option[contains(text(), '{answer}')]")
-                option.click()
-                logger.info(f"Selected '{answer}' for question '{question}'")
-            except WebDriverException:
-                logger.warning(f"Could not select answer for '{question}'")
-
-        # Fill required text input fields based on field_mapping
-        required_fields = self.browser.find_elements(By.XPATH, "//label[contains(@class, 'required')]")
-
-        for label in required_fields:
-            label_text = label.text.strip()
-            input_value = field_mapping.get(label_text, None)
-
-            # Only proceed with text inputs, as dropdowns are handled in dropdown_questions
-            if input_value:
-                try:
-                    input_field = label.find_element(By.XPATH, "following::input[1]")
-                    input_field.clear()
-                    input_field.send_keys(input_value)
-                    logger.info(f"Filled required field '{label_text}' with '{input_value}'")
-                except WebDriverException:
-                    logger.warning(f"Could not find input for '{label_text}'")
+        # One bounded wait for the form, then read, match and fill it in two script calls
+        self.wait_for_element(By.CSS_SELECTOR, "form label", timeout=5)
+        try:
+            fill_form(self.browser, field_mapping, dropdown_questions)
+        except WebDriverException as e:
+            logger.warning(f"Could not fill the application form: {e}")
 
         # Check for form errors before submitting
         if self.check_for_errors():
@@ -368,7 +361,8 @@ class StepStonePlatform(JobPlatform):
         salary_expectations = resume_data.get('salary_expectations', {})
         availability = resume_data.get('availability', {})
 
-        return {
+        # Labels are matched through a normalized synonym index, see utils/label_index.py
+        return LabelIndex({
             "Verfügbar ab": "01.01.2025",
             "Gehaltsvorstellung": salary_expectations.get("salary_range_usd", "50000 - 60000"),
             "Ort": personal_info.get("city", "Aschaffenburg"),
@@ -385,25 +379,4 @@ class StepStonePlatform(JobPlatform):
             "Gehaltsrange pro Jahr (brutto) bis": salary_expectations.get("salary_range_usd", "").split("-")[-1].strip(),
             "linkedin": personal_info.get("linkedin", ""),
             "github": personal_info.get("github", ""),
-        }
-
-    def is_title_blacklisted(self, job_title: str, config: dict) -> bool:
-        """Check if the job title is blacklisted."""
-        title_blacklist = config.get("title_blacklist", [])
-        job_title_lower = job_title.lower()
-
-        for blacklisted_word in title_blacklist:
-            if blacklisted_word.lower() in job_title_lower:
-                logger.info(f"Skipping job '{job_title}' due to blacklisted term '{blacklisted_word}'.")
-                return True
-        return False
-
-    def load_resume_data(self, yaml_path: str) -> dict:
-        """Load resume data from a YAML file."""
-        with open(yaml_path, 'r', encoding='utf-8') as file:
-            return yaml.safe_load(file)
-
-    def load_config(self, config_path: str) -> dict:
-        """Load configuration data from a YAML file."""
-        with open(config_path, 'r', encoding='utf-8') as file:
-            return yaml.safe_load(file)
+        })
@@ -10,17 +10,28 @@ from selenium.common.exceptions import (
     StaleElementReferenceException,
     ElementClickInterceptedException,
 )
-import time
-from datetime import datetime
 from loguru import logger
+from utils.applied_store import APPLIED, EXTERNAL, NO_EASY_APPLY
+from utils.metrics import timed_stage
 
 class XingPlatform(JobPlatform):
     platform_name = "xing"  
     base_url = "https://www.xing.com"
-
+    site_domain = "xing.com"
+    http_discovery = True
+    session_cookies = ("login",)
+    session_probe_url = "https://www.xing.com/jobs/my-jobs"
+    listing_spec = {
+        "container": "ul.results-styles__List-sc-31de7c67-0 li",
+        "title": "h2",
+        "company": "[data-testid='job-teaser-list-company'], p",
+        "link": "a[data-testid='job-search-result']",
+    }
+
+    @timed_stage("login")
     def login(self):
         """Manual login through a non-headless browser and save cookies."""
-        self.browser = self.start_browser(headless=False)  # Initialize browser
+        self.start_browser(headless=False)  # Check out a visible browser for manual login
         self.browser.get("https://login.xing.com/")
         print("Please log in to Xing in the opened browser window.")
 
@@ -36,13 +47,14 @@ class XingPlatform(JobPlatform):
             logger.error("Login was not completed successfully within the time limit.")
             return False
 
-    def construct_search_url(self):
-        """Construct Xing job search URL based on user preferences."""
+    def construct_search_url(self, query=None):
+        """Construct Xing job search URL for ``query``, or for the title/location in the preferences."""
         preferences = self.config["job_preferences"]
         base_url = "https://www.xing.com/jobs/search?sc_o=jobs_search_button"
 
-        keywords = preferences.get("job_title", "").replace(" ", "%20")
-        location = preferences.get("location", "")
+        position = query.position if query else preferences.get("job_title", "")
+        keywords = position.replace(" ", "%20")
+        location = query.location if query else preferences.get("location", "")
         radius = str(preferences.get("radius", 20))
         remote_option = '*'.join(preferences.get("remote_option", []))
         employment_type = '*'.join(preferences.get("employment_type", []))
@@ -59,68 +71,97 @@ class XingPlatform(JobPlatform):
         logger.info(f"Constructed Xing job search URL: {url}")
         return url
 
+    def search_page_url(self, search_url, page):
+        """Xing paginates with a ``page`` query parameter."""
+        return f"{search_url}&page={page}"
+
+    @timed_stage("apply_jobs")
     def apply_jobs(self):
         """Start the headless job application process using saved cookies."""
-        self.browser.get(self.construct_search_url())
-        self.apply_for_jobs_on_xing()
-
-    def apply_for_jobs_on_xing(self):
-        """Iterate through job listings and apply if applicable."""
-        try:
-            job_listings = WebDriverWait(self.browser, 10).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, "ul.results-styles__List-sc-31de7c67-0 li"))
+        status = self.session_status()
+        if not status:
+            logger.error(f"No valid saved Xing session ({status.reason}). Please log in first.")
+            return
+        if not self.load_cookies():
+            logger.error("Could not restore the saved Xing session in the browser. Please log in again.")
+            return
+        self.apply_for_jobs_on_xing(self.search_urls())
+
+    def prepare_worker(self) -> bool:
+        """Restore the saved session in a forked worker's browser."""
+        return self.load_cookies()
+
+    def apply_for_jobs_on_xing(self, search_urls):
+        """Iterate through the new job listings of all searches and apply if applicable."""
+        heads = {}
+        with self.search_listings(search_urls, heads) as crawled:
+            listings = self.filter_known_listings(
+                listing for listing in self.with_urls(crawled) if not self.is_blacklisted(listing)
             )
-            logger.info(f"Found {len(job_listings)} job listings on Xing.")
 
-            for listing in job_listings:
-                try:
+            concurrency = self.concurrency_limit()
+            if concurrency > 1:
+                if self.uses_http_discovery() or self.search_parallelism(search_urls) > 1:
+                    # Searches are crawled elsewhere; hand this warm, logged-in browser to a worker.
+                    self.quit_browser()
+                logger.info(f"Applying to new Xing jobs with {concurrency} parallel browsers.")
+                self.process_concurrently(
+                    listings, lambda worker, listing: worker.apply_to_job_in_new_tab(listing), concurrency
+                )
+            else:
+                for listing in listings:
+                    if self.should_stop():
+                        logger.info("Stop requested. Halting Xing applications.")
+                        break
                     self.apply_to_job_in_new_tab(listing)
-                    time.sleep(2)
-                except WebDriverException as e:
-                    logger.error(f"Error while processing job listing: {e}")
 
-        except WebDriverException as e:
-            logger.error(f"No job listings found or took too long to load on Xing: {e}")
+        self.advance_watermarks(heads)
+
+    @staticmethod
+    def with_urls(listings):
+        """Skip listings whose card has no link to the job page."""
+        for listing in listings:
+            if not listing["url"]:
+                logger.error(f"No URL found for job listing '{listing['title']}'. Skipping it.")
+                continue
+            yield listing
 
+    @timed_stage("apply_to_job")
     def apply_to_job_in_new_tab(self, listing):
         """Apply to a job listing on Xing in a new tab, ensuring robust tab handling."""
+        listing_url = listing["url"]
         try:
-            link_element = listing.find_element(By.CSS_SELECTOR, "a[data-testid='job-search-result']")
-            listing_url = link_element.get_attribute("href")
-
-            if not listing_url:
-                logger.error("No URL found for job listing. Skipping this listing.")
-                return
-
-            self.browser.execute_script("window.open(arguments[0], '_blank');", listing_url)
-            self.browser.switch_to.window(self.browser.window_handles[-1])
+            self.open_in_new_tab(listing_url, "[data-testid='apply-button']")
 
-            if "xing.com" not in self.browser.current_url:
+            if self.site_domain not in self.browser.current_url:
                 logger.warning("Opened page is not on Xing. Closing tab and returning to listings.")
+                self.mark_job(listing_url, EXTERNAL, listing["id"])
                 self.browser.close()
                 self.browser.switch_to.window(self.browser.window_handles[0])
                 return
 
             if self.already_applied():
                 logger.info("Job already applied to. Skipping to the next job listing.")
+                self.mark_job(listing_url, APPLIED, listing["id"])
                 self.browser.close()
                 self.browser.switch_to.window(self.browser.window_handles[0])
                 return
 
             if not self.click_easy_apply_and_send():
                 logger.info("'Easy apply' button not available. Skipping to next listing.")
+                self.mark_job(listing_url, NO_EASY_APPLY, listing["id"])
                 self.browser.close()
                 self.browser.switch_to.window(self.browser.window_handles[0])
                 return
 
             if self.check_submission_success():
-                self.applications.append({
-                    "job_url": self.browser.current_url,
-                    "applied_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                })
+                self.record_application(listing_url, listing["id"], listing.get("title"), listing.get("company"))
                 logger.info("Application submitted successfully.")
+            else:
+                self.count_outcome("incomplete", job_id=listing["id"])
 
         except WebDriverException as e:
+            self.count_outcome("error", job_id=listing["id"], error=str(e))
             logger.error(f"Error while processing job listing: {e}")
 
         finally:
@@ -171,8 +212,9 @@ class XingPlatform(JobPlatform):
             send_button = WebDriverWait(self.browser, 15).until(
                 EC.element_to_be_clickable((By.XPATH, "//button[.//span[text()='Send application']]"))
             )
-            send_button.click()
-            time.sleep(5)  # Wait for the application to be submitted
+            # Track the submission request from before the click and wait for it to settle
+            with self.track_network(timeout=5):
+                send_button.click()
             logger.info("Clicked 'Send application' button successfully.")
         except TimeoutException:
             logger.error("Timed out waiting for 'Send application' button.")
@@ -186,6 +228,7 @@ class XingPlatform(JobPlatform):
             except Exception as e_js:
                 logger.error(f"Failed to click 'Send application' button with JavaScript fallback: {e_js}")
 
+    @timed_stage("submission_check")
     def check_submission_success(self) -> bool:
         """Check if the submission was successful by looking for a success message."""
         try:
@@ -0,0 +1,94 @@
+# tests/conftest.py
+
+import pytest
+from platforms import base
+from platforms.base import JobPlatform
+from utils.applied_store import AppliedJobsStore
+from utils.cookie_store import CookieStore
+from utils.history import ApplicationHistory
+from utils.watermarks import WatermarkStore
+
+
+class FakeBrowser:
+    """Just enough of a WebDriver to load a page and remember which one is open."""
+
+    def __init__(self):
+        self.current_url = "about:blank"
+        self.visited = []
+        self.window_handles = ["main"]
+        self.switch_to = self
+
+    def get(self, url):
+        self.current_url = url
+        self.visited.append(url)
+
+    def window(self, handle):
+        pass
+
+    def find_elements(self, by, selector):
+        return [object()]
+
+    def execute_script(self, script, *args):
+        return None
+
+
+class FakePlatform(JobPlatform):
+    """A platform whose result pages come from ``config["results"]`` instead of a site.
+
+    Over HTTP each search yields its batches; in the browser (``crawl.discovery:
+    browser``) the open page shows the first batch of the loaded search.
+    """
+
+    platform_name = "fake"
+    base_url = "https://fake.example/"
+    http_discovery = True
+    listing_spec = {"container": "li"}
+
+    def login(self):
+        return True
+
+    def construct_search_url(self, query=None):
+        return f"https://fake.example/search?q={query.position if query else ''}"
+
+    def apply_jobs(self):
+        pass
+
+    def search_page_url(self, search_url, page):
+        return f"{search_url}&page={page}"
+
+    def http_result_batches(self, search_url):
+        yield from self.config["results"].get(search_url, [])
+
+    def extract_listings(self):
+        return list(next(iter(self.config["results"].get(self.browser.current_url, [])), []))
+
+
+def listing(job_id):
+    return {"id": job_id, "title": f"Job {job_id}", "company": "Acme", "url": f"https://fake.example/{job_id}",
+            "easy_apply": True}
+
+
+@pytest.fixture
+def stores(tmp_path, monkeypatch):
+    """Point every process-wide store of the platforms at temporary files."""
+    applied = AppliedJobsStore(str(tmp_path / "applied_jobs.jsonl"))
+    history = ApplicationHistory(str(tmp_path / "applications.db"))
+    watermarks = WatermarkStore(str(tmp_path / "watermarks.json"))
+    cookies = CookieStore(str(tmp_path / "cookies"))
+    monkeypatch.setattr(base, "get_applied_store", lambda: applied)
+    monkeypatch.setattr(base, "get_history", lambda: history)
+    monkeypatch.setattr(base, "get_watermarks", lambda: watermarks)
+    monkeypatch.setattr(base, "get_cookie_store", lambda: cookies)
+    yield {"applied": applied, "history": history, "watermarks": watermarks, "cookies": cookies}
+    history.close()
+
+
+@pytest.fixture
+def make_platform(stores):
+    def make(results, **crawl):
+        crawl = {"incremental": True, "max_pages": 3, "prefetch": False, "stop_after_known": 3, **crawl}
+        platform = FakePlatform({"results": results, "crawl": crawl})
+        platform.browser = FakeBrowser()
+        return platform
+
+    return make
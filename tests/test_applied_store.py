@@ -0,0 +1,39 @@
+# tests/test_applied_store.py
+
+from utils.applied_store import APPLIED, EXTERNAL, NO_EASY_APPLY, AppliedJobsStore
+
+
+def test_outcomes_survive_a_reload(tmp_path):
+    path = str(tmp_path / "applied_jobs.jsonl")
+    store = AppliedJobsStore(path)
+    store.mark("xing", "1")
+    store.mark("xing", "2", EXTERNAL)
+    store.mark("stepstone", "1", NO_EASY_APPLY)
+
+    reloaded = AppliedJobsStore(path)
+    assert len(reloaded) == 3
+    assert reloaded.has_applied("xing", "1")
+    assert reloaded.status("xing", "2") == EXTERNAL
+    assert reloaded.is_known("stepstone", "1") and not reloaded.has_applied("stepstone", "1")
+    assert not reloaded.is_known("xing", "3")
+
+
+def test_an_application_is_never_downgraded(tmp_path):
+    path = str(tmp_path / "applied_jobs.jsonl")
+    store = AppliedJobsStore(path)
+    store.mark("xing", "1", APPLIED)
+    store.mark("xing", "1", EXTERNAL)
+    assert store.status("xing", "1") == APPLIED
+    # Not even by a later line written by another process.
+    with open(path, "a", encoding="utf-8") as file:
+        file.write('{"platform": "xing", "job_id": "1", "status": "external"}\n')
+    assert AppliedJobsStore(path).status("xing", "1") == APPLIED
+
+
+def test_malformed_lines_are_skipped(tmp_path):
+    path = tmp_path / "applied_jobs.jsonl"
+    path.write_text('{"platform": "xing", "job_id": "1", "status": "applied"}\nnot json\n{"platform": "xing"}\n',
+                    encoding="utf-8")
+    store = AppliedJobsStore(str(path))
+    assert len(store) == 1
+    assert store.has_applied("xing", "1")
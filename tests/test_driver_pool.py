@@ -0,0 +1,66 @@
+# tests/test_driver_pool.py
+
+import pytest
+from utils.driver_pool import DriverPool
+
+
+class FakeDriver:
+    """Just enough of a WebDriver for the pool: a health check, tabs and quit()."""
+
+    def __init__(self):
+        self.healthy = True
+        self.quit_called = False
+        self.window_handles = ["main"]
+        self.switch_to = self
+
+    def execute_script(self, script):
+        if not self.healthy:
+            raise RuntimeError("browser crashed")
+        return 1
+
+    def window(self, handle):
+        pass
+
+    def close(self):
+        self.window_handles.pop()
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def pool():
+    pool = DriverPool(max_size=2, idle_timeout=300, acquire_timeout=0.2)
+    yield pool
+    pool.close_all()
+
+
+def test_released_drivers_are_reused(pool):
+    first = pool.acquire("xing", FakeDriver)
+    first.window_handles.append("job tab")
+    pool.release(first)
+    assert pool.acquire("xing", FakeDriver) is first
+    assert first.window_handles == ["main"]  # Extra tabs were closed on release
+    assert pool.stats()["live"] == 1
+
+
+def test_unhealthy_drivers_are_replaced(pool):
+    first = pool.acquire("xing", FakeDriver)
+    pool.release(first)
+    first.healthy = False
+    second = pool.acquire("xing", FakeDriver)
+    assert second is not first
+    assert first.quit_called
+    assert pool.stats()["live"] == 1
+
+
+def test_group_limit_and_pool_size(pool):
+    pool.acquire(("stepstone", True), FakeDriver, group="stepstone", limit=1)
+    with pytest.raises(TimeoutError):
+        pool.acquire(("stepstone", False), FakeDriver, group="stepstone", limit=1)
+    idle = pool.acquire("xing", FakeDriver)
+    pool.release(idle)
+    # The pool is full, so a new key evicts the idle driver instead of waiting.
+    pool.acquire("linkedin", FakeDriver)
+    assert idle.quit_called
+    assert pool.stats() == {"live": 2, "in_use": 2, "idle": 0, "max_size": 2}
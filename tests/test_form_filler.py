@@ -0,0 +1,72 @@
+# tests/test_form_filler.py
+
+import sys
+import pytest
+from utils.form_filler import AnswerBackend, AnswerCache, ChainBackend, FormFiller, StubBackend, create_backend
+
+RESUME = {"personal_information": {"name": "Ada"}}
+
+
+def make_filler(tmp_path, backend):
+    return FormFiller(RESUME, backend, AnswerCache(str(tmp_path / "answers.json")))
+
+
+def test_repeated_questions_are_answered_from_the_cache(tmp_path):
+    backend = StubBackend({"Years of Python experience?": "5"})
+    filler = make_filler(tmp_path, backend)
+    assert filler.answer("Years of Python experience?") == "5"
+    assert filler.answer("  years of python EXPERIENCE? ") == "5"
+    assert backend.calls == 1
+    # The cache is written back and survives a restart.
+    assert make_filler(tmp_path, StubBackend()).answer("Years of Python experience?") == "5"
+
+
+def test_plan_fills_answers_only_empty_fields(tmp_path):
+    backend = StubBackend({"Work permit?": "Yes", "City": "Berlin"}, default=None)
+    labels = [
+        {"text": "Work permit?", "kind": "select", "select": 1, "options": ["Select an option", "Yes", "No"],
+         "selected": 0},
+        {"text": "Notice period", "kind": "select", "select": 2, "options": ["Select an option", "1 month"],
+         "selected": 1},
+        {"text": "City", "kind": "input", "input": 3, "value": ""},
+        {"text": "Phone", "kind": "input", "input": 4, "value": "+49 123"},
+        {"text": "Unknown question", "kind": "input", "input": 5, "value": ""},
+    ]
+    assert make_filler(tmp_path, backend).plan_fills(labels) == [
+        {"ref": 1, "option": 1, "label": "Work permit?", "value": "Yes"},
+        {"ref": 3, "value": "Berlin", "label": "City"},
+    ]
+
+
+def test_answer_backends_must_implement_answer():
+    with pytest.raises(TypeError):
+        AnswerBackend()
+
+
+def test_openai_backend_falls_back_to_offline_without_the_package(monkeypatch):
+    monkeypatch.setitem(sys.modules, "openai", None)  # Makes "from openai import ..." raise ImportError
+    backend = create_backend({"backend": "openai"}, {"llm_api_key": "key"}, {"Email": "ada@example.com"})
+    assert isinstance(backend, ChainBackend)
+    assert backend.answer("Email address", [], RESUME) == "ada@example.com"
+    assert backend.answer("Why us?", [], RESUME) is None
+
+
+def test_select_answers_are_cached_per_option_set(tmp_path):
+    backend = StubBackend({"Highest degree?": "Master"})
+    filler = make_filler(tmp_path, backend)
+    assert filler.answer("Highest degree?", ["Bachelor", "Master"]) == "Master"
+    assert filler.answer("Highest degree?", ["Bachelor", "Master"]) == "Master"
+    assert backend.calls == 1
+    # Other options: the cached answer may not fit, so the backend is asked again.
+    backend.answers["highest degree"] = "Diplom"
+    assert filler.answer("Highest degree?", ["Abitur", "Diplom"]) == "Diplom"
+    assert backend.calls == 2
+
+
+def test_select_answers_matching_no_option_are_not_cached(tmp_path):
+    backend = StubBackend({"Work permit?": "Maybe"})
+    filler = make_filler(tmp_path, backend)
+    assert filler.answer("Work permit?", ["Yes", "No"]) == "Maybe"
+    backend.answers["work permit"] = "Yes"
+    assert filler.answer("Work permit?", ["Yes", "No"]) == "Yes"
+    assert backend.calls == 2
@@ -0,0 +1,47 @@
+# tests/test_label_index.py
+
+import json
+from utils.label_index import LabelIndex, normalize_label
+
+FIELD_MAPPING = {"Vorname": "Ada", "E-Mail": "ada@example.com", "Telefonnummer": "+49 123"}
+
+
+def test_normalize_label_drops_decorations():
+    assert normalize_label("  E-Mail-Adresse *: ") == "e mail adresse"
+    assert normalize_label("Straße (optional)") == "strasse"
+    assert normalize_label("Pflichtfeld: Größe") == "groesse"
+
+
+def test_exact_and_synonym_labels_match_without_similarity():
+    index = LabelIndex(FIELD_MAPPING, unmatched_path=None)
+    assert index.get("Vorname*") == "Ada"
+    assert index.get("First name") == "Ada"
+    assert index.get("Email address (required)") == "ada@example.com"
+    assert index.get("Mobile number") == "+49 123"
+
+
+def test_similarity_threshold(tmp_path):
+    unmatched = tmp_path / "unmatched_labels.jsonl"
+    index = LabelIndex(FIELD_MAPPING, unmatched_path=str(unmatched))
+    # A small typo stays above the default 0.75 threshold...
+    assert index.match("Telefonummer") == "Telefonnummer"
+    # ...an unrelated label does not, and is recorded once for tuning the synonyms.
+    assert index.match("Lieblingsfarbe") is None
+    assert index.match("Lieblingsfarbe") is None
+    records = [json.loads(line) for line in unmatched.read_text(encoding="utf-8").splitlines()]
+    assert [record["normalized"] for record in records] == ["lieblingsfarbe"]
+
+    strict = LabelIndex(FIELD_MAPPING, min_similarity=0.95, unmatched_path=None)
+    assert strict.match("Telefonummer") is None
+    loose = LabelIndex(FIELD_MAPPING, min_similarity=0.3, unmatched_path=None)
+    assert loose.match("Telefon privat") == "Telefonnummer"
+
+
+def test_labels_as_close_to_two_fields_match_neither(tmp_path):
+    unmatched = tmp_path / "unmatched_labels.jsonl"
+    salary = {"Gehaltsrange pro Jahr (brutto) von": "50000", "Gehaltsrange pro Jahr (brutto) bis": "60000"}
+    index = LabelIndex(salary, unmatched_path=str(unmatched))
+    assert index.match("Gehaltsrange pro Jahr (brutto)") is None
+    assert "gehaltsrange pro jahr brutto" in unmatched.read_text(encoding="utf-8")
+    # A near-miss of one of them is still matched.
+    assert index.get("Gehaltsrange pro Jahr (brutto) bis in EUR") == "60000"
@@ -0,0 +1,74 @@
+# tests/test_listing_parser.py
+
+import pytest
+from utils.listing_parser import parse_listings, validate_spec
+
+XING_SPEC = {
+    "container": "ul.results li",
+    "title": "h2",
+    "company": "[data-testid='job-teaser-list-company'], p",
+    "link": "a[data-testid='job-search-result']",
+}
+STEPSTONE_SPEC = {
+    "container": ".res-1p8f8en",
+    "title": ".res-nehv70",
+    "company": "[data-at='job-item-company-name']",
+    "link": "a[data-at='job-item-title'], a[href]",
+    "easy_apply_text": "Easy Apply",
+}
+
+
+def test_reads_listing_fields_and_resolves_links():
+    html = """
+    <ul class="results">
+      <li><a data-testid="job-search-result" href="/jobs/frontend-developer-200001">
+        <h2>Frontend  Developer</h2><p data-testid="job-teaser-list-company">Acme &amp; Co</p></a></li>
+    </ul>"""
+    assert parse_listings(html, XING_SPEC, "https://www.xing.com/jobs/search?q=x") == [{
+        "id": "200001",
+        "title": "Frontend Developer",
+        "company": "Acme & Co",
+        "url": "https://www.xing.com/jobs/frontend-developer-200001",
+        "easy_apply": False,
+    }]
+
+
+def test_comma_selector_prefers_earlier_alternative_over_document_order():
+    html = """
+    <article class="res-1p8f8en">
+      <a href="/companies/acme-123456"><img src="logo.png"></a>
+      <a data-at="job-item-title" href="/stellenangebote--Frontend--300001-inline.html">
+        <h2 class="res-nehv70">Frontend Developer</h2></a>
+      <span data-at="job-item-company-name">Acme GmbH</span>
+      <span>Easy Apply</span>
+    </article>
+    <ul class="results"><li>
+      <p>Posted 2 days ago</p>
+      <a data-testid="job-search-result" href="/jobs/x-200002"><h2>Backend</h2></a>
+      <p data-testid="job-teaser-list-company">Nordlicht</p>
+    </li></ul>"""
+    stepstone = parse_listings(html, STEPSTONE_SPEC, "https://www.stepstone.de/")
+    assert stepstone[0]["url"].endswith("--300001-inline.html")
+    assert stepstone[0]["id"] == "300001"
+    assert stepstone[0]["easy_apply"] is True
+    assert parse_listings(html, XING_SPEC)[0]["company"] == "Nordlicht"
+
+
+def test_falls_back_to_later_alternative():
+    html = '<article class="res-1p8f8en"><a href="/job-400001">x</a></article>'
+    assert parse_listings(html, STEPSTONE_SPEC)[0]["id"] == "400001"
+
+
+@pytest.mark.parametrize("selector", ["li:not(.ad)", "h2 + p", "li ~ li", "a[href!='x']", " , "])
+def test_rejects_unsupported_selectors(selector):
+    with pytest.raises(ValueError):
+        parse_listings("<li></li>", {"container": selector})
+
+
+def test_validate_spec_names_the_unsupported_field():
+    validate_spec(XING_SPEC)
+    validate_spec(STEPSTONE_SPEC)
+    with pytest.raises(ValueError, match="'title'"):
+        validate_spec({**XING_SPEC, "title": "h2:first-child"})
+    with pytest.raises(ValueError, match="container"):
+        validate_spec({"title": "h2"})
@@ -0,0 +1,142 @@
+# tests/test_search_listings.py
+
+from types import SimpleNamespace
+from conftest import FakePlatform, listing
+from platforms.base import JobPlatform
+from utils import events
+
+SEARCHES = [f"https://fake.example/search?q={name}" for name in ("a", "b", "c")]
+
+
+def results():
+    return {url: [[listing(f"{index}{n}") for n in range(5)]] for index, url in enumerate(SEARCHES, start=1)}
+
+
+def run(platform, handler, concurrency):
+    heads = {}
+    with platform.search_listings(SEARCHES, heads) as crawled:
+        if concurrency > 1:
+            platform.process_concurrently(crawled, handler, concurrency)
+        else:
+            for item in crawled:
+                handler(platform, item)
+    platform.advance_watermarks(heads)
+
+
+def test_watermarks_stay_put_when_no_worker_starts(make_platform, stores, monkeypatch):
+    platform = make_platform(results(), parallel_searches=2)
+    monkeypatch.setattr(type(platform), "prepare_worker", lambda self: False)  # e.g. load_cookies() failed
+    applied = []
+
+    run(platform, lambda worker, item: applied.append(item["id"]), concurrency=2)
+
+    assert applied == []
+    for url in SEARCHES:
+        assert stores["watermarks"].get("fake", url) == frozenset()
+
+    # The next run, with working browsers, still sees every job.
+    monkeypatch.setattr(type(platform), "prepare_worker", lambda self: True)
+    rerun = make_platform(results(), parallel_searches=2)
+    run(rerun, lambda worker, item: applied.append(item["id"]), concurrency=2)
+    assert len(applied) == 15
+
+
+def test_watermarks_advance_for_consumed_searches(make_platform, stores):
+    platform = make_platform(results(), parallel_searches=2)
+    seen = []
+
+    run(platform, lambda worker, item: seen.append(item["id"]), concurrency=1)
+
+    assert len(seen) == 15
+    for index, url in enumerate(SEARCHES, start=1):
+        assert stores["watermarks"].get("fake", url) == frozenset(f"{index}{n}" for n in range(5))
+
+
+def test_partially_consumed_search_keeps_its_watermark(make_platform, stores):
+    platform = make_platform(results())
+    heads = {}
+    with platform.search_listings(SEARCHES, heads) as crawled:
+        for _ in range(7):  # all of the first search, part of the second
+            next(crawled)
+    platform.advance_watermarks(heads)
+
+    assert stores["watermarks"].get("fake", SEARCHES[0])
+    assert stores["watermarks"].get("fake", SEARCHES[1]) == frozenset()
+    assert stores["watermarks"].get("fake", SEARCHES[2]) == frozenset()
+
+
+def test_jobs_found_by_several_searches_are_handed_out_once(make_platform, stores):
+    shared = {url: [[listing("1"), listing(f"{index}0")], [listing("2")]] for index, url in enumerate(SEARCHES, start=1)}
+    platform = make_platform(shared)
+    subscription = events.bus.subscribe(last_id=events.bus.publish("test")["id"])
+    heads = {}
+    try:
+        with platform.search_listings(SEARCHES, heads) as crawled:
+            ids = [item["id"] for item in crawled]
+    finally:
+        events.bus.unsubscribe(subscription)
+
+    assert ids == ["1", "10", "2", "20", "30"]
+    duplicates = []
+    while (event := subscription.get(timeout=0)) is not None:
+        if event.get("outcome") == "duplicate":
+            duplicates.append(event["job_id"])
+    assert duplicates == ["1", "2", "1", "2"]
+    # Every search's watermark still includes the duplicates it found.
+    assert heads[SEARCHES[2]] == ["1", "30", "2"]
+
+
+def test_browser_searches_load_every_search_themselves(make_platform, stores):
+    platform = make_platform(results(), discovery="browser")
+    # Like StepStone after its login check: the browser is not on the first search.
+    platform.browser.get(platform.base_url)
+    seen = []
+
+    run(platform, lambda worker, item: seen.append(item["id"]), concurrency=1)
+
+    assert [url for url in platform.browser.visited if "&page=" not in url] == [platform.base_url, *SEARCHES]
+    assert len(seen) == 15
+    assert stores["watermarks"].get("fake", SEARCHES[0]) == frozenset(f"1{n}" for n in range(5))
+
+
+def paged_results():
+    search = SEARCHES[0]
+    pages = [["1", "2"], ["3"], ["3"], ["4"]]  # Past the last page the site repeats it
+    return {search if page == 1 else f"{search}&page={page}": [[listing(job_id) for job_id in ids]]
+            for page, ids in enumerate(pages, start=1)}
+
+
+def test_browser_paging_stops_at_a_repeated_page(make_platform, stores):
+    platform = make_platform(paged_results(), discovery="browser", max_pages=4)
+    with platform.search_listings(SEARCHES[:1], {}) as crawled:
+        assert [item["id"] for item in crawled] == ["1", "2", "3"]
+    assert platform.browser.visited[-1] == f"{SEARCHES[0]}&page=3"
+
+
+def test_http_paging_stops_at_a_repeated_page(make_platform, stores, monkeypatch):
+    pages = paged_results()
+    monkeypatch.setattr(FakePlatform, "http_result_batches", JobPlatform.http_result_batches)
+    fetched = []
+
+    def listings(url, spec):
+        fetched.append(url)
+        return pages[url][0]
+
+    monkeypatch.setattr(FakePlatform, "discovery", SimpleNamespace(listings=listings))
+    platform = make_platform(pages, max_pages=4)
+    with platform.search_listings(SEARCHES[:1], {}) as crawled:
+        assert [item["id"] for item in crawled] == ["1", "2", "3"]
+    assert len(fetched) == 3
+
+
+def test_browser_prefetch_without_more_pages_forks_no_browser(make_platform, stores, monkeypatch):
+    def fork(self):
+        raise AssertionError("no second page to prefetch")
+
+    monkeypatch.setattr(FakePlatform, "fork", fork)
+    single_page = make_platform(results(), discovery="browser", prefetch=True, max_pages=1)
+    monkeypatch.setattr(FakePlatform, "search_page_url", lambda self, search_url, page: None)
+    no_paging = make_platform(results(), discovery="browser", prefetch=True, max_pages=3)
+    for platform in (single_page, no_paging):
+        with platform.search_listings(SEARCHES, {}) as crawled:
+            assert len(list(crawled)) == 15
@@ -0,0 +1,33 @@
+# tests/test_search_planner.py
+
+from types import SimpleNamespace
+from utils.search_planner import SearchQuery, plan_searches
+
+
+def test_preference_query_comes_first_and_the_matrix_adds_to_it():
+    settings = SimpleNamespace(positions=("Frontend Developer", "full  stack"), locations=("Berlin",))
+    preferences = {"job_title": "Full Stack", "location": "Germany"}
+    assert plan_searches(settings, preferences) == [
+        SearchQuery("Full Stack", "Germany"),
+        SearchQuery("Frontend Developer", "Berlin"),
+        SearchQuery("full stack", "Berlin"),
+    ]
+
+
+def test_empty_lists_take_the_preference_values():
+    settings = SimpleNamespace(positions=("Backend Developer",), locations=())
+    preferences = {"job_title": "Full Stack", "location": "Germany"}
+    assert plan_searches(settings, preferences) == [
+        SearchQuery("Full Stack", "Germany"),
+        SearchQuery("Backend Developer", "Germany"),
+    ]
+    assert plan_searches(SimpleNamespace(positions=(), locations=()), preferences) == [
+        SearchQuery("Full Stack", "Germany"),
+    ]
+
+
+def test_blank_job_title_adds_no_query_of_its_own():
+    settings = SimpleNamespace(positions=("Backend Developer",), locations=("Berlin",))
+    assert plan_searches(settings, {"job_title": " ", "location": "Germany"}) == [
+        SearchQuery("Backend Developer", "Berlin"),
+    ]
@@ -0,0 +1,86 @@
+# tests/test_session_status.py
+
+import os
+import pickle
+import time
+import pytest
+import requests
+from utils.cookie_store import EXPIRED, MISSING, REJECTED, UNVERIFIED, VALID, CookieStore
+from utils.http_discovery import HttpDiscovery
+
+DAY = 24 * 3600
+
+
+def cookie(name, expiry=None):
+    return {"name": name, "value": "x", "domain": ".xing.com", "path": "/", **({"expiry": expiry} if expiry else {})}
+
+
+def test_expiry_follows_the_login_cookie_not_tracking_cookies(tmp_path):
+    store = CookieStore(str(tmp_path))
+    now = 1_000_000_000
+    cookies = [cookie("login", now + 2 * DAY), cookie("tracking", now + 365 * DAY)]
+    assert store._expires_at(cookies, ("login",), now) == now + 2 * DAY
+    # Without known login cookies the session is only trusted for max_age.
+    assert store._expires_at(cookies, (), now) == now + store.max_age
+
+
+def test_missing_login_cookie_means_expired(tmp_path):
+    store = CookieStore(str(tmp_path))
+    store.save("xing", [cookie("tracking")], session_cookies=("login",))
+    assert store.status("xing").reason == EXPIRED
+
+
+def test_legacy_pickles_keep_their_age_and_login_cookies(tmp_path):
+    store = CookieStore(str(tmp_path))
+    store.set_session_cookies("xing", ("login",))
+    legacy = tmp_path / "xing.pkl"
+    legacy.write_bytes(pickle.dumps([cookie("login"), cookie("tracking", time.time() + 365 * DAY)]))
+    saved_at = time.time() - 40 * DAY
+    os.utime(legacy, (saved_at, saved_at))
+
+    status = store.status("xing")
+    assert status.reason == EXPIRED
+    assert status.expires_at == pytest.approx(saved_at + store.max_age)
+    assert not legacy.exists()
+
+
+def test_unreadable_legacy_pickles_do_not_break_status(tmp_path):
+    store = CookieStore(str(tmp_path))
+    (tmp_path / "xing.pkl").write_bytes(b"\x80\x04garbage")
+    assert store.status("xing").reason == MISSING
+
+
+class FakeResponse:
+    def __init__(self, status_code, location=None):
+        self.status_code = status_code
+        self.url = "https://www.xing.com/jobs/my-jobs"
+        self.headers = {"Location": location} if location else {}
+        self.is_redirect = location is not None
+
+
+@pytest.mark.parametrize("response, reason", [
+    (FakeResponse(200), VALID),
+    (FakeResponse(401), REJECTED),
+    (FakeResponse(302, "https://login.xing.com/?dest=jobs"), REJECTED),
+    (FakeResponse(302, "/signin?next=/jobs/my-jobs"), REJECTED),
+    (FakeResponse(301, "https://www.xing.com/jobs/my-jobs/"), UNVERIFIED),
+    (FakeResponse(403), UNVERIFIED),
+    (FakeResponse(429), UNVERIFIED),
+    (FakeResponse(503), UNVERIFIED),
+])
+def test_probe_rejects_only_login_redirects_and_401(tmp_path, monkeypatch, response, reason):
+    discovery = HttpDiscovery("xing", CookieStore(str(tmp_path)))
+    monkeypatch.setattr(discovery.session, "get", lambda url, **kwargs: response)
+    status = discovery.probe(response.url)
+    assert status.reason == reason
+    assert bool(status) == (reason != REJECTED)
+
+
+def test_probe_is_unverified_when_the_request_fails(tmp_path, monkeypatch):
+    discovery = HttpDiscovery("xing", CookieStore(str(tmp_path)))
+
+    def fail(url, **kwargs):
+        raise requests.ConnectionError("offline")
+
+    monkeypatch.setattr(discovery.session, "get", fail)
+    assert discovery.probe("https://www.xing.com/jobs/my-jobs").reason == UNVERIFIED
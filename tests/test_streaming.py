@@ -0,0 +1,64 @@
+# tests/test_streaming.py
+
+import threading
+import pytest
+from utils.streaming import ListingStream, Prefetcher
+
+
+def counting(produced, closed, limit=1000):
+    """Yield 0, 1, 2... recording each item produced and whether the generator was closed."""
+    try:
+        for item in range(limit):
+            produced.append(item)
+            yield item
+    finally:
+        closed.set()
+
+
+def test_prefetcher_merges_all_producers():
+    prefetcher = Prefetcher(iter([1, 2, 3]), iter([4, 5]), depth=2)
+    assert sorted(prefetcher) == [1, 2, 3, 4, 5]
+
+
+def test_close_before_reading_stops_the_producer():
+    produced, closed = [], threading.Event()
+    prefetcher = Prefetcher(counting(produced, closed), depth=1)
+    prefetcher.close()
+    assert closed.wait(2)
+    # Only the item in the buffer and the one waiting to go in were produced.
+    assert len(produced) <= 2
+    assert list(prefetcher) == []
+
+
+def test_close_mid_stream_cancels_the_producer():
+    produced, closed = [], threading.Event()
+    prefetcher = Prefetcher(counting(produced, closed), depth=1)
+    assert [next(prefetcher) for _ in range(3)] == [0, 1, 2]
+    prefetcher.close()
+    assert closed.wait(2)
+    assert len(produced) < 10
+    with pytest.raises(StopIteration):
+        next(prefetcher)
+
+
+def test_producer_errors_reach_the_consumer():
+    def failing():
+        yield 1
+        raise RuntimeError("page failed")
+
+    prefetcher = Prefetcher(failing())
+    assert next(prefetcher) == 1
+    with pytest.raises(RuntimeError, match="page failed"):
+        next(prefetcher)
+
+
+def test_listing_stream_keeps_head_ids_and_closes_its_source():
+    produced, closed = [], threading.Event()
+    on_close = []
+    listings = ({"id": str(item)} for item in counting(produced, closed))
+    with ListingStream(listings, keep=2, on_close=lambda: on_close.append(True)) as stream:
+        assert [next(stream)["id"] for _ in range(3)] == ["0", "1", "2"]
+    assert stream.head_ids == ["0", "1"]
+    assert on_close == [True]
+    # Nothing beyond what was pulled was crawled.
+    assert produced == [0, 1, 2]
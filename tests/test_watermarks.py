@@ -0,0 +1,43 @@
+# tests/test_watermarks.py
+
+from conftest import listing
+from utils.watermarks import WatermarkStore
+
+SEARCH = "https://fake.example/search?q=a"
+
+
+def test_newest_ids_go_first_and_the_mark_is_capped(tmp_path):
+    path = str(tmp_path / "watermarks.json")
+    store = WatermarkStore(path, size=4)
+    store.update("xing", SEARCH, ["3", "2", "1"])
+    store.update("xing", SEARCH, ["5", "4", "3", ""])
+
+    reloaded = WatermarkStore(path, size=4)
+    assert reloaded.get("xing", SEARCH) == frozenset({"5", "4", "3", "2"})
+    assert reloaded.get("stepstone", SEARCH) == frozenset()
+
+
+def test_crawl_stops_after_known_listings_in_a_row(make_platform, stores):
+    stores["watermarks"].update("fake", SEARCH, ["3", "2", "1", "0"])
+    pages_fetched = []
+
+    def pages():
+        for page in ([listing("5"), listing("3"), listing("4")], [listing("2"), listing("1"), listing("0")],
+                     [listing("-1")]):
+            pages_fetched.append(page)
+            yield page
+
+    platform = make_platform({SEARCH: pages()}, stop_after_known=3)
+    with platform.crawl_listings(SEARCH) as crawled:
+        ids = [item["id"] for item in crawled]
+
+    # A single known listing ("3", e.g. a promoted one) does not stop the crawl; three in a row do.
+    assert ids == ["5", "4"]
+    assert len(pages_fetched) == 2
+
+
+def test_full_crawl_when_not_incremental(make_platform, stores):
+    stores["watermarks"].update("fake", SEARCH, ["2", "1"])
+    platform = make_platform({SEARCH: [[listing("3"), listing("2"), listing("1")]]}, incremental=False)
+    with platform.crawl_listings(SEARCH) as crawled:
+        assert [item["id"] for item in crawled] == ["3", "2", "1"]
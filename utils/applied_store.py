@@ -0,0 +1,90 @@
+# utils/applied_store.py
+
+import json
+import os
+import threading
+from datetime import datetime
+from loguru import logger
+
+DEFAULT_PATH = "user_data/applied_jobs.jsonl"
+
+APPLIED = "applied"
+EXTERNAL = "external"
+NO_EASY_APPLY = "no_easy_apply"
+
+
+class AppliedJobsStore:
+    """Append-only log of applied and seen job IDs per platform, indexed in memory.
+
+    Every outcome is appended as one JSON line, so writes are cheap and crash-safe.
+    On startup the log is replayed into a dict keyed by ``(platform, job_id)``,
+    which makes the "have we seen this job?" check O(1) before any tab is opened.
+    """
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self._index = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as file:
+            for line_number, line in enumerate(file, start=1):
+                try:
+                    record = json.loads(line)
+                    key = (record["platform"], record["job_id"])
+                except (ValueError, KeyError):
+                    logger.warning(f"Ignoring malformed line {line_number} in {self.path}.")
+                    continue
+                # An application is final; later "seen" records never downgrade it.
+                if self._index.get(key) != APPLIED:
+                    self._index[key] = record.get("status", APPLIED)
+        logger.debug(f"Loaded {len(self._index)} known jobs from {self.path}.")
+
+    def status(self, platform, job_id):
+        """Return the recorded status for a job, or None if it was never seen."""
+        return self._index.get((platform, job_id))
+
+    def has_applied(self, platform, job_id) -> bool:
+        return self.status(platform, job_id) == APPLIED
+
+    def is_known(self, platform, job_id) -> bool:
+        """True if the job was applied to or already ruled out on an earlier run."""
+        return (platform, job_id) in self._index
+
+    def mark(self, platform, job_id, status=APPLIED, url=None):
+        """Record an outcome for a job and append it to the log."""
+        if not job_id:
+            return
+        record = {
+            "platform": platform,
+            "job_id": job_id,
+            "status": status,
+            "url": url,
+            "at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        with self._lock:
+            if self._index.get((platform, job_id)) == APPLIED and status != APPLIED:
+                return
+            self._index[(platform, job_id)] = status
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as file:
+                file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def __len__(self):
+        return len(self._index)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_applied_store(path=DEFAULT_PATH) -> AppliedJobsStore:
+    """Return the process-wide store, loading the log on first use."""
+    global _store
+    with _store_lock:
+        if _store is None or _store.path != path:
+            _store = AppliedJobsStore(path)
+        return _store
@@ -0,0 +1,81 @@
+# utils/automation.py
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from loguru import logger
+
+
+class AutomationEngine:
+    """Run each logged-in platform's pipeline concurrently in the background.
+
+    One worker per platform, bounded by ``max_workers``. A cycle lasts as long as
+    the slowest platform. ``stop()`` sets a shared event that the platforms check
+    between listings, so cancellation is cooperative rather than abrupt.
+    """
+
+    def __init__(self, config, platform_classes, max_workers=None, cycle_interval=None):
+        self.config = config
+        self.platform_classes = platform_classes
+        self.max_workers = max_workers
+        self.cycle_interval = cycle_interval
+        self.last_cycle_seconds = None
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self, platform_names) -> bool:
+        """Start the scheduler thread for the given platforms. Returns False if already running."""
+        with self._lock:
+            if self.is_running():
+                return False
+            platform_names = [name for name in platform_names if name in self.platform_classes]
+            if not platform_names:
+                return False
+            self._stop_event = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run, args=(platform_names, self._stop_event), name="automation", daemon=True
+            )
+            self._thread.start()
+            return True
+
+    def stop(self) -> bool:
+        """Request cancellation. Returns False if nothing was running."""
+        with self._lock:
+            if not self.is_running():
+                return False
+            self._stop_event.set()
+            return True
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self, platform_names, stop_event):
+        workers = min(self.max_workers or len(platform_names), len(platform_names))
+        logger.info(f"Automation started for {', '.join(platform_names)} with {workers} worker(s).")
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="platform") as executor:
+            while not stop_event.is_set():
+                started = time.monotonic()
+                futures = [
+                    executor.submit(self._run_platform, name, stop_event) for name in platform_names
+                ]
+                wait(futures)
+                self.last_cycle_seconds = time.monotonic() - started
+                logger.info(f"Automation cycle finished in {self.last_cycle_seconds:.1f}s.")
+
+                if not self.cycle_interval:
+                    break
+                stop_event.wait(self.cycle_interval)
+
+        logger.info("Automation stopped.")
+
+    def _run_platform(self, name, stop_event):
+        platform = self.platform_classes[name](self.config)
+        platform.stop_event = stop_event
+        try:
+            platform.apply_jobs()
+        except Exception as e:
+            logger.error(f"Automation for {name} failed: {e}")
+        finally:
+            platform.quit_browser()
@@ -0,0 +1,202 @@
+# utils/cookie_store.py
+
+import json
+import os
+import pickle
+import threading
+import time
+from loguru import logger
+
+DEFAULT_DIRECTORY = "cookies"
+DEFAULT_MAX_AGE = 30 * 24 * 3600  # Sessions are not trusted longer than this, whatever the cookies say
+
+VALID = "valid"
+MISSING = "missing"
+EXPIRED = "expired"
+REJECTED = "rejected"  # The site did not accept the saved cookies
+UNVERIFIED = "unverified"  # Not expired, but the probe request could not be made
+
+
+class SessionStatus:
+    """Whether a saved login is usable, why (``reason``) and when it expires (epoch seconds)."""
+
+    __slots__ = ("ok", "reason", "expires_at")
+
+    def __init__(self, ok, reason, expires_at=None):
+        self.ok = ok
+        self.reason = reason
+        self.expires_at = expires_at
+
+    def __bool__(self):
+        return self.ok
+
+    def __repr__(self):
+        return f"SessionStatus(ok={self.ok}, reason={self.reason!r})"
+
+
+class CookieStore:
+    """Browser sessions saved per platform as JSON, with expiry metadata.
+
+    ``<directory>/<platform>.json`` holds the cookies as WebDriver returned them,
+    when they were saved and when the session expires: when the first of the
+    platform's login cookies expires, capped at ``max_age``. Other cookies
+    (consent, tracking...) often outlive the login, so they are never used; if the
+    login cookies are unknown the session is trusted for ``max_age``. Old pickled
+    ``.pkl`` files are converted on first read and then removed; they count as
+    saved when the file was last written, with the login cookies registered
+    through ``set_session_cookies()``.
+    """
+
+    def __init__(self, directory=DEFAULT_DIRECTORY, max_age=DEFAULT_MAX_AGE):
+        self.directory = directory
+        self.max_age = max_age
+        self.session_cookies = {}  # platform -> names of its login cookies
+        self._records = {}  # platform -> (file mtime, record)
+        self._lock = threading.Lock()
+        self._migrate_lock = threading.Lock()
+
+    def path(self, platform) -> str:
+        return os.path.join(self.directory, f"{platform}.json")
+
+    def legacy_path(self, platform) -> str:
+        return os.path.join(self.directory, f"{platform}.pkl")
+
+    def set_session_cookies(self, platform, names):
+        """Register the names of ``platform``'s login cookies, for converting old cookie files."""
+        self.session_cookies[platform] = tuple(names)
+
+    def save(self, platform, cookies, session_cookies=(), saved_at=None):
+        """Store ``cookies`` (from ``driver.get_cookies()``) for ``platform``."""
+        saved_at = saved_at or time.time()
+        record = {
+            "platform": platform,
+            "saved_at": saved_at,
+            "expires_at": self._expires_at(cookies, session_cookies, saved_at),
+            "session_cookies": list(session_cookies),
+            "cookies": list(cookies),
+        }
+        path = self.path(platform)
+        os.makedirs(self.directory, exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(record, file, indent=2, ensure_ascii=False)
+        os.replace(temp_path, path)
+        with self._lock:
+            self._records[platform] = (os.path.getmtime(path), record)
+
+    def _expires_at(self, cookies, session_cookies, saved_at) -> float:
+        limit = saved_at + self.max_age
+        if not session_cookies:
+            return limit
+        expiries = {cookie["name"]: cookie.get("expiry") for cookie in cookies if cookie["name"] in session_cookies}
+        missing = set(session_cookies) - set(expiries)
+        if missing:
+            # The session was never established (or the site renamed its login cookie).
+            logger.warning(f"Login cookie(s) {', '.join(sorted(missing))} missing; the saved session counts as expired.")
+            return saved_at
+        # Login cookies without an expiry live as long as the browser session; trust them up to max_age.
+        return min([expiry for expiry in expiries.values() if expiry] + [limit])
+
+    def version(self, platform):
+        """Modification time of the platform's saved session, or None if there is none."""
+        self._migrate(platform)
+        try:
+            return os.path.getmtime(self.path(platform))
+        except OSError:
+            return None
+
+    def record(self, platform):
+        """The saved session record for ``platform``, or None. Reads the file only when it changed."""
+        mtime = self.version(platform)
+        if mtime is None:
+            return None
+        with self._lock:
+            cached = self._records.get(platform)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+        try:
+            with open(self.path(platform), "r", encoding="utf-8") as file:
+                record = json.load(file)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cookie file {self.path(platform)}: {e}")
+            return None
+        with self._lock:
+            self._records[platform] = (mtime, record)
+        return record
+
+    def load(self, platform) -> list:
+        """The saved cookies for ``platform`` (empty if there are none)."""
+        record = self.record(platform)
+        return list(record["cookies"]) if record else []
+
+    def status(self, platform, now=None) -> SessionStatus:
+        """Check the saved session's expiry without any network request."""
+        record = self.record(platform)
+        if record is None or not record.get("cookies"):
+            return SessionStatus(False, MISSING)
+        expires_at = record.get("expires_at") or record["saved_at"] + self.max_age
+        if expires_at <= (now or time.time()):
+            return SessionStatus(False, EXPIRED, expires_at)
+        return SessionStatus(True, VALID, expires_at)
+
+    def _migrate(self, platform):
+        """Convert a pickled cookie file from older versions to JSON."""
+        legacy_path = self.legacy_path(platform)
+        if not os.path.exists(legacy_path):
+            return
+        with self._migrate_lock:
+            if not os.path.exists(legacy_path) or os.path.exists(self.path(platform)):
+                return
+            try:
+                with open(legacy_path, "rb") as file:
+                    cookies = pickle.load(file)
+                # The session is as old as the file, not as the conversion.
+                saved_at = os.path.getmtime(legacy_path)
+                self.save(platform, cookies, self.session_cookies.get(platform, ()), saved_at=saved_at)
+                os.remove(legacy_path)
+                logger.info(f"Converted {legacy_path} to {self.path(platform)}.")
+            except Exception as e:  # Unpickling can raise almost anything; a bad file must not break callers
+                logger.warning(f"Could not convert {legacy_path}: {e}")
+
+
+# WebDriver cookie dicts use different keys and values than CDP's Network.CookieParam.
+_SAME_SITE = {"strict": "Strict", "lax": "Lax", "none": "None"}
+
+
+def to_cdp_cookies(cookies, url) -> list:
+    """Convert ``driver.get_cookies()`` dicts for ``Network.setCookies``.
+
+    Cookies keep their domain, so cookies set for a parent domain reach every
+    subdomain; cookies without one are bound to ``url``.
+    """
+    params = []
+    for cookie in cookies:
+        param = {"name": cookie["name"], "value": cookie["value"], "path": cookie.get("path", "/")}
+        if cookie.get("domain"):
+            param["domain"] = cookie["domain"]
+        else:
+            param["url"] = url
+        if cookie.get("secure"):
+            param["secure"] = True
+        if cookie.get("httpOnly"):
+            param["httpOnly"] = True
+        if cookie.get("expiry"):
+            param["expires"] = cookie["expiry"]
+        same_site = _SAME_SITE.get(str(cookie.get("sameSite", "")).lower())
+        if same_site:
+            param["sameSite"] = same_site
+        params.append(param)
+    return params
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_cookie_store(directory=DEFAULT_DIRECTORY) -> CookieStore:
+    """Return the process-wide cookie store."""
+    global _store
+    with _store_lock:
+        if _store is None or _store.directory != directory:
+            _store = CookieStore(directory)
+        return _store
@@ -0,0 +1,268 @@
+# utils/driver_pool.py
+
+import atexit
+import threading
+import time
+from loguru import logger
+
+
+class PooledDriver:
+    """Bookkeeping for one live WebDriver owned by the pool."""
+
+    __slots__ = ("driver", "key", "group", "created_at", "last_used")
+
+    def __init__(self, driver, key, group):
+        self.driver = driver
+        self.key = key
+        self.group = group
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+
+class DriverPool:
+    """Process-wide pool of warm Chrome sessions with checkout/return semantics.
+
+    Drivers are pooled per ``key`` (e.g. platform + headless flag) and counted per
+    ``group`` so that a platform can cap how many Chrome processes it holds at once.
+    Idle drivers are health-checked before reuse and evicted after ``idle_timeout``.
+    """
+
+    def __init__(self, max_size=4, idle_timeout=300, acquire_timeout=120):
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.acquire_timeout = acquire_timeout
+        self._idle = {}  # key -> [PooledDriver], most recently used last
+        self._in_use = {}  # id(driver) -> PooledDriver
+        self._live = 0
+        self._live_per_group = {}
+        self._cond = threading.Condition()
+        self._reaper = None
+        self._closed = False
+
+    def configure(self, max_size=None, idle_timeout=None, acquire_timeout=None):
+        """Update pool limits, typically from the ``driver_pool`` config section."""
+        with self._cond:
+            if max_size is not None:
+                self.max_size = int(max_size)
+            if idle_timeout is not None:
+                self.idle_timeout = float(idle_timeout)
+            if acquire_timeout is not None:
+                self.acquire_timeout = float(acquire_timeout)
+            self._cond.notify_all()
+
+    def acquire(self, key, factory, group=None, limit=None):
+        """Check out a healthy driver for ``key``, creating one with ``factory`` if needed."""
+        group = key if group is None else group
+        deadline = time.monotonic() + self.acquire_timeout
+
+        while True:
+            entry, stale = self._reserve(key, group, limit, deadline)
+            self._quit_all(stale)
+
+            if entry is None:
+                try:
+                    driver = factory()
+                except Exception:
+                    with self._cond:
+                        self._forget_locked(group)
+                    raise
+                entry = PooledDriver(driver, key, group)
+                with self._cond:
+                    self._in_use[id(driver)] = entry
+                self._ensure_reaper()
+                logger.debug(f"Started new browser for pool key {key!r}.")
+                return driver
+
+            if self._is_healthy(entry.driver):
+                with self._cond:
+                    self._in_use[id(entry.driver)] = entry
+                logger.debug(f"Reusing warm browser for pool key {key!r}.")
+                return entry.driver
+
+            logger.warning(f"Pooled browser for {key!r} failed its health check. Replacing it.")
+            self._discard(entry)
+
+    def release(self, driver, discard=False):
+        """Return a checked-out driver to the pool, or quit it when ``discard`` is set."""
+        with self._cond:
+            entry = self._in_use.pop(id(driver), None)
+
+        if entry is None:
+            # Not one of ours; just shut it down.
+            self._quit_driver(driver)
+            return
+
+        if discard or self._closed or not self._reset(driver):
+            self._discard(entry)
+            return
+
+        entry.last_used = time.monotonic()
+        with self._cond:
+            self._idle.setdefault(entry.key, []).append(entry)
+            self._cond.notify_all()
+
+    def prewarm(self, key, factory, count=1, group=None, limit=None):
+        """Start drivers ahead of time so the first checkout does not pay a cold start."""
+        drivers = []
+        try:
+            for _ in range(count):
+                drivers.append(self.acquire(key, factory, group=group, limit=limit))
+        finally:
+            for driver in drivers:
+                self.release(driver)
+
+    def evict_idle(self):
+        """Quit drivers that have been idle longer than ``idle_timeout``."""
+        with self._cond:
+            stale = self._evict_expired_locked()
+        self._quit_all(stale)
+        return len(stale)
+
+    def close_all(self):
+        """Quit every idle driver and refuse further checkouts."""
+        with self._cond:
+            self._closed = True
+            stale = [entry for entries in self._idle.values() for entry in entries]
+            self._idle.clear()
+            for entry in stale:
+                self._forget_locked(entry.group)
+            self._cond.notify_all()
+        self._quit_all(stale)
+
+    def stats(self) -> dict:
+        """Return a snapshot of pool occupancy."""
+        with self._cond:
+            return {
+                "live": self._live,
+                "in_use": len(self._in_use),
+                "idle": sum(len(entries) for entries in self._idle.values()),
+                "max_size": self.max_size,
+            }
+
+    def _reserve(self, key, group, limit, deadline):
+        """Pop an idle entry for ``key`` or reserve a slot for a new driver."""
+        stale = []
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Driver pool is closed.")
+
+                stale.extend(self._evict_expired_locked())
+
+                idle = self._idle.get(key)
+                if idle:
+                    return idle.pop(), stale
+
+                group_full = limit is not None and self._live_per_group.get(group, 0) >= limit
+                pool_full = self._live >= self.max_size
+
+                if not group_full and not pool_full:
+                    self._live += 1
+                    self._live_per_group[group] = self._live_per_group.get(group, 0) + 1
+                    return None, stale
+
+                # Make room by evicting the least recently used idle driver that blocks us.
+                victim = self._pop_lru_idle_locked(group if group_full else None)
+                if victim is not None:
+                    stale.append(victim)
+                    continue
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"Timed out waiting for a free browser for {key!r}.")
+                self._cond.wait(remaining)
+
+    def _evict_expired_locked(self):
+        now = time.monotonic()
+        stale = []
+        for key, entries in list(self._idle.items()):
+            keep = [entry for entry in entries if now - entry.last_used < self.idle_timeout]
+            stale.extend(entry for entry in entries if now - entry.last_used >= self.idle_timeout)
+            if keep:
+                self._idle[key] = keep
+            else:
+                del self._idle[key]
+        for entry in stale:
+            self._forget_locked(entry.group)
+        return stale
+
+    def _pop_lru_idle_locked(self, group=None):
+        candidates = [
+            entry for entries in self._idle.values() for entry in entries
+            if group is None or entry.group == group
+        ]
+        if not candidates:
+            return None
+        victim = min(candidates, key=lambda entry: entry.last_used)
+        self._idle[victim.key].remove(victim)
+        if not self._idle[victim.key]:
+            del self._idle[victim.key]
+        self._forget_locked(victim.group)
+        return victim
+
+    def _forget_locked(self, group):
+        self._live -= 1
+        remaining = self._live_per_group.get(group, 1) - 1
+        if remaining > 0:
+            self._live_per_group[group] = remaining
+        else:
+            self._live_per_group.pop(group, None)
+        self._cond.notify_all()
+
+    def _discard(self, entry):
+        """Quit a driver that still holds a slot and free that slot."""
+        self._quit_driver(entry.driver)
+        with self._cond:
+            self._forget_locked(entry.group)
+
+    def _quit_all(self, entries):
+        """Quit drivers whose slots were already released under the lock."""
+        for entry in entries:
+            self._quit_driver(entry.driver)
+
+    def _ensure_reaper(self):
+        with self._cond:
+            if self._reaper is not None and self._reaper.is_alive():
+                return
+            self._reaper = threading.Thread(target=self._reap_forever, name="driver-pool-reaper", daemon=True)
+            self._reaper.start()
+
+    def _reap_forever(self):
+        while not self._closed:
+            time.sleep(max(self.idle_timeout / 2, 1))
+            evicted = self.evict_idle()
+            if evicted:
+                logger.debug(f"Evicted {evicted} idle browser(s) from the driver pool.")
+
+    @staticmethod
+    def _is_healthy(driver) -> bool:
+        try:
+            driver.execute_script("return 1;")
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _reset(driver) -> bool:
+        """Close extra tabs so the next user starts from a single window."""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            return True
+        except Exception as e:
+            logger.warning(f"Could not reset pooled browser, discarding it: {e}")
+            return False
+
+    @staticmethod
+    def _quit_driver(driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"Ignoring error while quitting browser: {e}")
+
+
+driver_pool = DriverPool()
+atexit.register(driver_pool.close_all)
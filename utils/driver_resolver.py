@@ -0,0 +1,151 @@
+# utils/driver_resolver.py
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import threading
+from loguru import logger
+
+CACHE_FILE = "user_data/chromedriver.json"
+
+CHROME_BINARIES = [
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+]
+
+_lock = threading.Lock()
+_resolved = {}  # chrome binary -> chromedriver path, resolved once per process
+
+
+def resolve_chromedriver(browser_config=None) -> str:
+    """Return a chromedriver path, resolving and persisting it at most once.
+
+    Resolution order:
+    1. ``chromedriver_path`` in the browser config or the ``CHROMEDRIVER_PATH`` env var.
+    2. The cached path in ``user_data/chromedriver.json`` if its fingerprint still matches.
+    3. ``ChromeDriverManager().install()`` (skipped when ``offline`` is set), then cached.
+    4. A ``chromedriver`` binary on ``PATH``.
+    """
+    browser_config = browser_config or {}
+    configured = browser_config.get("chromedriver_path") or os.environ.get("CHROMEDRIVER_PATH")
+    if configured:
+        if not os.path.isfile(configured):
+            raise FileNotFoundError(f"Configured chromedriver not found: {configured}")
+        return configured
+
+    chrome_binary = browser_config.get("chrome_binary")
+    with _lock:
+        if chrome_binary in _resolved:
+            return _resolved[chrome_binary]
+
+        cache_file = browser_config.get("driver_cache_file", CACHE_FILE)
+        chrome_version = detect_chrome_version(chrome_binary)
+        cached = _load_cache(cache_file)
+
+        if cached and _fingerprint_matches(cached, chrome_version):
+            logger.debug(f"Using cached chromedriver: {cached['path']}")
+            _resolved[chrome_binary] = cached["path"]
+            return cached["path"]
+
+        path = None
+        if not browser_config.get("offline", False):
+            path = _install_with_manager()
+        if path:
+            _save_cache(cache_file, path, chrome_version)
+        else:
+            path = _fallback_path(cached)
+
+        _resolved[chrome_binary] = path
+        return path
+
+
+def detect_chrome_version(chrome_binary=None):
+    """Return the installed Chrome major version (e.g. ``"131"``) without network access."""
+    candidates = [chrome_binary] if chrome_binary else CHROME_BINARIES
+    for candidate in candidates:
+        binary = candidate if os.path.isfile(candidate) else shutil.which(candidate)
+        if not binary:
+            continue
+        try:
+            output = subprocess.run(
+                [binary, "--version"], capture_output=True, text=True, timeout=10
+            ).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = re.search(r"(\d+)\.\d+\.\d+", output)
+        if match:
+            return match.group(1)
+    return None
+
+
+def _fingerprint(path, chrome_version) -> dict:
+    stat = os.stat(path)
+    return {
+        "path": path,
+        "chrome_version": chrome_version,
+        "size": stat.st_size,
+        "mtime": int(stat.st_mtime),
+    }
+
+
+def _fingerprint_matches(cached, chrome_version) -> bool:
+    path = cached.get("path")
+    if not path or not os.path.isfile(path):
+        return False
+    try:
+        current = _fingerprint(path, chrome_version)
+    except OSError:
+        return False
+    if current["size"] != cached.get("size") or current["mtime"] != cached.get("mtime"):
+        return False
+    # An unknown Chrome version (e.g. detection unsupported on this OS) keeps the cache usable.
+    return chrome_version is None or cached.get("chrome_version") in (None, chrome_version)
+
+
+def _load_cache(cache_file):
+    try:
+        with open(cache_file, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_cache(cache_file, path, chrome_version):
+    try:
+        os.makedirs(os.path.dirname(cache_file) or ".", exist_ok=True)
+        with open(cache_file, "w", encoding="utf-8") as file:
+            json.dump(_fingerprint(path, chrome_version), file, indent=2)
+    except OSError as e:
+        logger.warning(f"Could not persist chromedriver cache: {e}")
+
+
+def _install_with_manager():
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        path = ChromeDriverManager().install()
+        logger.info(f"Resolved chromedriver via webdriver-manager: {path}")
+        return path
+    except Exception as e:
+        logger.warning(f"webdriver-manager could not resolve chromedriver: {e}")
+        return None
+
+
+def _fallback_path(cached):
+    """Use a previously cached or locally installed binary without any network access."""
+    if cached and cached.get("path") and os.path.isfile(cached["path"]):
+        logger.warning(f"Falling back to previously cached chromedriver: {cached['path']}")
+        return cached["path"]
+    local = shutil.which("chromedriver")
+    if local:
+        logger.warning(f"Falling back to chromedriver on PATH: {local}")
+        return local
+    raise RuntimeError(
+        "Could not resolve chromedriver. Set browser.chromedriver_path in the config "
+        "or the CHROMEDRIVER_PATH environment variable."
+    )
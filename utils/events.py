@@ -0,0 +1,88 @@
+# utils/events.py
+
+import json
+import queue
+import threading
+import time
+from collections import deque
+
+QUEUED = "queued"
+SKIPPED = "skipped"
+APPLIED = "applied"
+FAILED = "failed"
+TIMING = "timing"
+
+
+class Subscription:
+    """One subscriber's queue of events. If it falls behind, the oldest events are dropped."""
+
+    def __init__(self, max_queue):
+        self._queue = queue.Queue(maxsize=max_queue)
+        self.dropped = 0
+
+    def put(self, event):
+        while True:
+            try:
+                self._queue.put_nowait(event)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+    def get(self, timeout=None):
+        """Next event, or None if nothing was published within ``timeout`` seconds."""
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class EventBus:
+    """In-process publish/subscribe for pipeline events (queued, skipped, applied, failed, timing).
+
+    ``publish()`` never blocks the platform threads: every subscriber has its own
+    bounded queue. The last ``history`` events are kept so a new subscriber (or a
+    reconnecting one, by last event ID) starts with recent activity.
+    """
+
+    def __init__(self, history=200, max_queue=1000):
+        self.max_queue = max_queue
+        self._recent = deque(maxlen=history)
+        self._subscribers = set()
+        self._next_id = 1
+        self._lock = threading.Lock()
+
+    def publish(self, event_type, **data) -> dict:
+        with self._lock:
+            event = {"id": self._next_id, "type": event_type, "at": time.time(), **data}
+            self._next_id += 1
+            self._recent.append(event)
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            subscription.put(event)
+        return event
+
+    def subscribe(self, last_id=None) -> Subscription:
+        """Start receiving events, first replaying the recent ones after ``last_id`` (all if None)."""
+        subscription = Subscription(self.max_queue)
+        with self._lock:
+            for event in self._recent:
+                if last_id is None or event["id"] > last_id:
+                    subscription.put(event)
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+
+def format_sse(event) -> str:
+    """Encode an event as a server-sent events message."""
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+
+bus = EventBus()
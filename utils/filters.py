@@ -0,0 +1,80 @@
+# utils/filters.py
+
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+BlacklistMatch = namedtuple("BlacklistMatch", ["field", "term"])
+
+
+class BlacklistFilter:
+    """Title and company blacklists compiled once into single case-insensitive regexes.
+
+    By default terms match anywhere in the text, like the old substring checks
+    ("Go" also matches "Google"). With ``word_boundary`` a term only matches as a
+    whole word or phrase.
+    """
+
+    def __init__(self, title_terms=(), company_terms=(), word_boundary=False):
+        self.word_boundary = word_boundary
+        self._title_pattern, self._title_terms = self._compile(title_terms, word_boundary)
+        self._company_pattern, self._company_terms = self._compile(company_terms, word_boundary)
+
+    @classmethod
+    def from_config(cls, config):
+        """Return the (cached) filter for the blacklists in a config dict."""
+        return _cached_filter(
+            tuple(config.get("title_blacklist") or ()),
+            tuple(config.get("company_blacklist") or ()),
+            bool(config.get("blacklist_word_boundary", False)),
+        )
+
+    @staticmethod
+    def _compile(terms, word_boundary):
+        originals = {}
+        for term in terms:
+            term = str(term).strip()
+            if term:
+                originals.setdefault(term.casefold(), term)
+        if not originals:
+            return None, originals
+
+        # Longest first so the reported term is the most specific one at a position.
+        alternation = "|".join(
+            re.escape(term) for term in sorted(originals.values(), key=len, reverse=True)
+        )
+        if word_boundary:
+            alternation = rf"(?<!\w)(?:{alternation})(?!\w)"
+        return re.compile(alternation, re.IGNORECASE), originals
+
+    @staticmethod
+    def _search(pattern, originals, text):
+        if pattern is None or not text:
+            return None
+        match = pattern.search(text)
+        if match is None:
+            return None
+        return originals.get(match.group(0).casefold(), match.group(0))
+
+    def match_title(self, title):
+        """Return the blacklisted term found in ``title``, or None."""
+        return self._search(self._title_pattern, self._title_terms, title)
+
+    def match_company(self, company):
+        """Return the blacklisted term found in ``company``, or None."""
+        return self._search(self._company_pattern, self._company_terms, company)
+
+    def check(self, title, company=None):
+        """Return a ``BlacklistMatch`` for the first blacklisted field, or None."""
+        term = self.match_company(company)
+        if term:
+            return BlacklistMatch("company", term)
+        term = self.match_title(title)
+        if term:
+            return BlacklistMatch("title", term)
+        return None
+
+
+@lru_cache(maxsize=8)
+def _cached_filter(title_terms, company_terms, word_boundary):
+    return BlacklistFilter(title_terms, company_terms, word_boundary)
@@ -0,0 +1,299 @@
+# utils/form_filler.py
+
+import hashlib
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from types import MappingProxyType
+from loguru import logger
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+from utils.form_snapshot import apply_fills, snapshot_form
+from utils import readiness
+from utils.label_index import LabelIndex, normalize_label
+
+DEFAULT_CACHE_PATH = "user_data/form_answers.json"
+DEFAULT_CACHE_SIZE = 2000
+
+EASY_APPLY_MODAL = "div.jobs-easy-apply-modal"
+
+# Modal buttons in the order they should be preferred on each step.
+STEP_BUTTONS = (
+    ("submit", "button[aria-label='Submit application']"),
+    ("review", "button[aria-label='Review your application']"),
+    ("next", "button[aria-label='Continue to next step']"),
+)
+
+# Placeholder options that do not count as an answer.
+PLACEHOLDER_OPTIONS = {normalize_label(option) for option in ("", "Select an option", "Bitte auswählen", "Auswählen")}
+
+
+def _plain(value):
+    """Turn frozen settings (mapping proxies, tuples) back into JSON-serializable data."""
+    if isinstance(value, (dict, MappingProxyType)):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    return value
+
+
+def resume_hash(resume) -> str:
+    """Stable fingerprint of the resume, so cached answers expire when it changes."""
+    encoded = json.dumps(_plain(resume), sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+class AnswerCache:
+    """Answers to screening questions keyed by normalized question and resume hash.
+
+    Entries are kept in least-recently-used order and the oldest are evicted
+    beyond ``max_entries``. The cache is written back to ``path`` whenever a new
+    answer is stored.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_entries=DEFAULT_CACHE_SIZE):
+        self.path = path
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                self._entries = OrderedDict(json.load(file))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable answer cache {self.path}: {e}")
+
+    @staticmethod
+    def key(question, resume_fingerprint, options=()) -> str:
+        """Cache key of a question; a select's options are part of it, as the answer must be one of them."""
+        key = f"{resume_fingerprint}:{normalize_label(question)}"
+        if options:
+            key += "|" + "|".join(sorted(normalize_label(option) for option in options))
+        return key
+
+    def get(self, key):
+        with self._lock:
+            answer = self._entries.get(key)
+            if answer is not None:
+                self._entries.move_to_end(key)
+            return answer
+
+    def put(self, key, answer):
+        with self._lock:
+            self._entries[key] = answer
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._save()
+
+    def _save(self):
+        if not self.path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(list(self._entries.items()), file, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write answer cache {self.path}: {e}")
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class AnswerBackend(ABC):
+    """Produces an answer for a form question. Return None when the question cannot be answered."""
+
+    @abstractmethod
+    def answer(self, question, options, resume):
+        pass
+
+
+class StubBackend(AnswerBackend):
+    """Fixed answers by question, for offline runs and tests."""
+
+    def __init__(self, answers=None, default=None):
+        self.answers = {normalize_label(question): answer for question, answer in (answers or {}).items()}
+        self.default = default
+        self.calls = 0
+
+    def answer(self, question, options, resume):
+        self.calls += 1
+        return self.answers.get(normalize_label(question), self.default)
+
+
+class MappingBackend(AnswerBackend):
+    """Answers questions that match a field mapping label (name, email, phone...) without a model."""
+
+    def __init__(self, field_mapping):
+        self.index = field_mapping if isinstance(field_mapping, LabelIndex) else LabelIndex(
+            field_mapping, unmatched_path=None
+        )
+
+    def answer(self, question, options, resume):
+        value = self.index.get(question)
+        return str(value) if value else None
+
+
+class OpenAIBackend(AnswerBackend):
+    """Asks an OpenAI chat model, given the resume. Requires the ``openai`` package."""
+
+    SYSTEM_PROMPT = (
+        "You fill in job application forms for the candidate whose resume is given. "
+        "Reply with the answer only, no explanation. For numeric questions reply with a number. "
+        "If options are listed, reply with exactly one of them."
+    )
+
+    def __init__(self, api_key, model="gpt-4o-mini"):
+        try:
+            from openai import OpenAI
+        except ImportError as e:
+            raise ImportError("The OpenAI answer backend needs the 'openai' package.") from e
+        self.client = OpenAI(api_key=api_key)
+        self.model = model
+
+    def answer(self, question, options, resume):
+        prompt = f"Resume:\n{json.dumps(_plain(resume), ensure_ascii=False)}\n\nQuestion: {question}"
+        if options:
+            prompt += "\nOptions: " + " | ".join(options)
+        response = self.client.chat.completions.create(
+            model=self.model,
+            temperature=0,
+            messages=[
+                {"role": "system", "content": self.SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+        )
+        return (response.choices[0].message.content or "").strip() or None
+
+
+class ChainBackend(AnswerBackend):
+    """Tries each backend in turn and returns the first answer."""
+
+    def __init__(self, *backends):
+        self.backends = backends
+
+    def answer(self, question, options, resume):
+        for backend in self.backends:
+            answer = backend.answer(question, options, resume)
+            if answer:
+                return answer
+        return None
+
+
+def create_backend(answer_config, secrets, field_mapping=None) -> AnswerBackend:
+    """Build the answer backend named by ``form_answers.backend`` (``openai`` or ``offline``)."""
+    name = answer_config.get("backend", "openai")
+    backends = [MappingBackend(field_mapping)] if field_mapping else []
+    if name == "openai":
+        api_key = secrets.get("llm_api_key")
+        if not api_key:
+            logger.warning("No 'llm_api_key' in secrets; answering form questions offline only.")
+        else:
+            try:
+                backends.append(OpenAIBackend(api_key, model=answer_config.get("model", "gpt-4o-mini")))
+            except ImportError as e:
+                logger.warning(f"{e} Answering form questions offline only.")
+    elif name != "offline":
+        raise ValueError(f"Unknown form answer backend: {name}")
+    return ChainBackend(*backends)
+
+
+class FormFiller:
+    """Fills multi-step Easy Apply forms, answering each question from the cache or the backend.
+
+    Build it once per run: the cache, backend and resume fingerprint are reused
+    for every job, so a repeated question never reaches the model again.
+    """
+
+    def __init__(self, resume_data, backend, cache=None, driver=None, max_steps=8):
+        self.resume_data = resume_data
+        self.resume_fingerprint = resume_hash(resume_data)
+        self.backend = backend
+        self.cache = cache if cache is not None else AnswerCache()
+        self.driver = driver
+        self.max_steps = max_steps
+
+    def answer(self, question, options=()):
+        """Return the answer for ``question``, asking the backend only on a cache miss.
+
+        With ``options`` (a select) only an answer that picks one of them is cached,
+        so a bad answer is asked again next time instead of leaving the field empty for good.
+        """
+        key = AnswerCache.key(question, self.resume_fingerprint, options)
+        answer = self.cache.get(key)
+        if answer is not None:
+            return answer
+        answer = self.backend.answer(question, list(options), self.resume_data)
+        if answer and (not options or self._option_index(options, answer) is not None):
+            self.cache.put(key, answer)
+        return answer
+
+    def plan_fills(self, labels) -> list:
+        """Answer every empty field in a form snapshot."""
+        fills = []
+        for entry in labels:
+            question = entry["text"]
+            if not question:
+                continue
+            if entry["kind"] == "select" and entry["select"]:
+                options = entry["options"]
+                if 0 <= entry["selected"] < len(options) and normalize_label(options[entry["selected"]]) \
+                        not in PLACEHOLDER_OPTIONS:
+                    continue
+                answer = self.answer(question, [o for o in options if normalize_label(o) not in PLACEHOLDER_OPTIONS])
+                option = self._option_index(options, answer)
+                if option is not None:
+                    fills.append({"ref": entry["select"], "option": option, "label": question, "value": answer})
+            elif entry["kind"] == "input" and entry["input"] and not entry["value"]:
+                answer = self.answer(question)
+                if answer:
+                    fills.append({"ref": entry["input"], "value": answer, "label": question})
+        return fills
+
+    @staticmethod
+    def _option_index(options, answer):
+        if not answer:
+            return None
+        wanted = normalize_label(answer)
+        normalized = [normalize_label(option) for option in options]
+        if wanted in normalized:
+            return normalized.index(wanted)
+        return next((index for index, option in enumerate(normalized) if option and wanted in option), None)
+
+    def fill_and_submit_form(self, driver=None) -> bool:
+        """Fill each step of the Easy Apply modal and submit it. Returns True once submitted."""
+        driver = driver or self.driver
+        for _ in range(self.max_steps):
+            apply_fills(driver, self.plan_fills(snapshot_form(driver, EASY_APPLY_MODAL)))
+
+            step = self._click_step_button(driver)
+            if step is None:
+                logger.warning("No next, review or submit button in the Easy Apply form.")
+                return False
+            if step == "submit":
+                logger.info("Submitted the Easy Apply form.")
+                return True
+            # The next step renders in place; wait for it to settle before reading it.
+            readiness.wait_for_dom_quiescence(driver, quiet_ms=200, timeout=3)
+        logger.warning(f"Easy Apply form not submitted after {self.max_steps} steps.")
+        return False
+
+    @staticmethod
+    def _click_step_button(driver):
+        for step, selector in STEP_BUTTONS:
+            try:
+                buttons = driver.find_elements(By.CSS_SELECTOR, f"{EASY_APPLY_MODAL} {selector}")
+            except WebDriverException:
+                continue
+            if buttons:
+                buttons[0].click()
+                return step
+        return None
@@ -0,0 +1,140 @@
+# utils/form_snapshot.py
+
+from loguru import logger
+
+# Reads every label with the input and select that follow it in one round-trip.
+# ``arguments[0]`` optionally limits the snapshot to one container (CSS selector).
+# Each control gets a ``data-ja-field`` reference so FORM_FILL_JS can find it again.
+FORM_SNAPSHOT_JS = """
+var skip = {hidden: 1, checkbox: 1, radio: 1, file: 1, submit: 1, button: 1, image: 1, reset: 1};
+var root = arguments[0] ? document.querySelector(arguments[0]) : document;
+if (!root) { return []; }
+var nodes = root.querySelectorAll('label, input, select, textarea');
+var refs = 0;
+var ref = function (el) {
+    if (!el.hasAttribute('data-ja-field')) { el.setAttribute('data-ja-field', String(refs++)); }
+    return el.getAttribute('data-ja-field');
+};
+document.querySelectorAll('[data-ja-field]').forEach(function (el) { el.removeAttribute('data-ja-field'); });
+
+var labels = [];
+var nextInput = null, nextSelect = null, nearest = null;
+for (var i = nodes.length - 1; i >= 0; i--) {
+    var node = nodes[i], tag = node.tagName;
+    if (tag === 'SELECT') {
+        nextSelect = node;
+        nearest = 'select';
+    } else if (tag === 'TEXTAREA' || (tag === 'INPUT' && !skip[(node.type || '').toLowerCase()])) {
+        nextInput = node;
+        nearest = 'input';
+    } else if (tag === 'LABEL') {
+        labels.push({label: node, input: nextInput, select: nextSelect, kind: nearest});
+    }
+}
+labels.reverse();
+
+return labels.map(function (entry) {
+    var select = entry.select;
+    return {
+        text: (entry.label.innerText || entry.label.textContent || '').replace(/\\s+/g, ' ').trim(),
+        own_text: Array.prototype.filter.call(entry.label.childNodes, function (child) {
+            return child.nodeType === 3;
+        }).map(function (child) { return child.textContent; }).join(' ').replace(/\\s+/g, ' ').trim(),
+        // Substring match, like the old XPath contains(@class, 'required'): also 'is-required', 'required-field'...
+        required: /required/.test(entry.label.className),
+        kind: entry.kind,
+        input: entry.input ? ref(entry.input) : null,
+        value: entry.input ? entry.input.value : '',
+        select: select ? ref(select) : null,
+        selected: select ? select.selectedIndex : -1,
+        options: select ? Array.prototype.map.call(select.options, function (option) {
+            return option.text.trim();
+        }) : []
+    };
+});
+"""
+
+# Applies all fills in one round-trip. ``arguments[0]`` is a list of
+# ``{ref, value}`` (text) or ``{ref, option}`` (select index) dicts. The native
+# value setter plus input/change events keep framework-managed inputs in sync.
+FORM_FILL_JS = """
+var filled = [];
+arguments[0].forEach(function (fill) {
+    var el = document.querySelector('[data-ja-field="' + fill.ref + '"]');
+    if (!el) { return; }
+    if (el.tagName === 'SELECT') {
+        el.selectedIndex = fill.option;
+    } else {
+        var proto = el.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+        Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, fill.value);
+    }
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    filled.push(fill.ref);
+});
+return filled;
+"""
+
+
+def snapshot_form(driver, root=None) -> list:
+    """Return every label on the page (or in ``root``) with its following input/select.
+
+    Each entry has ``text``, ``own_text`` (the label's direct text), ``required``,
+    ``input``/``select`` references, ``kind`` (whichever of the two comes first),
+    the input's current ``value``, the select's ``selected`` index and its ``options``.
+    """
+    return driver.execute_script(FORM_SNAPSHOT_JS, root) or []
+
+
+def plan_fills(labels, field_mapping, dropdown_answers) -> list:
+    """Match snapshot labels against the field mapping and dropdown answers in Python."""
+    fills = []
+    filled_refs = set()
+
+    for question, answer in dropdown_answers.items():
+        entry = next((entry for entry in labels if question in entry["own_text"] and entry["select"]), None)
+        if entry is None:
+            logger.warning(f"Could not select answer for '{question}'")
+            continue
+        option = next((index for index, text in enumerate(entry["options"]) if answer in text), None)
+        if option is None:
+            logger.warning(f"No option '{answer}' for '{question}'")
+            continue
+        fills.append({"ref": entry["select"], "option": option, "label": question, "value": answer})
+        filled_refs.add(entry["select"])
+
+    for entry in labels:
+        if not entry["required"]:
+            continue
+        value = field_mapping.get(entry["text"])
+        if not value:
+            continue
+        if not entry["input"] or entry["input"] in filled_refs:
+            logger.warning(f"Could not find input for '{entry['text']}'")
+            continue
+        fills.append({"ref": entry["input"], "value": str(value), "label": entry["text"]})
+        filled_refs.add(entry["input"])
+    return fills
+
+
+def apply_fills(driver, fills) -> int:
+    """Write planned ``fills`` into the page in a single script call and return how many succeeded."""
+    if not fills:
+        return 0
+    filled = set(driver.execute_script(
+        FORM_FILL_JS, [{key: fill[key] for key in ("ref", "value", "option") if key in fill} for fill in fills]
+    ) or [])
+    for fill in fills:
+        if fill["ref"] in filled:
+            logger.info(f"Filled '{fill['label']}' with '{fill['value']}'")
+        else:
+            logger.warning(f"Could not fill '{fill['label']}'")
+    return len(filled)
+
+
+def fill_form(driver, field_mapping, dropdown_answers) -> int:
+    """Snapshot the form, match it in Python and fill every matched field in a single script call.
+
+    Returns the number of fields filled.
+    """
+    return apply_fills(driver, plan_fills(snapshot_form(driver), field_mapping, dropdown_answers))
@@ -0,0 +1,141 @@
+# utils/history.py
+
+import atexit
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from loguru import logger
+
+DEFAULT_PATH = "user_data/applications.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS applications (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    platform TEXT NOT NULL,
+    job_id TEXT,
+    job_url TEXT,
+    title TEXT,
+    company TEXT,
+    status TEXT NOT NULL DEFAULT 'applied',
+    applied_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_applications_platform ON applications (platform, applied_at);
+CREATE INDEX IF NOT EXISTS idx_applications_applied_at ON applications (applied_at);
+CREATE INDEX IF NOT EXISTS idx_applications_company ON applications (company);
+"""
+
+COLUMNS = ("platform", "job_id", "job_url", "title", "company", "status", "applied_at")
+
+
+class ApplicationHistory:
+    """Durable, indexed log of applications in SQLite (WAL mode).
+
+    Writes are buffered and committed in batches, either when ``batch_size``
+    records are pending or every ``flush_interval`` seconds. Reads are paginated
+    so the dashboard never loads the whole history into memory.
+    """
+
+    def __init__(self, path=DEFAULT_PATH, batch_size=20, flush_interval=2.0):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._flush_timer = None
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._writer = self._connect()
+        self._writer.execute("PRAGMA journal_mode=WAL")
+        self._writer.execute("PRAGMA synchronous=NORMAL")
+        self._writer.executescript(SCHEMA)
+
+    def _connect(self):
+        connection = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+        connection.row_factory = sqlite3.Row
+        return connection
+
+    def add(self, platform, job_url=None, job_id=None, title=None, company=None, status="applied", applied_at=None):
+        """Queue one application record; it is written with the next batch."""
+        record = (
+            platform, job_id, job_url, title, company, status,
+            applied_at or datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        )
+        with self._lock:
+            self._pending.append(record)
+            flush_now = len(self._pending) >= self.batch_size
+            if not flush_now and self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        if flush_now:
+            self.flush()
+
+    def flush(self):
+        """Write all pending records in a single transaction."""
+        with self._lock:
+            batch, self._pending = self._pending, []
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        if not batch:
+            return
+        try:
+            with self._write_lock, self._writer:
+                self._writer.executemany(
+                    f"INSERT INTO applications ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+                    batch,
+                )
+        except sqlite3.Error as e:
+            logger.error(f"Could not write {len(batch)} application(s) to history: {e}")
+            with self._lock:
+                self._pending[:0] = batch
+
+    def page(self, page=1, per_page=25, platform=None, company=None):
+        """Return ``(rows, total)`` for one page, newest first, optionally filtered."""
+        self.flush()
+        where, params = self._filters(platform, company)
+        page = max(int(page), 1)
+        connection = self._connect()
+        try:
+            total = connection.execute(f"SELECT COUNT(*) FROM applications{where}", params).fetchone()[0]
+            rows = connection.execute(
+                f"SELECT id, {', '.join(COLUMNS)} FROM applications{where} "
+                "ORDER BY applied_at DESC, id DESC LIMIT ? OFFSET ?",
+                (*params, per_page, (page - 1) * per_page),
+            ).fetchall()
+        finally:
+            connection.close()
+        return [dict(row) for row in rows], total
+
+    @staticmethod
+    def _filters(platform, company):
+        clauses, params = [], []
+        if platform:
+            clauses.append("platform = ?")
+            params.append(platform)
+        if company:
+            clauses.append("company = ?")
+            params.append(company)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, tuple(params)
+
+    def close(self):
+        self.flush()
+        with self._write_lock:
+            self._writer.close()
+
+
+_history = None
+_history_lock = threading.Lock()
+
+
+def get_history(path=DEFAULT_PATH) -> ApplicationHistory:
+    """Return the process-wide history store, creating the database on first use."""
+    global _history
+    with _history_lock:
+        if _history is None:
+            _history = ApplicationHistory(path)
+            atexit.register(_history.flush)
+        return _history
@@ -0,0 +1,141 @@
+# utils/http_discovery.py
+
+import atexit
+import threading
+import requests
+from urllib.parse import urljoin, urlsplit
+from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from utils.cookie_store import REJECTED, UNVERIFIED, VALID, SessionStatus, get_cookie_store
+from utils.listing_parser import parse_listings
+
+# Result pages are served to browsers; look like one.
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "de-DE,de;q=0.9,en;q=0.8",
+}
+
+
+# Redirect targets that mean "log in first".
+LOGIN_PATH_HINTS = ("login", "signin", "sign-in", "authwall", "/auth")
+
+
+class HttpDiscovery:
+    """Fetches search result pages over a keep-alive HTTP session and parses their listings.
+
+    One instance per platform is shared by all crawler threads. The session keeps
+    up to ``pool_size`` connections per host open and sends the cookies saved by
+    the browser login (see utils/cookie_store.py), so no Chrome is needed to find
+    listings.
+    """
+
+    def __init__(self, platform_name, cookie_store=None, pool_size=4, timeout=15):
+        self.platform_name = platform_name
+        self.cookie_store = cookie_store if cookie_store is not None else get_cookie_store()
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504)),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._cookies_version = None
+        self._lock = threading.Lock()
+        self.refresh_cookies()
+
+    def refresh_cookies(self) -> bool:
+        """(Re)load the saved browser cookies if they changed since they were last read."""
+        version = self.cookie_store.version(self.platform_name)
+        with self._lock:
+            if version is None or version == self._cookies_version:
+                return False
+            cookies = self.cookie_store.load(self.platform_name)
+            self.session.cookies.clear()
+            for cookie in cookies:
+                self.session.cookies.set(
+                    cookie["name"],
+                    cookie["value"],
+                    domain=cookie.get("domain", ""),
+                    path=cookie.get("path", "/"),
+                    secure=cookie.get("secure", False),
+                    expires=cookie.get("expiry"),
+                )
+            self._cookies_version = version
+            logger.debug(f"Loaded {len(cookies)} {self.platform_name} cookies for HTTP discovery.")
+            return True
+
+    def fetch(self, url) -> requests.Response:
+        """GET ``url`` and raise ``requests.RequestException`` unless it succeeds."""
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        return response
+
+    def listings(self, url, spec) -> list:
+        """Fetch one result page and return its listings, parsed with the platform's listing spec."""
+        response = self.fetch(url)
+        return parse_listings(response.text, spec, base_url=response.url)
+
+    def probe(self, url) -> SessionStatus:
+        """Check the saved session with one request to a page that needs a login.
+
+        Only a 401 or a redirect to a login page means the site no longer accepts
+        the cookies. Anything else (403 from bot protection, 429, server errors, a
+        failed request) says nothing about the login, so the session counts as
+        unverified.
+        """
+        try:
+            response = self.session.get(url, timeout=min(self.timeout, 5), allow_redirects=False)
+        except requests.RequestException as e:
+            logger.warning(f"Could not verify the {self.platform_name} session: {e}")
+            return SessionStatus(True, UNVERIFIED)
+        if response.status_code == 200:
+            return SessionStatus(True, VALID)
+        if response.status_code == 401 or (response.is_redirect and is_login_redirect(response)):
+            logger.info(f"{self.platform_name} rejected the saved session (HTTP {response.status_code}).")
+            return SessionStatus(False, REJECTED)
+        logger.warning(f"Could not verify the {self.platform_name} session (HTTP {response.status_code}).")
+        return SessionStatus(True, UNVERIFIED)
+
+    def close(self):
+        self.session.close()
+
+
+def is_login_redirect(response) -> bool:
+    """Whether a redirect response points at a login page."""
+    location = urlsplit(urljoin(response.url, response.headers.get("Location", "")))
+    target = f"{location.hostname or ''}{location.path}".lower()
+    return any(hint in target for hint in LOGIN_PATH_HINTS)
+
+
+_discoveries = {}
+_discoveries_lock = threading.Lock()
+
+
+def get_http_discovery(platform_name, cookie_store=None, pool_size=4, timeout=15) -> HttpDiscovery:
+    """Return the process-wide HTTP discovery session for ``platform_name``, created on first use."""
+    with _discoveries_lock:
+        discovery = _discoveries.get(platform_name)
+        if discovery is None:
+            discovery = _discoveries[platform_name] = HttpDiscovery(
+                platform_name, cookie_store, pool_size=pool_size, timeout=timeout
+            )
+            return discovery
+    # Pick up a new login without restarting the process.
+    discovery.refresh_cookies()
+    return discovery
+
+
+@atexit.register
+def _close_sessions():
+    with _discoveries_lock:
+        for discovery in _discoveries.values():
+            discovery.close()
+        _discoveries.clear()
@@ -0,0 +1,112 @@
+# utils/jobs.py
+
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from loguru import logger
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+
+def _now():
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+class Job:
+    """One background action (a login, starting the automation...) and its progress."""
+
+    def __init__(self, kind, target=None):
+        self.id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.target = target
+        self.state = QUEUED
+        self.result = None
+        self.error = None
+        self.submitted_at = _now()
+        self.started_at = None
+        self.finished_at = None
+
+    @property
+    def done(self) -> bool:
+        return self.state in (SUCCEEDED, FAILED)
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "target": self.target,
+            "state": self.state,
+            "result": self.result,
+            "error": self.error,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class JobRunner:
+    """Runs long actions on a background thread pool so request handlers return at once.
+
+    ``submit()`` returns a ``Job`` whose ID the UI polls. Only one job per
+    ``(kind, target)`` runs at a time; submitting it again returns the active job.
+    The ``keep`` most recent finished jobs are remembered.
+    """
+
+    def __init__(self, max_workers=4, keep=50):
+        self.keep = keep
+        self._executor = ThreadPoolExecutor(max_workers=max(int(max_workers), 1), thread_name_prefix="job")
+        self._jobs = OrderedDict()  # job ID -> Job, oldest first
+        self._lock = threading.Lock()
+
+    def submit(self, kind, func, *args, target=None, **kwargs) -> Job:
+        """Run ``func(*args, **kwargs)`` in the background; its return value becomes ``job.result``."""
+        with self._lock:
+            active = self._active(kind, target)
+            if active is not None:
+                return active
+            job = Job(kind, target)
+            self._jobs[job.id] = job
+            self._prune()
+        self._executor.submit(self._run, job, func, args, kwargs)
+        return job
+
+    def _active(self, kind, target):
+        return next(
+            (job for job in self._jobs.values() if job.kind == kind and job.target == target and not job.done), None
+        )
+
+    def _prune(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job.done]
+        for job_id in finished[:max(len(finished) - self.keep, 0)]:
+            del self._jobs[job_id]
+
+    def _run(self, job, func, args, kwargs):
+        job.state = RUNNING
+        job.started_at = _now()
+        try:
+            job.result = func(*args, **kwargs)
+            job.state = SUCCEEDED
+        except Exception as e:
+            logger.error(f"Background {job.kind} job {job.id} failed: {e}")
+            job.error = str(e)
+            job.state = FAILED
+        finally:
+            job.finished_at = _now()
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs(self, limit=None) -> list:
+        """The remembered jobs, newest first."""
+        with self._lock:
+            jobs = list(reversed(self._jobs.values()))
+        return jobs[:limit] if limit else jobs
+
+    def shutdown(self, wait=False):
+        self._executor.shutdown(wait=wait)
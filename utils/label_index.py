@@ -0,0 +1,155 @@
+# utils/label_index.py
+
+import json
+import os
+import re
+import threading
+import unicodedata
+from collections import Counter
+from datetime import datetime
+from loguru import logger
+
+DEFAULT_UNMATCHED_PATH = "user_data/unmatched_labels.jsonl"
+
+# Form label variants that mean the same field, German and English.
+LABEL_SYNONYMS = (
+    ("Vorname", "First name", "Given name", "Forename"),
+    ("Nachname", "Last name", "Surname", "Family name", "Familienname"),
+    ("E-Mail", "E-Mail-Adresse", "Email", "Email address", "Mail"),
+    ("Mobil", "Mobilnummer", "Handynummer", "Telefon", "Telefonnummer", "Mobile", "Mobile number", "Phone",
+     "Phone number"),
+    ("Straße", "Straße und Hausnummer", "Adresse", "Street", "Street address", "Address"),
+    ("PLZ", "Postleitzahl", "ZIP", "ZIP code", "Postal code", "Postcode"),
+    ("Ort", "Wohnort", "Stadt", "City", "Town"),
+    ("Geburtsdatum", "Date of birth", "Birth date", "Birthday"),
+    ("Nationalität", "Staatsangehörigkeit", "Nationality", "Citizenship"),
+    ("Verfügbar ab", "Verfügbarkeit", "Available from", "Availability"),
+    ("Frühester Eintritt", "Frühestmöglicher Eintrittstermin", "Eintrittstermin", "Kündigungsfrist",
+     "Earliest start date", "Notice period"),
+    ("Gehaltsvorstellung", "Gehaltswunsch", "Gehaltsvorstellungen", "Salary expectation", "Salary expectations",
+     "Expected salary", "Desired salary"),
+    ("Gehaltsrange pro Jahr (brutto) von", "Gehalt von", "Salary range from", "Minimum salary"),
+    ("Gehaltsrange pro Jahr (brutto) bis", "Gehalt bis", "Salary range to", "Maximum salary"),
+    ("linkedin", "LinkedIn-Profil", "LinkedIn profile", "LinkedIn URL"),
+    ("github", "GitHub-Profil", "GitHub profile", "GitHub URL"),
+)
+
+# Decorations that never change which field a label refers to.
+_NOISE = re.compile(r"\((?:optional|pflichtfeld|required)\)|[*:]|\boptional\b|\bpflichtfeld\b")
+_NON_WORD = re.compile(r"[^0-9a-z]+")
+_FOLD = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss"})
+
+
+def normalize_label(text) -> str:
+    """Canonical form of a label: lower case, umlauts folded, punctuation, asterisks and "optional" removed."""
+    text = (text or "").casefold().translate(_FOLD)
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    text = _NOISE.sub(" ", text)
+    return " ".join(_NON_WORD.sub(" ", text).split())
+
+
+def trigrams(text) -> Counter:
+    padded = f"  {text} "
+    return Counter(padded[index:index + 3] for index in range(len(padded) - 2))
+
+
+def similarity(left: Counter, right: Counter) -> float:
+    """Dice coefficient of two trigram multisets."""
+    total = sum(left.values()) + sum(right.values())
+    if not total:
+        return 0.0
+    return 2 * sum((left & right).values()) / total
+
+
+class LabelIndex:
+    """Field mapping keyed by normalized label, with synonyms and a trigram-similarity fallback.
+
+    Built once per field mapping. ``get(label)`` is a dict lookup on the normalized
+    label; only labels that miss it are compared by trigram similarity, and that
+    result is cached too. A label about as similar to two different fields (within
+    ``ambiguity_margin``) matches neither: filling one of them at random is worse
+    than leaving the field empty. Labels that match nothing are appended to
+    ``unmatched_path`` (once per process, unless it is None) so the synonym table
+    can be tuned.
+    """
+
+    def __init__(self, field_mapping, synonyms=LABEL_SYNONYMS, min_similarity=0.75,
+                 unmatched_path=DEFAULT_UNMATCHED_PATH, ambiguity_margin=0.05):
+        self.field_mapping = dict(field_mapping)
+        self.min_similarity = min_similarity
+        self.ambiguity_margin = ambiguity_margin
+        self.unmatched_path = unmatched_path
+        self._lock = threading.Lock()
+
+        groups = {}
+        for group in synonyms:
+            for label in group:
+                groups[normalize_label(label)] = group
+
+        # normalized label -> key of field_mapping
+        self._index = {}
+        for key in self.field_mapping:
+            for label in groups.get(normalize_label(key), (key,)):
+                self._index.setdefault(normalize_label(label), key)
+            self._index[normalize_label(key)] = key
+        self._trigrams = {label: trigrams(label) for label in self._index}
+        self._cache = {}
+
+    def match(self, label):
+        """Return the field mapping key for ``label``, or None."""
+        normalized = normalize_label(label)
+        key = self._index.get(normalized)
+        if key is not None or not normalized:
+            return key
+        with self._lock:
+            if normalized in self._cache:
+                return self._cache[normalized]
+        key = self._closest(normalized)
+        with self._lock:
+            self._cache[normalized] = key
+        if key is None:
+            self._record_unmatched(label, normalized)
+        else:
+            logger.debug(f"Matched label '{label}' to '{key}' by similarity.")
+        return key
+
+    def _closest(self, normalized):
+        grams = trigrams(normalized)
+        scores = {}  # field mapping key -> best score of its labels
+        for label, label_grams in self._trigrams.items():
+            key = self._index[label]
+            scores[key] = max(scores.get(key, 0.0), similarity(grams, label_grams))
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        if not ranked or ranked[0][1] < self.min_similarity:
+            return None
+        if len(ranked) > 1 and ranked[0][1] - ranked[1][1] < self.ambiguity_margin:
+            logger.info(f"Form label '{normalized}' is ambiguous between '{ranked[0][0]}' and '{ranked[1][0]}'.")
+            return None
+        return ranked[0][0]
+
+    def get(self, label, default=None):
+        """Return the value for a form label, like ``dict.get`` on the field mapping."""
+        key = self.match(label)
+        return self.field_mapping.get(key, default) if key is not None else default
+
+    def __getitem__(self, key):
+        return self.field_mapping[key]
+
+    def __contains__(self, label):
+        return self.match(label) is not None
+
+    def _record_unmatched(self, label, normalized):
+        if not self.unmatched_path:
+            return
+        logger.info(f"No field mapping for form label '{label}'.")
+        record = {
+            "label": label,
+            "normalized": normalized,
+            "at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        try:
+            os.makedirs(os.path.dirname(self.unmatched_path) or ".", exist_ok=True)
+            with self._lock, open(self.unmatched_path, "a", encoding="utf-8") as file:
+                file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except OSError as e:
+            logger.warning(f"Could not record unmatched label '{label}': {e}")
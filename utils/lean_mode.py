@@ -0,0 +1,77 @@
+# utils/lean_mode.py
+
+from loguru import logger
+
+DEFAULT_BLOCKED_RESOURCE_TYPES = ["image", "font", "media"]
+
+DEFAULT_BLOCKED_URL_PATTERNS = [
+    "*doubleclick.net*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*googlesyndication.com*",
+    "*facebook.net*",
+    "*hotjar.com*",
+    "*criteo.com*",
+    "*adnxs.com*",
+]
+
+# Network.setBlockedURLs matches URLs, not resource types, so each type maps to file patterns.
+RESOURCE_TYPE_PATTERNS = {
+    "image": ["*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.svg*", "*.ico*", "*.avif*"],
+    "font": ["*.woff*", "*.ttf*", "*.otf*", "*.eot*"],
+    "media": ["*.mp4*", "*.webm*", "*.mp3*", "*.ogg*", "*.m3u8*"],
+    "stylesheet": ["*.css*"],
+}
+
+
+def is_enabled(browser_config) -> bool:
+    return bool((browser_config or {}).get("lean_mode", False))
+
+
+def add_lean_options(options, browser_config):
+    """Add Chrome switches and prefs that keep a headless automation browser small."""
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-background-networking")
+    options.add_argument("--disable-component-update")
+    options.add_argument("--disable-default-apps")
+    options.add_argument("--disable-sync")
+    options.add_argument("--mute-audio")
+    options.add_argument("--no-first-run")
+
+    max_memory = browser_config.get("max_renderer_memory_mb")
+    if max_memory:
+        options.add_argument(f"--js-flags=--max-old-space-size={int(max_memory)}")
+    renderer_limit = browser_config.get("renderer_process_limit")
+    if renderer_limit:
+        options.add_argument(f"--renderer-process-limit={int(renderer_limit)}")
+
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+    })
+    return options
+
+
+def blocked_url_patterns(browser_config) -> list:
+    """Combine the configured URL patterns with the patterns for blocked resource types."""
+    resource_types = browser_config.get("blocked_resource_types", DEFAULT_BLOCKED_RESOURCE_TYPES)
+    patterns = list(browser_config.get("blocked_url_patterns", DEFAULT_BLOCKED_URL_PATTERNS))
+    for resource_type in resource_types:
+        patterns.extend(RESOURCE_TYPE_PATTERNS.get(resource_type, []))
+    return patterns
+
+
+def apply_network_rules(driver, browser_config):
+    """Block unneeded requests in the current tab via the Chrome DevTools Protocol.
+
+    CDP rules are per target, so this must run again after switching to a new tab.
+    """
+    patterns = blocked_url_patterns(browser_config)
+    if not patterns:
+        return
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    except Exception as e:
+        logger.warning(f"Could not apply lean-mode network rules: {e}")
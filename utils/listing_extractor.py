@@ -0,0 +1,69 @@
+# utils/listing_extractor.py
+
+import re
+from urllib.parse import urlsplit
+
+# Reads every listing on the page in one round-trip. ``arguments[0]`` is a spec dict:
+#   container          CSS selector for one listing
+#   id_attribute       attribute on the container holding the job ID (optional)
+#   title, company     CSS selectors inside the container (optional)
+#   link               CSS selector for the listing's anchor (defaults to the first link)
+# For "a, b" selectors the first alternative that matches anything wins, not the first element in the page.
+#   easy_apply_text    badge text that marks an "Easy Apply" listing (optional)
+LISTING_EXTRACTOR_JS = """
+var spec = arguments[0];
+// querySelector('a, b') returns whichever comes first in the page; try the alternatives in order instead.
+var first = function (root, selector) {
+    var alternatives = selector.split(',');
+    for (var i = 0; i < alternatives.length; i++) {
+        var el = root.querySelector(alternatives[i]);
+        if (el) { return el; }
+    }
+    return null;
+};
+var text = function (root, selector) {
+    if (!selector) { return ''; }
+    var el = first(root, selector);
+    return el ? el.textContent.replace(/\\s+/g, ' ').trim() : '';
+};
+return Array.prototype.map.call(document.querySelectorAll(spec.container), function (item) {
+    var link = first(item, spec.link || 'a[href]');
+    var easyApply = false;
+    if (spec.easy_apply_text) {
+        easyApply = Array.prototype.some.call(item.querySelectorAll('span'), function (span) {
+            return span.textContent.indexOf(spec.easy_apply_text) !== -1;
+        });
+    }
+    return {
+        id: spec.id_attribute ? (item.getAttribute(spec.id_attribute) || '') : '',
+        title: text(item, spec.title),
+        company: text(item, spec.company),
+        url: link ? link.href : '',
+        easy_apply: easyApply
+    };
+});
+"""
+
+_NUMERIC_ID = re.compile(r"\d{5,}")
+
+
+def extract_listings(driver, spec) -> list:
+    """Return all listings on the current page as plain dicts in a single script call.
+
+    Each dict has ``id``, ``title``, ``company``, ``url`` and ``easy_apply`` keys.
+    Listings without an explicit ID get one derived from their URL.
+    """
+    listings = driver.execute_script(LISTING_EXTRACTOR_JS, spec) or []
+    for listing in listings:
+        if not listing["id"]:
+            listing["id"] = job_id_from_url(listing["url"])
+    return listings
+
+
+def job_id_from_url(url: str) -> str:
+    """Derive a stable job ID from a listing URL (the last long number in its path)."""
+    if not url:
+        return ""
+    path = urlsplit(url).path.rstrip("/")
+    numbers = _NUMERIC_ID.findall(path)
+    return numbers[-1] if numbers else path
@@ -0,0 +1,259 @@
+# utils/listing_parser.py
+#
+# Parses listings out of search result HTML without a browser, for HTTP discovery.
+# Only the CSS that listing specs need is supported:
+#   - type selectors and *:            li, a, *
+#   - classes and IDs:                 .res-1p8f8en, #results
+#   - attribute selectors:             [href], [data-at='x'], with = *= ^= $= ~= |=
+#   - descendant and child combinators: ul.results li, ul > li
+#   - comma-separated alternatives, tried in order
+# Pseudo-classes, sibling combinators and anything else raise ValueError. Platforms
+# with http_discovery have their listing_spec checked by validate_spec() when the
+# class is defined, so an unsupported selector fails at import, not mid-crawl.
+
+import re
+from functools import lru_cache
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+from utils.listing_extractor import job_id_from_url
+
+# Elements that never have a closing tag.
+VOID_ELEMENTS = frozenset((
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr",
+))
+
+_ATTRIBUTE = re.compile(r"""\[\s*([\w:-]+)\s*(?:([*^$~|]?=)\s*(?:"([^"]*)"|'([^']*)'|([^\]\s]*))\s*)?\]""")
+_SIMPLE = re.compile(r"([.#])([\w-]+)")
+_COMPOUND = re.compile(r"""^([a-zA-Z][\w-]*|\*)?((?:[.#][\w-]+|\[[^\]]*\])*)$""")
+_SIMPLE_ONLY = re.compile(r"(?:[.#][\w-]+)*")
+
+# Spec keys that hold selectors.
+SELECTOR_FIELDS = ("container", "title", "company", "link")
+
+
+class _Compound:
+    """One compound selector such as ``a.link[data-at='title']``."""
+
+    __slots__ = ("tag", "classes", "element_id", "attributes")
+
+    def __init__(self, text):
+        match = _COMPOUND.match(text)
+        if not match:
+            raise ValueError(f"Unsupported CSS selector: {text!r}")
+        tag, rest = match.groups()
+        if not _SIMPLE_ONLY.fullmatch(_ATTRIBUTE.sub("", rest)):
+            raise ValueError(f"Unsupported CSS selector: {text!r}")  # e.g. [a!=b]
+        self.tag = None if tag in (None, "*") else tag.lower()
+        self.classes = []
+        self.element_id = None
+        self.attributes = [
+            (name.lower(), operator, next((value for value in values if value is not None), ""))
+            for name, operator, *values in (match.groups() for match in _ATTRIBUTE.finditer(rest))
+        ]
+        for prefix, name in _SIMPLE.findall(_ATTRIBUTE.sub("", rest)):
+            if prefix == ".":
+                self.classes.append(name)
+            else:
+                self.element_id = name
+
+    def matches(self, element) -> bool:
+        if self.tag is not None and element.tag != self.tag:
+            return False
+        attrs = element.attrs
+        if self.element_id is not None and attrs.get("id") != self.element_id:
+            return False
+        if self.classes:
+            classes = attrs.get("class", "").split()
+            if not all(name in classes for name in self.classes):
+                return False
+        for name, operator, expected in self.attributes:
+            value = attrs.get(name)
+            if value is None:
+                return False
+            if operator == "=" and value != expected:
+                return False
+            if operator == "*=" and expected not in value:
+                return False
+            if operator == "^=" and not value.startswith(expected):
+                return False
+            if operator == "$=" and not value.endswith(expected):
+                return False
+            if operator == "~=" and expected not in value.split():
+                return False
+            if operator == "|=" and value != expected and not value.startswith(f"{expected}-"):
+                return False
+        return True
+
+
+class Selector:
+    """The subset of CSS used by listing specs: type, class, ID and attribute selectors,
+    descendant and child combinators, and comma-separated alternatives."""
+
+    def __init__(self, text):
+        self.text = text
+        self.alternatives = [self._parse(part) for part in text.split(",") if part.strip()]
+        if not self.alternatives:
+            raise ValueError(f"Empty CSS selector: {text!r}")
+
+    @staticmethod
+    def _parse(text):
+        steps = []
+        combinator = " "
+        for token in text.replace(">", " > ").split():
+            if token == ">":
+                combinator = ">"
+                continue
+            steps.append((_Compound(token), combinator))
+            combinator = " "
+        return steps
+
+    def matches(self, path) -> bool:
+        """Whether the last element of ``path`` (its ancestors first) matches the selector."""
+        return any(self._match(steps, path, len(path) - 1) for steps in self.alternatives)
+
+    def match_indexes(self, path) -> list:
+        """Indexes of the comma-separated alternatives that the last element of ``path`` matches."""
+        return [index for index, steps in enumerate(self.alternatives) if self._match(steps, path, len(path) - 1)]
+
+    def _match(self, steps, path, end) -> bool:
+        compound, combinator = steps[-1]
+        if not compound.matches(path[end]):
+            return False
+        if len(steps) == 1:
+            return True
+        if combinator == ">":
+            return end > 0 and self._match(steps[:-1], path, end - 1)
+        return any(self._match(steps[:-1], path, index) for index in range(end - 1, -1, -1))
+
+
+compile_selector = lru_cache(maxsize=64)(Selector)
+
+
+def validate_spec(spec):
+    """Check that ``spec`` only uses selectors this parser supports; raise ValueError naming the bad field."""
+    if not spec or not spec.get("container"):
+        raise ValueError("The listing spec has no 'container' selector.")
+    for field in SELECTOR_FIELDS:
+        if spec.get(field):
+            try:
+                compile_selector(spec[field])
+            except ValueError as e:
+                raise ValueError(f"Listing spec field '{field}': {e}") from None
+
+
+class _Element:
+    __slots__ = ("tag", "attrs")
+
+    def __init__(self, tag, attrs):
+        self.tag = tag
+        self.attrs = attrs
+
+
+class ListingParser(HTMLParser):
+    """Reads listings from result page HTML with the same spec as LISTING_EXTRACTOR_JS.
+
+    The page is parsed in a single streaming pass; each listing dict has the
+    ``id``, ``title``, ``company``, ``url`` and ``easy_apply`` keys produced by
+    ``extract_listings()`` in the browser. As there, the alternatives of a comma
+    selector are tried in order: a later alternative is only used when no
+    element in the listing matches an earlier one.
+    """
+
+    def __init__(self, spec, base_url=""):
+        super().__init__(convert_charrefs=True)
+        self.container = compile_selector(spec["container"])
+        self.fields = {name: compile_selector(spec[name]) for name in ("title", "company") if spec.get(name)}
+        self.link = compile_selector(spec.get("link") or "a[href]")
+        self.id_attribute = spec.get("id_attribute")
+        self.easy_apply_text = spec.get("easy_apply_text")
+        self.base_url = base_url
+        self.listings = []
+        self._stack = []
+        self._item = None  # (container element, listing, {field: {alternative index: value}})
+        self._text = {}  # element -> text parts, for elements whose textContent is needed
+        self._fields = {}  # element -> [(field, alternative index)] it provides
+
+    def handle_starttag(self, tag, attrs):
+        element = _Element(tag, {name: value or "" for name, value in attrs})
+        self._stack.append(element)
+        try:
+            if self._item is None:
+                if self.container.matches(self._stack):
+                    listing = {"id": "", "title": "", "company": "", "url": "", "easy_apply": False}
+                    if self.id_attribute:
+                        listing["id"] = element.attrs.get(self.id_attribute, "")
+                    self._item = (element, listing, {})
+                return
+            self._start_in_item(element)
+        finally:
+            if tag in VOID_ELEMENTS:
+                self._stack.pop()
+
+    def _start_in_item(self, element):
+        candidates = self._item[2]
+        for name, selector in self.fields.items():
+            index = self._claim(candidates, name, selector)
+            if index is not None:
+                self._fields.setdefault(element, []).append((name, index))
+                self._text.setdefault(element, [])
+        index = self._claim(candidates, "url", self.link)
+        if index is not None:
+            href = element.attrs.get("href")
+            candidates["url"][index] = urljoin(self.base_url, href) if href else ""
+        if self.easy_apply_text and element.tag == "span":
+            self._text.setdefault(element, [])
+
+    def _claim(self, candidates, name, selector):
+        """Index of the alternative the current element provides for ``name``, if it is the first match of it."""
+        found = candidates.setdefault(name, {})
+        for index in selector.match_indexes(self._stack):
+            if index not in found:
+                found[index] = ""
+                return index
+        return None
+
+    def handle_data(self, data):
+        for parts in self._text.values():
+            parts.append(data)
+
+    def handle_endtag(self, tag):
+        if not any(element.tag == tag for element in self._stack):
+            return
+        # Unclosed elements inside this one end with it, as in a browser.
+        while self._stack:
+            element = self._stack.pop()
+            self._end(element)
+            if element.tag == tag:
+                return
+
+    def _end(self, element):
+        parts = self._text.pop(element, None)
+        if parts is not None:
+            text = "".join(parts)
+            _, listing, candidates = self._item
+            for name, index in self._fields.pop(element, ()):
+                candidates[name][index] = " ".join(text.split())
+            if element.tag == "span" and self.easy_apply_text and self.easy_apply_text in text:
+                listing["easy_apply"] = True
+        if self._item is not None and element is self._item[0]:
+            _, listing, candidates = self._item
+            for name, found in candidates.items():
+                if found:
+                    listing[name] = found[min(found)]
+            if not listing["id"]:
+                listing["id"] = job_id_from_url(listing["url"])
+            self.listings.append(listing)
+            self._item = None
+
+    def close(self):
+        super().close()
+        while self._stack:
+            self._end(self._stack.pop())
+
+
+def parse_listings(html, spec, base_url="") -> list:
+    """Return all listings in a result page's HTML, resolving links against ``base_url``."""
+    parser = ListingParser(spec, base_url)
+    parser.feed(html)
+    parser.close()
+    return parser.listings
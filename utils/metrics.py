@@ -0,0 +1,208 @@
+# utils/metrics.py
+
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from utils import events
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels, extra=None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    """Base class for a named metric with label sets."""
+
+    type_name = "untyped"
+
+    def __init__(self, name, help_text):
+        self.name = name
+        self.help_text = help_text
+        self._values = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(labels):
+        return tuple(sorted(labels.items()))
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.type_name}"]
+        with self._lock:
+            items = list(self._values.items())
+        for labels, value in items:
+            lines.extend(self._render_sample(labels, value))
+        return lines
+
+    def _render_sample(self, labels, value):
+        return [f"{self.name}{_format_labels(labels)} {_format_value(value)}"]
+
+
+class Counter(Metric):
+    """A monotonically increasing count, e.g. applications per outcome."""
+
+    type_name = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    """A value that can go up and down, e.g. idle browsers in the pool."""
+
+    type_name = "gauge"
+
+    def set(self, value, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+
+class Histogram(Metric):
+    """Cumulative bucketed observations with sum and count, e.g. stage durations."""
+
+    type_name = "histogram"
+
+    def __init__(self, name, help_text, buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help_text)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = {"buckets": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state["buckets"][index] += 1
+            state["sum"] += value
+            state["count"] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the duration of the ``with`` block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def _render_sample(self, labels, state):
+        lines = [
+            f"{self.name}_bucket{_format_labels(labels, ('le', _format_value(bound)))} {count}"
+            for bound, count in zip(self.buckets, state["buckets"])
+        ]
+        lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(state['sum'])}")
+        lines.append(f"{self.name}_count{_format_labels(labels)} {state['count']}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds all metrics and renders them in the Prometheus text exposition format."""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name, help_text):
+        return self._register(Counter(name, help_text))
+
+    def gauge(self, name, help_text):
+        return self._register(Gauge(name, help_text))
+
+    def histogram(self, name, help_text, buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram(name, help_text, buckets))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+STAGE_SECONDS = registry.histogram(
+    "job_assistant_stage_seconds", "Time spent in each platform pipeline stage."
+)
+OUTCOMES = registry.counter(
+    "job_assistant_outcomes_total", "Job listings processed, by platform and outcome."
+)
+WEBDRIVER_ROUNDTRIP_SECONDS = registry.histogram(
+    "job_assistant_webdriver_roundtrip_seconds",
+    "Duration of individual WebDriver commands sent to chromedriver.",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+DRIVER_POOL_BROWSERS = registry.gauge(
+    "job_assistant_driver_pool_browsers", "Chrome sessions held by the driver pool, by state."
+)
+
+
+@contextmanager
+def span(platform, stage):
+    """Time a pipeline stage for a platform."""
+    with STAGE_SECONDS.time(platform=platform, stage=stage):
+        yield
+
+
+def timed_stage(stage):
+    """Decorate a JobPlatform method so each call is recorded as a stage span and a timing event."""
+
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                with span(self.platform_name, stage):
+                    return method(self, *args, **kwargs)
+            finally:
+                events.bus.publish(
+                    events.TIMING, platform=self.platform_name, stage=stage,
+                    seconds=round(time.perf_counter() - start, 3),
+                )
+
+        return wrapper
+
+    return decorator
+
+
+def count_outcome(platform, outcome, amount=1):
+    OUTCOMES.inc(amount, platform=platform, outcome=outcome)
+
+
+def instrument_driver(driver):
+    """Record the latency of every WebDriver command the driver sends."""
+    execute = driver.execute
+
+    def timed_execute(driver_command, params=None):
+        start = time.perf_counter()
+        try:
+            return execute(driver_command, params)
+        finally:
+            WEBDRIVER_ROUNDTRIP_SECONDS.observe(time.perf_counter() - start, command=driver_command)
+
+    driver.execute = timed_execute
+    return driver
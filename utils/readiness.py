@@ -0,0 +1,157 @@
+# utils/readiness.py
+
+import time
+from contextlib import contextmanager
+from loguru import logger
+from selenium.common.exceptions import (
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
+
+# Exceptions that mean "not ready yet" rather than "the browser is broken".
+TRANSIENT_EXCEPTIONS = (JavascriptException, NoSuchElementException, StaleElementReferenceException)
+
+# Records the time of the last DOM mutation; installed once per document.
+DOM_OBSERVER_JS = """
+if (!window.__jaaDomObserver) {
+    window.__jaaLastMutation = performance.now();
+    window.__jaaDomObserver = new MutationObserver(function () {
+        window.__jaaLastMutation = performance.now();
+    });
+    window.__jaaDomObserver.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+}
+return document.readyState !== 'loading' && performance.now() - window.__jaaLastMutation >= arguments[0];
+"""
+
+# Counts in-flight fetch/XHR requests and records when the last resource finished. Requests
+# started before it is installed are invisible to it, so install it before the action.
+NETWORK_TRACKER_JS = """
+if (!window.__jaaNetworkTracker) {
+    window.__jaaNetworkTracker = true;
+    window.__jaaPending = 0;
+    window.__jaaLastNetwork = performance.now();
+    var done = function () {
+        window.__jaaPending = Math.max(0, window.__jaaPending - 1);
+        window.__jaaLastNetwork = performance.now();
+    };
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function () {
+            window.__jaaPending++;
+            return originalFetch.apply(this, arguments).finally(done);
+        };
+    }
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        window.__jaaPending++;
+        this.addEventListener('loadend', done);
+        return originalSend.apply(this, arguments);
+    };
+    if (window.PerformanceObserver) {
+        new PerformanceObserver(function () {
+            window.__jaaLastNetwork = performance.now();
+        }).observe({type: 'resource', buffered: false});
+    }
+}
+"""
+
+# Installs the tracker if needed (e.g. after a navigation) and reports whether the page is idle.
+NETWORK_IDLE_JS = NETWORK_TRACKER_JS + """
+return document.readyState === 'complete'
+    && window.__jaaPending === 0
+    && performance.now() - window.__jaaLastNetwork >= arguments[0];
+"""
+
+
+class WaitResult:
+    """Outcome of a readiness wait: whether it succeeded, how long it took and the final value."""
+
+    __slots__ = ("ok", "elapsed", "value")
+
+    def __init__(self, ok, elapsed, value=None):
+        self.ok = ok
+        self.elapsed = elapsed
+        self.value = value
+
+    def __bool__(self):
+        return self.ok
+
+    def __repr__(self):
+        return f"WaitResult(ok={self.ok}, elapsed={self.elapsed:.3f}s)"
+
+
+def wait_until(condition, timeout=10, poll=0.05, max_poll=0.5, backoff=1.5, description="condition"):
+    """Poll ``condition()`` until it returns a truthy value or ``timeout`` seconds pass.
+
+    Polling starts fast and backs off geometrically, so conditions that are met
+    quickly return almost immediately while long waits stay cheap.
+    """
+    start = time.monotonic()
+    value = None
+    while True:
+        try:
+            value = condition()
+        except TRANSIENT_EXCEPTIONS:
+            value = None
+        elapsed = time.monotonic() - start
+        if value:
+            logger.debug(f"Waited {elapsed:.2f}s for {description}.")
+            return WaitResult(True, elapsed, value)
+        if elapsed >= timeout:
+            logger.debug(f"Gave up waiting for {description} after {elapsed:.2f}s.")
+            return WaitResult(False, elapsed, value)
+        time.sleep(min(poll, timeout - elapsed))
+        poll = min(poll * backoff, max_poll)
+
+
+def wait_for_dom_quiescence(driver, quiet_ms=300, timeout=5):
+    """Wait until the DOM has not mutated for ``quiet_ms`` milliseconds."""
+    return wait_until(
+        lambda: driver.execute_script(DOM_OBSERVER_JS, quiet_ms),
+        timeout=timeout,
+        description="DOM quiescence",
+    )
+
+
+def install_network_tracker(driver):
+    """Start counting the page's fetch/XHR requests; call it before the action being waited on."""
+    try:
+        driver.execute_script(NETWORK_TRACKER_JS)
+    except TRANSIENT_EXCEPTIONS as e:
+        logger.debug(f"Could not install the network tracker: {e}")
+
+
+def wait_for_network_idle(driver, idle_ms=500, timeout=10):
+    """Wait until the page has loaded and no fetch/XHR request has been active for ``idle_ms``."""
+    return wait_until(
+        lambda: driver.execute_script(NETWORK_IDLE_JS, idle_ms),
+        timeout=timeout,
+        description="network idle",
+    )
+
+
+@contextmanager
+def track_network(driver, idle_ms=500, timeout=10):
+    """Install the network tracker, run the block, then wait for the requests it started to settle."""
+    install_network_tracker(driver)
+    yield
+    wait_for_network_idle(driver, idle_ms=idle_ms, timeout=timeout)
+
+
+def wait_for_url_change(driver, previous_url, timeout=10):
+    """Wait until the current URL differs from ``previous_url``."""
+    return wait_until(
+        lambda: driver.current_url != previous_url and driver.current_url,
+        timeout=timeout,
+        description="URL change",
+    )
+
+
+def wait_for_element(driver, by, selector, timeout=10):
+    """Wait for the first element matching ``selector``; ``value`` holds the element."""
+    return wait_until(
+        lambda: next(iter(driver.find_elements(by, selector)), None),
+        timeout=timeout,
+        description=f"element '{selector}'",
+    )
@@ -0,0 +1,37 @@
+# utils/search_planner.py
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class SearchQuery:
+    """One search: a position (the keywords) in a location."""
+
+    position: str
+    location: str
+
+
+def plan_searches(settings, preferences) -> list:
+    """The searches to run: the job preferences' query, then the ``positions`` × ``locations`` matrix.
+
+    The ``job_title``/``location`` edited on the preferences page always comes
+    first; the settings matrix adds searches to it rather than replacing it. An
+    empty ``positions`` or ``locations`` list takes the preference's value instead.
+    Queries that differ only in case or whitespace are dropped.
+    """
+    job_title = preferences.get("job_title") or ""
+    location = preferences.get("location") or ""
+    positions = settings.positions or (job_title,)
+    locations = settings.locations or (location,)
+    pairs = [(job_title, location)] if job_title.strip() else []
+    pairs += [(position, place) for position in positions for place in locations]
+
+    queries = []
+    seen = set()
+    for position, place in pairs:
+        query = SearchQuery(" ".join(position.split()), " ".join(place.split()))
+        key = (query.position.casefold(), query.location.casefold())
+        if key not in seen:
+            seen.add(key)
+            queries.append(query)
+    return queries
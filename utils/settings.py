@@ -0,0 +1,162 @@
+# utils/settings.py
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import cached_property
+from types import MappingProxyType
+from typing import Mapping
+import yaml
+from loguru import logger
+from utils.filters import BlacklistFilter
+
+DATA_FOLDER = "./data_folder"
+
+SETTINGS_FILES = {
+    "config": "config.yaml",
+    "resume": "plain_text_resume.yaml",
+    "secrets": "secrets.yaml",
+}
+
+# Config keys that must be lists of strings when present.
+STRING_LIST_KEYS = ("title_blacklist", "company_blacklist", "positions", "locations")
+
+
+class SettingsError(ValueError):
+    """Raised when a settings file is missing or malformed."""
+
+
+def freeze(value):
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Immutable snapshot of the bot configuration, resume and secrets."""
+
+    config: Mapping
+    resume: Mapping
+    secrets: Mapping
+    mtimes: tuple = field(default=(), compare=False)
+
+    @property
+    def title_blacklist(self) -> tuple:
+        return self.config.get("title_blacklist") or ()
+
+    @property
+    def company_blacklist(self) -> tuple:
+        return self.config.get("company_blacklist") or ()
+
+    @property
+    def positions(self) -> tuple:
+        return self.config.get("positions") or ()
+
+    @property
+    def locations(self) -> tuple:
+        return self.config.get("locations") or ()
+
+    @cached_property
+    def blacklist(self) -> BlacklistFilter:
+        """The compiled blacklist matcher for this snapshot."""
+        return BlacklistFilter.from_config(self.config)
+
+
+def validate(config, resume, secrets):
+    """Check the parsed YAML documents have the shapes the platforms rely on."""
+    for name, document in (("config", config), ("resume", resume), ("secrets", secrets)):
+        if not isinstance(document, dict):
+            raise SettingsError(f"{SETTINGS_FILES[name]} must contain a mapping, got {type(document).__name__}.")
+
+    for key in STRING_LIST_KEYS:
+        values = config.get(key)
+        if values is None:
+            continue
+        if not isinstance(values, list) or not all(isinstance(value, str) for value in values):
+            raise SettingsError(f"'{key}' in {SETTINGS_FILES['config']} must be a list of strings.")
+
+    if not isinstance(resume.get("personal_information", {}), dict):
+        raise SettingsError(f"'personal_information' in {SETTINGS_FILES['resume']} must be a mapping.")
+
+
+class SettingsLoader:
+    """Load the data_folder YAML files once and re-parse them only when they change on disk.
+
+    ``get()`` is cheap enough for the per-application hot path: it returns the
+    cached snapshot and only stats the files at most once per ``check_interval``.
+    """
+
+    def __init__(self, folder=DATA_FOLDER, check_interval=1.0):
+        self.folder = folder
+        self.check_interval = check_interval
+        self._snapshot = None
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+
+    def path(self, name):
+        return os.path.join(self.folder, SETTINGS_FILES[name])
+
+    def get(self) -> Settings:
+        """Return the current snapshot, reloading it if a file was modified."""
+        with self._lock:
+            now = time.monotonic()
+            if self._snapshot is not None and now - self._last_check < self.check_interval:
+                return self._snapshot
+            self._last_check = now
+
+            mtimes = self._mtimes()
+            if self._snapshot is not None and mtimes == self._snapshot.mtimes:
+                return self._snapshot
+
+            try:
+                self._snapshot = self._load(mtimes)
+            except (OSError, yaml.YAMLError, SettingsError) as e:
+                if self._snapshot is None:
+                    raise
+                logger.error(f"Keeping previous settings; reload failed: {e}")
+            return self._snapshot
+
+    def reload(self) -> Settings:
+        """Force a reload on the next ``get()``."""
+        with self._lock:
+            self._snapshot = None
+        return self.get()
+
+    def _mtimes(self):
+        mtimes = []
+        for name in SETTINGS_FILES:
+            try:
+                mtimes.append(os.stat(self.path(name)).st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        return tuple(mtimes)
+
+    def _load(self, mtimes) -> Settings:
+        config = self._read("config", required=True)
+        resume = self._read("resume", required=True)
+        secrets = self._read("secrets", required=False)
+        validate(config, resume, secrets)
+        logger.debug(f"Loaded settings from {self.folder}.")
+        return Settings(freeze(config), freeze(resume), freeze(secrets), mtimes)
+
+    def _read(self, name, required):
+        path = self.path(name)
+        if not os.path.exists(path):
+            if required:
+                raise SettingsError(f"Settings file not found: {path}")
+            return {}
+        with open(path, "r", encoding="utf-8") as file:
+            return yaml.safe_load(file) or {}
+
+
+_loader = SettingsLoader()
+
+
+def get_settings() -> Settings:
+    """Return the shared settings snapshot used by all platforms."""
+    return _loader.get()
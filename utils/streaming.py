@@ -0,0 +1,111 @@
+# utils/streaming.py
+
+import queue
+import threading
+
+_DONE = object()
+
+
+class Prefetcher:
+    """Run iterators in background threads, keeping up to ``depth`` items ready ahead of the consumer.
+
+    With several iterables each gets its own thread and their items are merged in
+    the order they are produced. Exceptions raised by a producer are re-raised on
+    the consumer side. ``close()`` stops the producers at their next item, even if
+    the consumer never started reading.
+    """
+
+    def __init__(self, *iterables, depth=1, name="prefetch"):
+        self._buffer = queue.Queue(maxsize=max(int(depth), 1))
+        self._stop = threading.Event()
+        self._running = len(iterables)
+        self._finished = self._running == 0
+        self._threads = [
+            threading.Thread(target=self._produce, args=(iterable,), name=f"{name}-{index}", daemon=True)
+            for index, iterable in enumerate(iterables)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _put(self, entry) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self, iterable):
+        iterator = iter(iterable)
+        error = None
+        try:
+            for item in iterator:
+                if not self._put((item, None)):
+                    return
+        except Exception as e:
+            error = e
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+        self._put((_DONE, error))
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while not self._finished:
+            item, error = self._buffer.get()
+            if item is not _DONE:
+                return item
+            if error is not None:
+                self.close()
+                raise error
+            self._running -= 1
+            if self._running == 0:
+                self._finished = True
+        raise StopIteration
+
+    def close(self):
+        self._finished = True
+        self._stop.set()
+
+
+class ListingStream:
+    """Lazy iterator over crawled listings that remembers the first ``keep`` IDs it produced.
+
+    Use it as a context manager so an abandoned crawl releases its browser.
+    """
+
+    def __init__(self, listings, keep=20, on_close=None):
+        self._listings = iter(listings)
+        self._on_close = on_close
+        self.keep = keep
+        self.head_ids = []
+        self._lock = threading.Lock()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        # Workers of process_concurrently() pull from the same stream.
+        with self._lock:
+            listing = next(self._listings)
+            if len(self.head_ids) < self.keep:
+                self.head_ids.append(listing["id"])
+            return listing
+
+    def close(self):
+        close = getattr(self._listings, "close", None)
+        if close is not None:
+            close()
+        if self._on_close is not None:
+            self._on_close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
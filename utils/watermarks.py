@@ -0,0 +1,79 @@
+# utils/watermarks.py
+
+import json
+import os
+import threading
+from datetime import datetime
+from loguru import logger
+
+DEFAULT_PATH = "user_data/watermarks.json"
+DEFAULT_SIZE = 20
+
+
+class WatermarkStore:
+    """Newest listing IDs seen per (platform, query), persisted as JSON.
+
+    Searches sorted by date list new postings first, so a crawl can stop as soon
+    as it reaches listings that headed the previous run's results. Several IDs
+    are kept rather than one, because pinned or promoted listings and removed
+    postings would otherwise make a single-ID watermark unreliable.
+    """
+
+    def __init__(self, path=DEFAULT_PATH, size=DEFAULT_SIZE):
+        self.path = path
+        self.size = size
+        self._marks = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                self._marks = json.load(file)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable watermarks in {self.path}: {e}")
+            self._marks = {}
+
+    @staticmethod
+    def _key(platform, query):
+        return f"{platform}|{query}"
+
+    def get(self, platform, query) -> frozenset:
+        """Return the listing IDs at the head of the last completed crawl for this query."""
+        with self._lock:
+            mark = self._marks.get(self._key(platform, query), {})
+        return frozenset(mark.get("job_ids", ()))
+
+    def update(self, platform, query, job_ids):
+        """Put the newest ``job_ids`` (in result order) in front of this query's watermark."""
+        job_ids = [job_id for job_id in job_ids if job_id]
+        if not job_ids:
+            return
+        key = self._key(platform, query)
+        with self._lock:
+            previous = self._marks.get(key, {}).get("job_ids", [])
+            merged = list(dict.fromkeys(job_ids + previous))[:self.size]
+            self._marks[key] = {
+                "job_ids": merged,
+                "updated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            }
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(self._marks, file, indent=2, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_watermarks(path=DEFAULT_PATH) -> WatermarkStore:
+    """Return the process-wide watermark store, loading it on first use."""
+    global _store
+    with _store_lock:
+        if _store is None or _store.path != path:
+            _store = WatermarkStore(path)
+        return _store